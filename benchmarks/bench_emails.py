@@ -0,0 +1,83 @@
+"""
+Benchmark the cost of rendering emails.
+
+Compares rendering each email on its own, looking up the current Site and the
+templates for every email, with rendering a batch of emails with one
+`model_reviews.emails.EmailRenderer`.  A test database is created for the Site
+lookups, so this needs the same database as the tests.  Run from the root of the
+repository:
+
+    python benchmarks/bench_emails.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa  # pylint: disable=wrong-import-position
+
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.contrib.sites.models import Site  # noqa
+from django.db import connection  # noqa
+from django.template.loader import render_to_string  # noqa
+from django.test.utils import (  # noqa
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from model_reviews.emails import EmailRenderer  # noqa
+
+NUMBER = 2000
+# the number of emails rendered with each renderer
+BATCH = 20
+DATA = {
+    "name": "Bob Munro",
+    "email": "bob@example.com",
+    "subject": "New Request For Approval",
+    "message": "There has been a new request that needs your attention.",
+}
+
+
+def render_uncached():
+    """Render an email by looking up each template by path."""
+    context = {
+        "name": DATA["name"],
+        "subject": DATA["subject"],
+        "message": DATA["message"],
+        "object": None,
+        "SITE": Site.objects.get_current(),
+    }
+    render_to_string("model_reviews/email/generic_email_subject.txt", context)
+    render_to_string("model_reviews/email/generic_email_body.txt", context)
+    render_to_string("model_reviews/email/generic_email_body.html", context)
+
+
+def render_batch():
+    """Render a batch of emails with one renderer."""
+    renderer = EmailRenderer()
+    for _ in range(0, BATCH):
+        renderer.get_message(**DATA)
+
+
+def main():
+    """Run the benchmark."""
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        results = {
+            "render_to_string": timeit.timeit(render_uncached, number=NUMBER),
+            "EmailRenderer": timeit.timeit(render_batch, number=NUMBER // BATCH),
+        }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+    for name, total in results.items():
+        print(f"{name:>20}: {total / NUMBER * 1e6:8.1f} us per email")
+
+
+if __name__ == "__main__":
+    main()
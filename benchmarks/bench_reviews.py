@@ -0,0 +1,103 @@
+"""
+Benchmark performing many reviews at once.
+
+Compares saving a `PerformReview` form for each review with
+`model_reviews.utils.perform_bulk_review`.  A test database is created for the
+benchmark, so this needs the same database as the tests.  Run from the root of
+the repository:
+
+    python benchmarks/bench_reviews.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "tests.settings")
+
+import django  # noqa  # pylint: disable=wrong-import-position
+
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.contrib.auth.models import User  # noqa
+from django.db import connection  # noqa
+from django.test.utils import (  # noqa
+    CaptureQueriesContext,
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+from model_reviews.forms import PerformReview  # noqa
+from model_reviews.models import ModelReview, Reviewer  # noqa
+from model_reviews.utils import perform_bulk_review  # noqa
+from tests.test_app.models import TestModel  # noqa
+
+NUMBER = 200
+
+
+def make_reviewers(user: User):
+    """Make objects pending review, and a reviewer for each of them."""
+    objs = TestModel.objects.bulk_create_with_reviews(
+        [TestModel(name=f"Test {i}") for i in range(0, NUMBER)], reviewers=[]
+    )
+    reviews = list(ModelReview.objects.filter(object_id__in=[obj.pk for obj in objs]))
+    Reviewer.objects.bulk_create(
+        [Reviewer(user=user, review=review) for review in reviews]
+    )
+    # bulk_create does not count the reviewers, see ModelReview.reviewer_count
+    ModelReview.objects.filter(
+        pk__in=[review.pk for review in reviews]
+    ).recount_reviewers()
+    # fetch the reviewers, not all databases return the primary keys of bulk inserts
+    return list(Reviewer.objects.filter(review__in=reviews).order_by("pk"))
+
+
+def perform_forms(reviewers):
+    """Save a PerformReview form for each reviewer."""
+    for reviewer in reviewers:
+        form = PerformReview(
+            data={
+                "review": reviewer.review_id,
+                "reviewer": reviewer.pk,
+                "review_status": ModelReview.APPROVED,
+            }
+        )
+        form.is_valid()
+        form.save()
+
+
+def perform_bulk(reviewers):
+    """Perform all the reviews at once."""
+    perform_bulk_review((reviewer, ModelReview.APPROVED) for reviewer in reviewers)
+
+
+def main():
+    """Run the benchmark."""
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        user = User.objects.create(username="reviewer")
+        for name, func in (("PerformReview", perform_forms), ("bulk", perform_bulk)):
+            reviewers = make_reviewers(user)
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                func(reviewers)
+                total = time.perf_counter() - start
+            approved = ModelReview.objects.filter(
+                pk__in=[reviewer.review_id for reviewer in reviewers],
+                review_status=ModelReview.APPROVED,
+            ).count()
+            if approved != NUMBER:
+                raise RuntimeError(f"{name} approved {approved} of {NUMBER} reviews")
+            print(
+                f"{name:>15}: {total * 1e3:8.1f} ms, "
+                f"{len(queries):5} queries for {NUMBER} reviews"
+            )
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,8 +16,14 @@ class ModelReviewsConfig(AppConfig):
         # pylint: disable=import-outside-toplevel,unused-import
         from django.conf import settings
         import model_reviews.settings as defaults
+        from model_reviews.hooks import validate_setting_hooks
         import model_reviews.signals  # noqa
 
         for name in dir(defaults):
             if name.isupper() and not hasattr(settings, name):
                 setattr(settings, name, getattr(defaults, name))
+
+        # connect the moderation signals to the models that need them
+        model_reviews.signals.register_approvable_models()
+        # make sure that the hook functions set in settings exist
+        validate_setting_hooks()
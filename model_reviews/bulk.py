@@ -0,0 +1,267 @@
+"""Bulk helpers and querysets module for model_reviews."""
+from typing import Iterable, List, Optional, Tuple, Type
+
+from django.apps import apps
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, models, transaction
+from django.utils import timezone
+
+from model_reviews.constants import (
+    BULK_REQUEST_FOR_REVIEW_FUNCTION,
+    REQUEST_FOR_REVIEW_FUNCTION,
+)
+from model_reviews.hooks import get_hook, resolve_hook
+from model_reviews.sandbox import get_sandbox_backend
+from model_reviews.sandbox_models import SandboxRevision
+
+
+def bulk_create(  # pylint: disable=bad-continuation
+    queryset: models.QuerySet,
+    objs: Iterable[models.Model],
+    batch_size: Optional[int] = None,
+    key_fields: Tuple[str, ...] = (),
+) -> List[models.Model]:
+    """
+    Create objects in bulk and set their primary keys.
+
+    Some databases (e.g. SQLite and MySQL) do not return the primary keys of the
+    rows that `bulk_create` inserts, and the created objects are needed to link
+    reviews and reviewers to them.  On those databases the primary keys are read
+    back with one more query by the attnames in `key_fields`, which should be
+    unique for the new rows (the newest row is used otherwise), the first one
+    being the most selective.  Objects without `key_fields` are inserted one by
+    one instead, without sending any signals, just like `bulk_create`.
+    """
+    features = connections[queryset.db].features
+    if getattr(
+        features,
+        "can_return_rows_from_bulk_insert",
+        # Django < 3.0
+        getattr(features, "can_return_ids_from_bulk_insert", False),
+    ):
+        return queryset.bulk_create(objs, batch_size=batch_size)
+    objs = list(objs)
+    if key_fields:
+        queryset.bulk_create(objs, batch_size=batch_size)
+        pks = {
+            tuple(row[1:]): row[0]
+            for row in queryset.filter(
+                **{
+                    f"{key_fields[0]}__in": {
+                        getattr(obj, key_fields[0]) for obj in objs
+                    }
+                }
+            )
+            .order_by("pk")
+            .values_list("pk", *key_fields)
+        }
+    for obj in objs:
+        if key_fields:
+            obj.pk = pks[tuple(getattr(obj, name) for name in key_fields)]
+        else:
+            # this is the part of `save` that inserts the row, without the signals
+            obj._save_table(  # pylint: disable=protected-access
+                cls=obj._meta.concrete_model, force_insert=True, using=queryset.db
+            )
+        obj._state.adding = False  # pylint: disable=protected-access
+        obj._state.db = queryset.db  # pylint: disable=protected-access
+    return objs
+
+
+def save_sandboxes(reviews: Iterable[models.Model]) -> None:
+    """
+    Save the unsaved changes to the sandboxes of saved reviews.
+
+    The changes are saved by the sandbox backend, and the revisions that record
+    them are created with one query.
+    """
+    reviews = list(reviews)
+    get_sandbox_backend().save_sandboxes(reviews)
+    revisions = []
+    for review in reviews:
+        # pylint: disable=protected-access
+        if review._unsaved_revisions:
+            for revision in review._unsaved_revisions:
+                # the review may have been saved after the revision was made
+                revision.review = review
+                revisions.append(revision)
+            review._unsaved_revisions = None
+    if revisions:
+        SandboxRevision.objects.bulk_create(revisions)
+
+
+def send_requests_for_review(  # pylint: disable=bad-continuation
+    model: Type[models.Model], reviewers: List[models.Model]
+) -> None:
+    """
+    Send a request for review to each of many new reviewers of a model's objects.
+
+    When the request_for_review_function of the model is the default one, the
+    emails are rendered once for each review and delivered together, see
+    `model_reviews.emails.send_requests_for_review`.  Otherwise the function is
+    run for each reviewer.
+    """
+    request_for_review = get_hook(model, "request_for_review_function")
+    if request_for_review is None:
+        return
+    if request_for_review.path == REQUEST_FOR_REVIEW_FUNCTION:
+        resolve_hook(BULK_REQUEST_FOR_REVIEW_FUNCTION)(reviewers)
+    else:
+        for reviewer in reviewers:
+            reviewer.send_request_for_review()
+
+
+class ReviewableQuerySet(models.QuerySet):
+    """
+    QuerySet for approvable models.
+
+    `bulk_create` and `update` do not send the signals that put changes under
+    review, so this QuerySet provides bulk alternatives that do.
+    """
+
+    def bulk_create_with_reviews(  # pylint: disable=bad-continuation
+        self,
+        objs: Iterable[models.Model],
+        batch_size: Optional[int] = None,
+        reviewers: Optional[Iterable[models.Model]] = None,
+    ) -> List[models.Model]:
+        """
+        Create approvable objects and their ModelReview objects in bulk.
+
+        The set_user_function of the model is run for each review in memory
+        before the reviews are created.  On databases that do not return the
+        primary keys of bulk inserts (e.g. SQLite and MySQL), the objects are
+        inserted with one query each.
+
+        Args:
+            objs: the approvable objects to create
+            batch_size: how many objects are created in a single query
+            reviewers: users who will be added as reviewers of every created
+                review.  When not provided, the set_reviewers_function of the model
+                is run for each created review instead.
+
+        Returns:
+            The created objects.
+        """
+        review_model = apps.get_model("model_reviews", "ModelReview")
+        reviewer_model = apps.get_model("model_reviews", "Reviewer")
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            objs = bulk_create(self, objs, batch_size=batch_size)
+            obj_type = ContentType.objects.db_manager(self.db).get_for_model(
+                self.model
+            )
+            set_user_function = get_hook(self.model, "set_user_function")
+            if reviewers is not None:
+                reviewers = list(reviewers)
+            reviews = []
+            for obj in objs:
+                obj.set_saved_monitored_values()
+                review = review_model(content_type=obj_type, object_id=obj.pk)
+                if reviewers:
+                    # the reviewers are created in bulk below, without signals
+                    review.reviewer_count = len(reviewers)
+                    review.min_level = review.max_level = reviewer_model().level
+                # reuse the created object instead of fetching it again
+                review.content_object = obj
+                review.update_sandbox(
+                    source=obj,
+                    do_save=False,
+                    saved_values=obj.get_saved_monitored_values(),
+                )
+                if set_user_function:
+                    set_user_function(review_obj=review)
+                reviews.append(review)
+            bulk_create(
+                review_model.objects.using(self.db),
+                reviews,
+                batch_size=batch_size,
+                key_fields=("object_id", "content_type_id"),
+            )
+            save_sandboxes(reviews)
+
+            if reviewers is None:
+                set_reviewers_function = get_hook(self.model, "set_reviewers_function")
+                if set_reviewers_function:
+                    for review in reviews:
+                        set_reviewers_function(review_obj=review)
+            else:
+                reviewer_objs = bulk_create(
+                    reviewer_model.objects.using(self.db),
+                    [
+                        reviewer_model(user=user, review=review)
+                        for review in reviews
+                        for user in reviewers
+                    ],
+                    batch_size=batch_size,
+                    key_fields=("review_id", "user_id"),
+                )
+                for reviewer in reviewer_objs:
+                    reviewer.set_count_state()
+                send_requests_for_review(self.model, reviewer_objs)
+
+        return objs
+
+    def update_with_reviews(self, **kwargs) -> int:
+        """
+        Update the objects in the QuerySet while keeping changes under review.
+
+        Values of monitored fields are written to the sandboxes of the objects
+        that are pending review instead of the objects themselves, just like
+        saving the objects one by one would do.  All other values are updated
+        directly.
+
+        Returns:
+            The number of objects updated.
+        """
+        review_model = apps.get_model("model_reviews", "ModelReview")
+
+        monitored_fields = set(self.model.monitored_fields)
+        monitored_values = {
+            key: value for key, value in kwargs.items() if key in monitored_fields
+        }
+        if not monitored_values:
+            return self.update(**kwargs)
+        for key, value in monitored_values.items():
+            if hasattr(value, "resolve_expression"):
+                raise ValueError(
+                    f"Cannot put the expression used to update {key} under review."
+                )
+        other_values = {
+            key: value for key, value in kwargs.items() if key not in monitored_fields
+        }
+
+        with transaction.atomic(using=self.db, savepoint=False):
+            obj_type = ContentType.objects.db_manager(self.db).get_for_model(
+                self.model
+            )
+            sandbox_backend = get_sandbox_backend()
+            pending_reviews = list(
+                sandbox_backend.load_sandboxes(
+                    review_model.objects.using(self.db).filter(
+                        content_type=obj_type,
+                        object_id__in=self.values("pk"),
+                        review_status=review_model.PENDING,
+                    )
+                )
+            )
+            now = timezone.now()
+            for review in pending_reviews:
+                review.add_to_sandbox(monitored_values)
+                review.modified = now
+            review_model.objects.using(self.db).bulk_update(
+                pending_reviews, review_model.get_sandbox_update_fields()
+            )
+            save_sandboxes(pending_reviews)
+
+            pending_ids = {review.object_id for review in pending_reviews}
+            count = self.exclude(pk__in=pending_ids).update(**kwargs)
+            if other_values:
+                count += self.filter(pk__in=pending_ids).update(**other_values)
+            else:
+                count += len(pending_ids)
+
+        return count
+
+
+ReviewableManager = models.Manager.from_queryset(ReviewableQuerySet)
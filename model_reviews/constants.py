@@ -1,6 +1,7 @@
 """Constants module."""
 USER = "user"
 SANDBOX_FIELD = "_sandbox"
+SANDBOX_PROPOSED_FIELD = "_proposed"
 REVIEW_REQUEST_EMAIL_TXT = "There has been a new request that needs your attention."
 REVIEW_REQUEST_EMAIL_SUBJ = "New Request For Approval"
 REVIEW_COMPLETE_EMAIL_TXT = (
@@ -9,6 +10,8 @@ REVIEW_COMPLETE_EMAIL_TXT = (
 REVIEW_COMPLETE_EMAIL_SUBJ = "Your request has been processed"
 EMAIL_TEMPLATE = "generic"
 EMAIL_TEMPLATE_PATH = "model_reviews/email"
+REQUEST_FOR_REVIEW_FUNCTION = "model_reviews.emails.send_single_request_for_review"
+BULK_REQUEST_FOR_REVIEW_FUNCTION = "model_reviews.emails.send_requests_for_review"
 REVIEW_FORM_SUCCESS_MSG = "Saved successfully. :)"
 REVIEW_FORM_FAIL_MSG = "Please correct the errors on the form."
 REVIEW_FORMSET_SUCCESS_MSG = REVIEW_FORM_SUCCESS_MSG
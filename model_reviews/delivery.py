@@ -0,0 +1,116 @@
+"""Delivery module for model_reviews emails."""
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.signals import setting_changed
+from django.db import transaction
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+
+def send_messages(messages: List[EmailMessage]) -> int:
+    """Send email messages over a single connection."""
+    connection = get_connection(fail_silently=True)
+    return connection.send_messages(messages) or 0
+
+
+class BaseDeliveryBackend:
+    """
+    Base class for email delivery backends.
+
+    Delivery backends decide when and how the emails sent by model_reviews are
+    handed over to Django's email backend.
+    """
+
+    def deliver(self, messages: List[EmailMessage]) -> int:
+        """
+        Deliver email messages.
+
+        Returns:
+            The number of messages that were sent or queued for sending.
+        """
+        raise NotImplementedError
+
+
+class InlineBackend(BaseDeliveryBackend):
+    """Send email messages right away, in the current thread."""
+
+    def deliver(self, messages: List[EmailMessage]) -> int:
+        """Deliver email messages."""
+        return send_messages(messages)
+
+
+class ThreadPoolBackend(BaseDeliveryBackend):
+    """
+    Send email messages in a thread pool.
+
+    The messages are sent after the current transaction is committed, and they
+    are dropped if it is rolled back.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """Initialize the backend."""
+        self.max_workers = max_workers or settings.MODELREVIEW_EMAIL_THREAD_POOL_SIZE
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used to send messages."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="model_reviews"
+            )
+        return self._executor
+
+    def deliver(self, messages: List[EmailMessage]) -> int:
+        """Deliver email messages."""
+        messages = list(messages)
+        transaction.on_commit(lambda: self.executor.submit(send_messages, messages))
+        return len(messages)
+
+
+class OutboxBackend(BaseDeliveryBackend):
+    """
+    Store email messages in the database to be sent by a worker.
+
+    The messages are saved in the current transaction, so they are only sent if
+    it is committed.  Run the `send_review_emails` management command to send
+    them.
+    """
+
+    def deliver(self, messages: List[EmailMessage]) -> int:
+        """Deliver email messages."""
+        # pylint: disable=import-outside-toplevel
+        from model_reviews.models import OutboxEmail
+
+        return len(
+            OutboxEmail.objects.bulk_create(
+                [OutboxEmail.from_message(message) for message in messages]
+            )
+        )
+
+
+@lru_cache(maxsize=None)
+def get_delivery_backend() -> BaseDeliveryBackend:
+    """Get the configured email delivery backend."""
+    return import_string(settings.MODELREVIEW_EMAIL_DELIVERY_BACKEND)()
+
+
+def deliver(messages: List[EmailMessage]) -> int:
+    """Deliver email messages using the configured delivery backend."""
+    return get_delivery_backend().deliver(messages)
+
+
+@receiver(setting_changed)
+def reset_delivery_backend(  # pylint: disable=bad-continuation
+    sender, setting, **kwargs
+):  # pylint: disable=unused-argument
+    """Reset the cached delivery backend when its settings change."""
+    if setting in (
+        "MODELREVIEW_EMAIL_DELIVERY_BACKEND",
+        "MODELREVIEW_EMAIL_THREAD_POOL_SIZE",
+    ):
+        get_delivery_backend.cache_clear()
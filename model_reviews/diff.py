@@ -0,0 +1,131 @@
+"""diff module for model_reviews."""
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type
+
+from django.core.exceptions import FieldDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+# the types that are stored in JSON as they are
+JSON_TYPES = (str, int, float, bool, type(None), list, dict)
+# fields whose values are changed when they are stored in JSON
+ENCODED_FIELDS = (
+    models.DateField,  # includes DateTimeField
+    models.TimeField,
+    models.DecimalField,
+    models.DurationField,
+    models.UUIDField,
+)
+
+_ENCODER = DjangoJSONEncoder()
+_MISSING = object()
+
+
+def to_json_value(value: Any) -> Any:
+    """
+    Get the value that is loaded back after a value is stored in JSON.
+
+    This is how `DjangoJSONEncoder` serializes the value, e.g. datetimes become
+    ISO 8601 strings with millisecond precision.
+    """
+    if isinstance(value, JSON_TYPES):
+        return value
+    try:
+        return _ENCODER.default(value)
+    except TypeError:
+        return value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+class MonitoredField(NamedTuple):
+    """A monitored field, and how to compare its values."""
+
+    name: str
+    # the field, or None if the monitored name is not a field
+    field: Optional[models.Field]
+    # turns both live and sandbox values into comparable values
+    normalize: Callable[[Any], Any]
+
+
+class DiffPlan:
+    """
+    The monitored fields of an approvable model, worked out once.
+
+    Values are compared in the form they have after being stored in the JSON
+    sandbox, so that a live value and the same value loaded from the sandbox
+    (e.g. a datetime and its ISO 8601 string) are not different.
+    """
+
+    __slots__ = ("fields", "db_fields")
+
+    def __init__(self, fields: Tuple[MonitoredField, ...]):
+        """Initialize the plan."""
+        self.fields = fields
+        self.db_fields: Tuple[models.Field, ...] = tuple(
+            item.field
+            for item in fields
+            if item.field is not None and item.field.concrete
+        )
+
+    def get_values(self, source: models.Model) -> Dict[str, Any]:
+        """Get the values of the monitored fields that the source has."""
+        values = {}
+        for item in self.fields:
+            value = getattr(source, item.name, _MISSING)
+            if value is not _MISSING:
+                values[item.name] = value
+        return values
+
+    def load_values(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get the values of the monitored fields that are in the sandbox.
+
+        Values that were changed when they were stored in JSON are turned back
+        into the types of their fields, e.g. ISO 8601 strings become datetimes.
+        """
+        values = {}
+        for item in self.fields:
+            if item.name in data:
+                value = data[item.name]
+                if isinstance(item.field, ENCODED_FIELDS):
+                    value = item.field.to_python(value)
+                values[item.name] = value
+        return values
+
+    def get_diff(self, source: models.Model, data: Dict[str, Any]) -> List[str]:
+        """Get the names of the monitored fields that differ from the sandbox."""
+        diff = []
+        for item in self.fields:
+            if item.name in data:
+                normalize = item.normalize
+                if normalize(data[item.name]) != normalize(getattr(source, item.name)):
+                    diff.append(item.name)
+        return diff
+
+
+@lru_cache(maxsize=None)
+def _get_diff_plan(model: Type[models.Model], names: Tuple[str, ...]) -> DiffPlan:
+    fields = []
+    for name in names:
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or isinstance(field, ENCODED_FIELDS):
+            normalize = to_json_value
+        else:
+            normalize = _identity
+        fields.append(MonitoredField(name=name, field=field, normalize=normalize))
+    return DiffPlan(tuple(fields))
+
+
+def get_diff_plan(source: Any) -> DiffPlan:
+    """
+    Get the diff plan of an approvable model.
+
+    :param source: the approvable model, or an instance of it
+    """
+    return _get_diff_plan(source._meta.model, tuple(source.monitored_fields))
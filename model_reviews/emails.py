@@ -1,13 +1,21 @@
 """Emails module for model_review."""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
 from django.conf import settings
 from django.contrib.auth.models import User
 from django.contrib.sites.models import Site
 from django.core.mail import EmailMultiAlternatives
-from django.template.loader import render_to_string
+from django.template.backends.django import Template
+from django.template.loader import get_template
+from django.utils.html import conditional_escape
 
 from model_reviews.constants import EMAIL_TEMPLATE, EMAIL_TEMPLATE_PATH
+from model_reviews.delivery import deliver
 from model_reviews.models import ModelReview, Reviewer
 
+# used in place of the name of the recipient when rendering an email for many
+NAME_PLACEHOLDER = "modelreviewsrecipientname"
+
 
 def get_display_name(user: User):
     """Get display name from user object."""
@@ -17,7 +25,163 @@ def get_display_name(user: User):
     return user.username
 
 
-def send_email(  # pylint: disable=too-many-arguments,too-many-locals,bad-continuation
+class EmailTemplates(NamedTuple):
+    """The compiled templates of an email."""
+
+    subject: Template
+    text_body: Template
+    html_body: Template
+
+
+def get_email_templates(template_path: str, template: str) -> EmailTemplates:
+    """Get the compiled templates of an email."""
+    return EmailTemplates(
+        subject=get_template(f"{template_path}/{template}_email_subject.txt"),
+        text_body=get_template(f"{template_path}/{template}_email_body.txt"),
+        html_body=get_template(f"{template_path}/{template}_email_body.html"),
+    )
+
+
+class EmailRenderer:
+    """
+    Render the emails sent by model_reviews.
+
+    The current Site and the compiled templates are looked up once per renderer,
+    so use one renderer for each batch of emails.
+    """
+
+    def __init__(self, site: Optional[Site] = None):
+        """Initialize the renderer."""
+        self._site = site
+        self._templates: Dict[Tuple[str, str], EmailTemplates] = {}
+
+    @property
+    def site(self) -> Site:
+        """Get the current site."""
+        if self._site is None:
+            self._site = Site.objects.get_current()
+        return self._site
+
+    def get_templates(self, template_path: str, template: str) -> EmailTemplates:
+        """Get the compiled templates of an email."""
+        key = (template_path, template)
+        if key not in self._templates:
+            self._templates[key] = get_email_templates(template_path, template)
+        return self._templates[key]
+
+    def _render(  # pylint: disable=too-many-arguments,bad-continuation
+        self,
+        name: str,
+        subject: str,
+        message: str,
+        obj: object,
+        template: str,
+        template_path: str,
+    ) -> Tuple[str, str, str]:
+        """Render the subject, text body and html body of an email."""
+        context = {
+            "name": name,
+            "subject": subject,
+            "message": message,
+            "object": obj,
+            "SITE": self.site,
+        }
+        templates = self.get_templates(template_path, template)
+        return (
+            templates.subject.render(context).replace("\n", ""),
+            templates.text_body.render(context),
+            templates.html_body.render(context).replace("\n", ""),
+        )
+
+    @staticmethod
+    def _build_message(  # pylint: disable=bad-continuation
+        name: str, email: str, parts: Tuple[str, str, str], cc_list: list = None
+    ) -> EmailMultiAlternatives:
+        """Build an email message out of its rendered parts."""
+        email_subject, email_txt_body, email_html_body = parts
+        from_email = settings.DEFAULT_FROM_EMAIL
+        to_email = f"{name} <{email}>"
+        msg = EmailMultiAlternatives(
+            email_subject, email_txt_body, from_email, [to_email]
+        )
+        if cc_list:
+            msg.cc = cc_list
+        msg.attach_alternative(email_html_body, "text/html")
+        return msg
+
+    def get_message(  # pylint: disable=too-many-arguments,bad-continuation
+        self,
+        name: str,
+        email: str,
+        subject: str,
+        message: str,
+        obj: object = None,
+        cc_list: list = None,
+        template: str = EMAIL_TEMPLATE,
+        template_path: str = EMAIL_TEMPLATE_PATH,
+    ) -> EmailMultiAlternatives:
+        """Render an email message, see `send_email` for the arguments."""
+        parts = self._render(
+            name=name,
+            subject=subject,
+            message=message,
+            obj=obj,
+            template=template,
+            template_path=template_path,
+        )
+        return self._build_message(name, email, parts, cc_list)
+
+    def get_messages(  # pylint: disable=too-many-arguments,bad-continuation
+        self,
+        recipients: List[Tuple[str, str]],
+        subject: str,
+        message: str,
+        obj: object = None,
+        cc_list: list = None,
+        template: str = EMAIL_TEMPLATE,
+        template_path: str = EMAIL_TEMPLATE_PATH,
+    ) -> List[EmailMultiAlternatives]:
+        """
+        Render the same email message for many recipients.
+
+        The email is rendered once with a placeholder in place of the name of the
+        recipient, and the placeholder is then replaced for each recipient.  The
+        result is checked against a normal render for the first recipient, and
+        if they differ (e.g. the template transforms the name) every message is
+        rendered separately.
+
+        :param recipients: a list of (name, email) tuples
+        """
+        if not recipients:
+            return []
+        kwargs = {
+            "subject": subject,
+            "message": message,
+            "obj": obj,
+            "template": template,
+            "template_path": template_path,
+        }
+        shared_parts = self._render(name=NAME_PLACEHOLDER, **kwargs)
+
+        def personalize(name: str) -> Tuple[str, str, str]:
+            escaped_name = conditional_escape(name)
+            return tuple(  # type: ignore
+                part.replace(NAME_PLACEHOLDER, escaped_name) for part in shared_parts
+            )
+
+        first_name = recipients[0][0]
+        if personalize(first_name) != self._render(name=first_name, **kwargs):
+            return [
+                self.get_message(name=name, email=email, cc_list=cc_list, **kwargs)
+                for name, email in recipients
+            ]
+        return [
+            self._build_message(name, email, personalize(name), cc_list)
+            for name, email in recipients
+        ]
+
+
+def send_email(  # pylint: disable=too-many-arguments,bad-continuation
     name: str,
     email: str,
     subject: str,
@@ -26,6 +190,7 @@ def send_email(  # pylint: disable=too-many-arguments,too-many-locals,bad-contin
     cc_list: list = None,
     template: str = EMAIL_TEMPLATE,
     template_path: str = EMAIL_TEMPLATE_PATH,
+    renderer: Optional[EmailRenderer] = None,
 ):
     """
     Send a generic email.
@@ -37,42 +202,91 @@ def send_email(  # pylint: disable=too-many-arguments,too-many-locals,bad-contin
     :param obj: the object in question
     :param cc_list: the list of email address to "CC"
     :param template: the template to use
+    :param template_path: the path to the template to use
+    :param renderer: the renderer to use, share one when sending many emails
+
+    The email is handed over to the delivery backend set in
+    MODELREVIEW_EMAIL_DELIVERY_BACKEND.
     """
-    context = {
-        "name": name,
-        "subject": subject,
-        "message": message,
-        "object": obj,
-        "SITE": Site.objects.get_current(),
-    }
-    email_subject = render_to_string(
-        f"{template_path}/{template}_email_subject.txt", context
-    ).replace("\n", "")
-    email_txt_body = render_to_string(
-        f"{template_path}/{template}_email_body.txt", context
+    renderer = renderer or EmailRenderer()
+    msg = renderer.get_message(
+        name=name,
+        email=email,
+        subject=subject,
+        message=message,
+        obj=obj,
+        cc_list=cc_list,
+        template=template,
+        template_path=template_path,
     )
-    email_html_body = render_to_string(
-        f"{template_path}/{template}_email_body.html", context
-    ).replace("\n", "")
+    return deliver([msg])
+
 
-    subject = email_subject
-    from_email = settings.DEFAULT_FROM_EMAIL
-    to_email = f"{name} <{email}>"
-    text_content = email_txt_body
-    html_content = email_html_body
-    msg = EmailMultiAlternatives(subject, text_content, from_email, [to_email])
-    if cc_list:
-        msg.cc = cc_list
-    msg.attach_alternative(html_content, "text/html")
+def send_request_for_review(review_obj: ModelReview):
+    """
+    Send email requesting a review to all the reviewers who have not reviewed.
 
-    return msg.send(fail_silently=True)
+    The email is rendered once and personalized for each reviewer, and all the
+    emails are delivered together.
+    """
+    reviewers = Reviewer.objects.filter(
+        review=review_obj, reviewed=False
+    ).select_related("user")
+    recipients = [
+        (get_display_name(reviewer.user), reviewer.user.email)
+        for reviewer in reviewers
+        if reviewer.user.email
+    ]
+    source = review_obj.content_object
+    if not recipients or not source:
+        return 0
+    messages = EmailRenderer().get_messages(
+        recipients=recipients,
+        subject=source.review_request_email_subject,
+        message=source.review_request_email_body,
+        obj=review_obj,
+        cc_list=None,
+        template=source.email_template,
+        template_path=source.email_template_path,
+    )
+    return deliver(messages)
 
 
-def send_request_for_review(review_obj: ModelReview):
-    """Send email requesting a review."""
-    reviewers = Reviewer.objects.filter(review=review_obj, reviewed=False)
+def send_requests_for_review(reviewers: Iterable[Reviewer]) -> int:
+    """
+    Send email requesting a review to each of many new reviewers.
+
+    This sends the same emails as `send_single_request_for_review` does for each
+    reviewer, but the email of each review is rendered once and personalized for
+    its reviewers, and all the emails are delivered together.
+    """
+    recipients: Dict[int, List[Tuple[str, str]]] = {}
+    reviews: Dict[int, ModelReview] = {}
     for reviewer in reviewers:
-        send_single_request_for_review(reviewer)
+        if reviewer.user.email:
+            reviews.setdefault(reviewer.review_id, reviewer.review)
+            recipients.setdefault(reviewer.review_id, []).append(
+                (get_display_name(reviewer.user), reviewer.user.email)
+            )
+    renderer = EmailRenderer()
+    messages: List[EmailMultiAlternatives] = []
+    for review_id, review in reviews.items():
+        source = review.content_object
+        if source:
+            messages.extend(
+                renderer.get_messages(
+                    recipients=recipients[review_id],
+                    subject=source.review_request_email_subject,
+                    message=source.review_request_email_body,
+                    obj=review,
+                    cc_list=None,
+                    template=source.email_template,
+                    template_path=source.email_template_path,
+                )
+            )
+    if not messages:
+        return 0
+    return deliver(messages)
 
 
 def send_single_request_for_review(reviewer: Reviewer):
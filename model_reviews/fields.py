@@ -0,0 +1,22 @@
+"""fields module for model_reviews."""
+from django.core.serializers.json import DjangoJSONEncoder
+
+__all__ = ["CompactJSONEncoder", "JSONField"]
+
+try:
+    # Django 3.1+ has a JSONField that works on all the supported databases
+    from django.db.models import JSONField
+except ImportError:  # pragma: no cover
+    from django.contrib.postgres.fields import JSONField  # noqa
+
+
+class CompactJSONEncoder(DjangoJSONEncoder):
+    """
+    JSON encoder that does not put whitespace between items.
+
+    Databases that store JSON as text (e.g. SQLite and MySQL) keep the encoded
+    string as it is, so this makes the stored sandboxes smaller.
+    """
+
+    item_separator = ","
+    key_separator = ":"
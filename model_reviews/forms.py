@@ -1,4 +1,7 @@
 """forms module for model_reviews."""
+from functools import partial
+from typing import Callable, Optional
+
 from django import forms
 from django.conf import settings
 from django.contrib.auth.models import User
@@ -32,11 +35,11 @@ class PerformReview(forms.Form):
 
     def __init__(self, *args, **kwargs):
         """Initialize the form."""
-        super().__init__(*args, **kwargs)
         self.request = kwargs.pop("request", None)
         self.vega_extra_kwargs = kwargs.pop(
             getattr(settings, "VEGA_MODELFORM_KWARG", "vega_extra_kwargs"), dict()
         )
+        super().__init__(*args, **kwargs)
 
     def clean_review_status(self):
         """Clean review_status."""
@@ -58,43 +61,75 @@ class PerformReview(forms.Form):
             reviewer.review_status = data["review_status"]
             reviewer.save()
             # perform the review
-            perform_review(review=review)
-
-
-def get_review_form(review: ModelReview, user: User):
-    """Get review form for a particular review object."""
-    review_qs = ModelReview.objects.filter(id=review.id)
-    reviewer_qs = Reviewer.objects.filter(review=review)
-    initial_reviewer = None
-    if not user.is_anonymous:
-        reviewer_qs = reviewer_qs.filter(user=user)
-        first_reviewer = reviewer_qs.first()
-        if first_reviewer:
-            initial_reviewer = first_reviewer.pk
-
-    return type(
-        "PerformReviewForm",
-        (PerformReview,),
-        {
-            "review": forms.ModelChoiceField(
-                initial=review_qs.first().pk,
-                queryset=review_qs,
-                widget=forms.HiddenInput,
-                required=True,
-                error_messages={
-                    "invalid_choice": REVIEW_FORM_WRONG_REVIEW_MSG,
-                    "required": REVIEW_FORM_WRONG_REVIEW_MSG,
-                },
-            ),
-            "reviewer": forms.ModelChoiceField(
-                queryset=reviewer_qs,
-                initial=initial_reviewer,
-                widget=forms.HiddenInput,
-                required=True,
-                error_messages={
-                    "invalid_choice": REVIEW_FORM_WRONG_REVIEWER_MSG,
-                    "required": REVIEW_FORM_WRONG_REVIEWER_MSG,
-                },
-            ),
+            perform_review(review=review, reviewer=reviewer)
+
+
+class PerformReviewForm(PerformReview):
+    """
+    PerformReview form for a particular review.
+
+    The review, and the reviewer that performs it, are passed in when the form is
+    initialized so that the same form class can be used for all reviews.
+    """
+
+    review = forms.ModelChoiceField(
+        queryset=ModelReview.objects.none(),
+        widget=forms.HiddenInput,
+        required=True,
+        error_messages={
+            "invalid_choice": REVIEW_FORM_WRONG_REVIEW_MSG,
+            "required": REVIEW_FORM_WRONG_REVIEW_MSG,
+        },
+    )
+    reviewer = forms.ModelChoiceField(
+        queryset=Reviewer.objects.none(),
+        widget=forms.HiddenInput,
+        required=True,
+        error_messages={
+            "invalid_choice": REVIEW_FORM_WRONG_REVIEWER_MSG,
+            "required": REVIEW_FORM_WRONG_REVIEWER_MSG,
         },
     )
+
+    def __init__(  # pylint: disable=bad-continuation
+        self,
+        *args,
+        review: ModelReview,
+        user: User,
+        reviewer: Optional[Reviewer] = None,
+        **kwargs,
+    ):
+        """
+        Initialize the form.
+
+        :param review: the review object
+        :param user: the user performing the review
+        :param reviewer: the user's Reviewer object for the review, if already known
+        """
+        super().__init__(*args, **kwargs)
+        reviewer_qs = Reviewer.objects.filter(review=review)
+        initial_reviewer = None
+        if not user.is_anonymous:
+            reviewer_qs = reviewer_qs.filter(user=user)
+            if reviewer is None:
+                reviewer = reviewer_qs.first()
+            if reviewer:
+                initial_reviewer = reviewer.pk
+
+        self.fields["review"].queryset = ModelReview.objects.filter(id=review.id)
+        self.fields["review"].initial = review.pk
+        self.fields["reviewer"].queryset = reviewer_qs
+        self.fields["reviewer"].initial = initial_reviewer
+
+
+def get_review_form(  # pylint: disable=bad-continuation
+    review: ModelReview, user: User, reviewer: Optional[Reviewer] = None
+) -> Callable[..., PerformReviewForm]:
+    """
+    Get review form for a particular review object.
+
+    :param review: the review object
+    :param user: the user performing the review
+    :param reviewer: the user's Reviewer object for the review, if already known
+    """
+    return partial(PerformReviewForm, review=review, user=user, reviewer=reviewer)
@@ -1,12 +1,12 @@
 """formset module for model_reviews."""
-from typing import List, Optional, Union
+from typing import Callable, Dict, List, Optional, Union
 
 from django.contrib.auth.models import User
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, QuerySet, prefetch_related_objects
 from django.forms import BaseFormSet, Form
 
 from model_reviews.forms import PerformReview, get_review_form
-from model_reviews.models import ModelReview
+from model_reviews.models import ModelReview, Reviewer
 
 
 class ModelReviewFormSet(BaseFormSet):
@@ -18,7 +18,7 @@ class ModelReviewFormSet(BaseFormSet):
     """
 
     def __init__(  # pylint: disable=keyword-arg-before-vararg,bad-continuation
-        self, form_list: Optional[List[PerformReview]] = None, *args, **kwargs
+        self, form_list: Optional[List[Callable[..., Form]]] = None, *args, **kwargs
     ):
         """
         Initialize.
@@ -26,7 +26,7 @@ class ModelReviewFormSet(BaseFormSet):
         The only thing that we want to do here is add "form_list" as a kwarg
         """
         # self.form_list is from model_review_formset_factory
-        self.form_list: List[PerformReview] = form_list or self.form_list or []
+        self.form_list: List[Callable[..., Form]] = form_list or self.form_list or []
         super().__init__(*args, **kwargs)
 
     def _construct_form(self, i, **kwargs):
@@ -74,7 +74,7 @@ class ModelReviewFormSet(BaseFormSet):
 
 def model_review_formset_factory(  # pylint: disable=bad-continuation,too-many-arguments
     form,
-    form_list: List[PerformReview],
+    form_list: List[Callable[..., Form]],
     formset=ModelReviewFormSet,
     extra=1,
     can_order=False,
@@ -105,6 +105,23 @@ def model_review_formset_factory(  # pylint: disable=bad-continuation,too-many-a
     return type(form.__name__ + "FormSet", (formset,), attrs)
 
 
+def get_pending_reviews(user: User) -> QuerySet:
+    """
+    Get the reviews that are pending a review by the user.
+
+    The reviewers are checked using an EXISTS subquery instead of a join, so each
+    review is returned once no matter how many rows match.
+    """
+    if user.is_anonymous:
+        return ModelReview.objects.none()
+    # annotate first, because filtering on an Exists expression needs Django 3.0
+    return ModelReview.objects.annotate(
+        is_reviewer=Exists(
+            Reviewer.objects.filter(review=OuterRef("pk"), user=user).order_by()
+        )
+    ).filter(is_reviewer=True, review_status=ModelReview.PENDING)
+
+
 def get_review_formset(  # pylint: disable=bad-continuation
     user: User,
     queryset: Optional[Union[QuerySet, List[ModelReview]]] = None,
@@ -114,28 +131,36 @@ def get_review_formset(  # pylint: disable=bad-continuation
     """
     Get a formset of review forms.
 
-    This is useful for doing bulk reviews.
+    This is useful for doing bulk reviews.  The reviews and the user's Reviewer
+    objects are loaded with a constant number of queries.
     """
     if queryset is None:
-        try:
-            queryset = ModelReview.objects.filter(
-                reviewer__user=user, review_status=ModelReview.PENDING
-            )
-        except TypeError:
-            # this most likely means that the user is AnonymousUser
-            queryset = ModelReview.objects.none()
-
-    review_forms: List[PerformReview] = []
-    for item in queryset:
-        review_form = get_review_form(review=item, user=user)
+        queryset = get_pending_reviews(user=user)
+
+    reviews = list(queryset)
+    prefetch_related_objects(reviews, "content_object")
+
+    # get the user's Reviewer objects for all the reviews at once
+    reviewers: Dict[int, Reviewer] = {}
+    if reviews and not user.is_anonymous:
+        reviewers = {
+            reviewer.review_id: reviewer
+            for reviewer in Reviewer.objects.filter(user=user, review__in=reviews)
+        }
+
+    review_forms: List[Callable[..., Form]] = []
+    for item in reviews:
+        review_form = get_review_form(
+            review=item, user=user, reviewer=reviewers.get(item.pk)
+        )
         review_forms.append(review_form)
 
     ReviewFormSet = model_review_formset_factory(
         form=form_class,
         form_list=review_forms,
         formset=formset_class,
-        extra=queryset.count(),
-        max_num=queryset.count(),
+        extra=len(reviews),
+        max_num=len(reviews),
     )
 
     return ReviewFormSet
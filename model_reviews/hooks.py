@@ -0,0 +1,138 @@
+"""Hooks module for model_reviews."""
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+# options of approvable models that hold the dotted path to a hook function
+MODEL_HOOKS = (
+    "side_effect_function",
+    "set_reviewers_function",
+    "set_user_function",
+    "request_for_review_function",
+    "review_complete_notify_function",
+    "get_next_reviewers_function",
+)
+# settings that hold the dotted path to a hook function
+SETTING_HOOKS = (
+    "MODELREVIEW_PROCESS_REVIEW_FUNCTION",
+    "MODELREVIEW_PROCESS_AFTER_SAVE_FUNCTION",
+)
+
+
+class Hook:
+    """
+    A hook function resolved from its dotted path.
+
+    The module of the function is imported once, but the function is looked up on
+    the module each time the hook is called, so that replacing it (e.g. with
+    `unittest.mock.patch`) keeps working.
+    """
+
+    __slots__ = ("path", "module", "name")
+
+    def __init__(self, path: str, module: ModuleType, name: str):
+        """Initialize the hook."""
+        self.path = path
+        self.module = module
+        self.name = name
+
+    def __repr__(self):
+        """Representation of Hook."""
+        return f"<Hook: {self.path}>"
+
+    def __call__(self, *args, **kwargs):
+        """Call the hook function."""
+        return getattr(self.module, self.name)(*args, **kwargs)
+
+
+_HOOKS: Dict[str, Hook] = {}
+
+
+def resolve_hook(path: str) -> Hook:
+    """
+    Get the hook function for a dotted path.
+
+    Raises:
+        ImproperlyConfigured: if the path does not point to a callable.
+    """
+    try:
+        return _HOOKS[path]
+    except KeyError:
+        pass
+    try:
+        module_path, name = path.rsplit(".", 1)
+    except (AttributeError, ValueError):
+        raise ImproperlyConfigured(f"{path!r} is not a valid dotted path.")
+    try:
+        module = import_module(module_path)
+    except ImportError as error:
+        raise ImproperlyConfigured(f"Could not import {path!r}: {error}")
+    if not callable(getattr(module, name, None)):
+        raise ImproperlyConfigured(f"{path!r} is not a callable.")
+    hook = _HOOKS[path] = Hook(path=path, module=module, name=name)
+    return hook
+
+
+def get_hook(obj: Any, option: str) -> Optional[Hook]:
+    """
+    Get the hook function set in an option of an approvable model or object.
+
+    Returns:
+        The hook function, or `None` if the option is not set.
+    """
+    path = getattr(obj, option)
+    if not path:
+        return None
+    return resolve_hook(path)
+
+
+def get_setting_hook(setting: str) -> Hook:
+    """Get the hook function set in a setting."""
+    return resolve_hook(getattr(settings, setting))
+
+
+def validate_model_hooks(model: Any) -> None:
+    """
+    Resolve all the hook functions of an approvable model.
+
+    Raises:
+        ImproperlyConfigured: if any of the hook functions can not be resolved.
+    """
+    for option in MODEL_HOOKS:
+        try:
+            get_hook(model, option)
+        except ImproperlyConfigured as error:
+            raise ImproperlyConfigured(
+                f"{model._meta.label}.{option} is not valid. {error}"
+            )
+
+
+def validate_setting_hooks() -> None:
+    """
+    Resolve all the hook functions set in settings.
+
+    Raises:
+        ImproperlyConfigured: if any of the hook functions can not be resolved.
+    """
+    for setting in SETTING_HOOKS:
+        try:
+            get_setting_hook(setting)
+        except ImproperlyConfigured as error:
+            raise ImproperlyConfigured(f"{setting} is not valid. {error}")
+
+
+def clear_hooks_cache() -> None:
+    """Clear the cache of resolved hook functions."""
+    _HOOKS.clear()
+
+
+@receiver(setting_changed)
+def reset_hooks(sender, setting, **kwargs):  # pylint: disable=unused-argument
+    """Clear the cache of resolved hook functions when hook settings change."""
+    if setting in SETTING_HOOKS:
+        clear_hooks_cache()
@@ -0,0 +1,25 @@
+"""compact_review_revisions management command."""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from model_reviews.models import ModelReview
+
+
+class Command(BaseCommand):
+    """Merge the old revisions of the sandboxes of reviews."""
+
+    help = "Merge the old revisions of the sandboxes of reviews."
+
+    def add_arguments(self, parser):
+        """Add arguments."""
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=settings.MODELREVIEW_SANDBOX_REVISIONS_KEEP,
+            help="The number of latest revisions of each review that are kept.",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        deleted = ModelReview.objects.all().compact_revisions(keep=options["keep"])
+        self.stdout.write(f"Merged {deleted} revision(s).")
@@ -0,0 +1,93 @@
+"""send_review_emails management command."""
+from typing import List
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from model_reviews.models import OutboxEmail
+
+
+def send_outbox_batch(  # pylint: disable=bad-continuation
+    batch_size: int, max_attempts: int, after_pk: int = 0
+) -> List[OutboxEmail]:
+    """
+    Send one batch of emails from the outbox.
+
+    The emails are locked while they are being sent so that more than one worker
+    can run at the same time.  All emails in the batch are sent over a single
+    connection.
+
+    Returns:
+        The emails in the batch.
+    """
+    with transaction.atomic():
+        emails: List[OutboxEmail] = list(
+            OutboxEmail.objects.select_for_update(skip_locked=True)
+            .filter(sent=None, attempts__lt=max_attempts, pk__gt=after_pk)
+            .order_by("pk")[:batch_size]
+        )
+        if not emails:
+            return emails
+
+        connection = get_connection()
+        connection.open()
+        try:
+            for email in emails:
+                email.attempts += 1
+                try:
+                    connection.send_messages([email.get_message()])
+                except Exception as error:  # pylint: disable=broad-except
+                    email.last_error = str(error)
+                else:
+                    email.sent = timezone.now()
+                    email.last_error = ""
+        finally:
+            connection.close()
+
+        OutboxEmail.objects.bulk_update(emails, ["attempts", "sent", "last_error"])
+    return emails
+
+
+class Command(BaseCommand):
+    """Send the emails waiting in the model_reviews outbox."""
+
+    help = "Send the emails waiting in the model_reviews outbox."
+
+    def add_arguments(self, parser):
+        """Add arguments."""
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.MODELREVIEW_EMAIL_BATCH_SIZE,
+            help="The number of emails sent over each connection.",
+        )
+        parser.add_argument(
+            "--max-attempts",
+            type=int,
+            default=settings.MODELREVIEW_EMAIL_MAX_ATTEMPTS,
+            help="Emails that failed this many times are not sent again.",
+        )
+
+    def handle(self, *args, **options):
+        """Handle the command."""
+        sent = failed = 0
+        after_pk = 0
+        while True:
+            emails = send_outbox_batch(
+                batch_size=options["batch_size"],
+                max_attempts=options["max_attempts"],
+                after_pk=after_pk,
+            )
+            if not emails:
+                break
+            # failed emails are retried the next time the command runs
+            after_pk = emails[-1].pk
+            for email in emails:
+                if email.sent:
+                    sent += 1
+                else:
+                    failed += 1
+        self.stdout.write(f"Sent {sent} email(s), {failed} failed.")
@@ -1,11 +1,12 @@
 # Generated by Django 3.0.5 on 2020-05-30 17:05
 # pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
-import django.contrib.postgres.fields.jsonb
 import django.core.serializers.json
 import django.db.models.deletion
 from django.conf import settings
 from django.db import migrations, models
 
+import model_reviews.fields
+
 
 class Migration(migrations.Migration):
 
@@ -66,7 +67,7 @@ class Migration(migrations.Migration):
                 ),
                 (
                     "data",
-                    django.contrib.postgres.fields.jsonb.JSONField(
+                    model_reviews.fields.JSONField(
                         default=dict,
                         encoder=django.core.serializers.json.DjangoJSONEncoder,
                         verbose_name="Data",
@@ -0,0 +1,87 @@
+# Generated by Django 3.1.14 on 2026-10-17 20:32
+# pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
+from django.db import migrations, models
+
+import model_reviews.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("model_reviews", "0002_auto_20200918_2141"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboxEmail",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created"),
+                ),
+                (
+                    "sent",
+                    models.DateTimeField(
+                        blank=True,
+                        db_index=True,
+                        default=None,
+                        null=True,
+                        verbose_name="Sent",
+                    ),
+                ),
+                (
+                    "attempts",
+                    models.PositiveSmallIntegerField(
+                        default=0, verbose_name="Attempts"
+                    ),
+                ),
+                (
+                    "last_error",
+                    models.TextField(
+                        blank=True, default="", verbose_name="Last Error"
+                    ),
+                ),
+                ("subject", models.TextField(verbose_name="Subject")),
+                ("body", models.TextField(verbose_name="Body")),
+                (
+                    "html_body",
+                    models.TextField(blank=True, default="", verbose_name="HTML Body"),
+                ),
+                (
+                    "from_email",
+                    models.CharField(max_length=255, verbose_name="From Email"),
+                ),
+                (
+                    "to",
+                    model_reviews.fields.JSONField(
+                        blank=True, default=list, verbose_name="To"
+                    ),
+                ),
+                (
+                    "cc",
+                    model_reviews.fields.JSONField(
+                        blank=True, default=list, verbose_name="CC"
+                    ),
+                ),
+                (
+                    "bcc",
+                    model_reviews.fields.JSONField(
+                        blank=True, default=list, verbose_name="BCC"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Outbox Email",
+                "verbose_name_plural": "Outbox Emails",
+            },
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 3.1.14 on 2026-10-17 20:43
+# pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+APPROVED = "1"
+REJECTED = "2"
+
+
+def count_reviewers(apps, schema_editor):
+    """Fill in the reviewer counters of existing reviews."""
+    ModelReview = apps.get_model("model_reviews", "ModelReview")
+    Reviewer = apps.get_model("model_reviews", "Reviewer")
+    db_alias = schema_editor.connection.alias
+
+    reviewers = Reviewer.objects.using(db_alias).filter(review=OuterRef("pk")).order_by()
+    max_level = Subquery(
+        Reviewer.objects.using(db_alias)
+        .filter(review=OuterRef(OuterRef("pk")))
+        .order_by("-level")
+        .values("level")[:1]
+    )
+
+    def count(queryset):
+        return Coalesce(
+            Subquery(
+                queryset.values("review").annotate(count=Count("pk")).values("count")
+            ),
+            0,
+        )
+
+    ModelReview.objects.using(db_alias).update(
+        reviewer_count=count(reviewers),
+        reviewed_count=count(reviewers.filter(reviewed=True)),
+        approved_count=count(reviewers.filter(reviewed=True, review_status=APPROVED)),
+        rejected_count=count(reviewers.filter(reviewed=True, review_status=REJECTED)),
+        min_level=Subquery(reviewers.order_by("level").values("level")[:1]),
+        max_level=Subquery(reviewers.order_by("-level").values("level")[:1]),
+        top_level_reviewed_count=count(
+            reviewers.filter(reviewed=True, level=max_level)
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("model_reviews", "0003_outboxemail"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="modelreview",
+            name="approved_count",
+            field=models.IntegerField(blank=True, default=0, verbose_name="Approved"),
+        ),
+        migrations.AddField(
+            model_name="modelreview",
+            name="max_level",
+            field=models.IntegerField(
+                blank=True, default=None, null=True, verbose_name="Highest Level"
+            ),
+        ),
+        migrations.AddField(
+            model_name="modelreview",
+            name="min_level",
+            field=models.IntegerField(
+                blank=True, default=None, null=True, verbose_name="Lowest Level"
+            ),
+        ),
+        migrations.AddField(
+            model_name="modelreview",
+            name="rejected_count",
+            field=models.IntegerField(blank=True, default=0, verbose_name="Rejected"),
+        ),
+        migrations.AddField(
+            model_name="modelreview",
+            name="reviewed_count",
+            field=models.IntegerField(blank=True, default=0, verbose_name="Reviewed"),
+        ),
+        migrations.AddField(
+            model_name="modelreview",
+            name="reviewer_count",
+            field=models.IntegerField(blank=True, default=0, verbose_name="Reviewers"),
+        ),
+        migrations.AddField(
+            model_name="modelreview",
+            name="top_level_reviewed_count",
+            field=models.IntegerField(
+                blank=True,
+                default=0,
+                help_text="The number of reviewers at the highest level who have reviewed",
+                verbose_name="Reviewed At Highest Level",
+            ),
+        ),
+        migrations.RunPython(count_reviewers, migrations.RunPython.noop),
+    ]
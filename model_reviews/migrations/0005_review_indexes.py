@@ -0,0 +1,29 @@
+# Generated by Django 3.1.14 on 2026-10-17 20:44
+# pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("model_reviews", "0004_modelreview_reviewer_counts"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="modelreview",
+            index=models.Index(
+                condition=models.Q(review_status="3"),
+                fields=["created", "id"],
+                name="modelreview_pending_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="reviewer",
+            index=models.Index(
+                condition=models.Q(reviewed=True),
+                fields=["review", "level", "-review_date"],
+                name="reviewer_decision_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 3.1.14 on 2026-10-17 20:51
+# pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
+from django.db import migrations
+
+import model_reviews.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("model_reviews", "0005_review_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="modelreview",
+            name="data",
+            field=model_reviews.fields.JSONField(
+                default=dict,
+                encoder=model_reviews.fields.CompactJSONEncoder,
+                verbose_name="Data",
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 3.1.14 on 2026-10-17 20:56
+# pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
+import django.db.models.deletion
+from django.db import migrations, models
+
+import model_reviews.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("model_reviews", "0006_modelreview_data_encoder"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SandboxField",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "field_name",
+                    models.CharField(max_length=255, verbose_name="Field Name"),
+                ),
+                (
+                    "old_value",
+                    model_reviews.fields.JSONField(
+                        blank=True,
+                        default=None,
+                        encoder=model_reviews.fields.CompactJSONEncoder,
+                        null=True,
+                        verbose_name="Old Value",
+                    ),
+                ),
+                (
+                    "new_value",
+                    model_reviews.fields.JSONField(
+                        blank=True,
+                        default=None,
+                        encoder=model_reviews.fields.CompactJSONEncoder,
+                        null=True,
+                        verbose_name="New Value",
+                    ),
+                ),
+                (
+                    "review",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="sandbox_fields",
+                        to="model_reviews.modelreview",
+                        verbose_name="Model Review",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Sandbox Field",
+                "verbose_name_plural": "Sandbox Fields",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="sandboxfield",
+            index=models.Index(
+                fields=["field_name", "review"], name="sandboxfield_field_idx"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="sandboxfield", unique_together={("review", "field_name")},
+        ),
+    ]
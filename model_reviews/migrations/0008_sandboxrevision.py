@@ -0,0 +1,73 @@
+# Generated by Django 3.1.14 on 2026-10-17 20:59
+# pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
+import django.db.models.deletion
+from django.db import migrations, models
+
+import model_reviews.fields
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("model_reviews", "0007_sandboxfield"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="modelreview",
+            name="revision",
+            field=models.PositiveIntegerField(
+                blank=True,
+                default=0,
+                help_text="The number of times that the sandbox was changed",
+                verbose_name="Revision",
+            ),
+        ),
+        migrations.CreateModel(
+            name="SandboxRevision",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.PositiveIntegerField(verbose_name="Number")),
+                (
+                    "created",
+                    models.DateTimeField(auto_now_add=True, verbose_name="Created"),
+                ),
+                (
+                    "changes",
+                    model_reviews.fields.JSONField(
+                        blank=True,
+                        default=dict,
+                        encoder=model_reviews.fields.CompactJSONEncoder,
+                        verbose_name="Changes",
+                    ),
+                ),
+                (
+                    "review",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="revisions",
+                        to="model_reviews.modelreview",
+                        verbose_name="Model Review",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Sandbox Revision",
+                "verbose_name_plural": "Sandbox Revisions",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="sandboxrevision",
+            index=models.Index(
+                fields=["review", "number"], name="sandboxrevision_number_idx"
+            ),
+        ),
+    ]
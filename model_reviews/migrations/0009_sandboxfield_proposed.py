@@ -0,0 +1,22 @@
+# Generated by Django 3.1.14 on 2026-10-17 21:17
+# pylint: disable=invalid-name,missing-module-docstring,missing-class-docstring
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("model_reviews", "0008_sandboxrevision"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sandboxfield",
+            name="proposed",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether the new value is a change to the old value",
+                verbose_name="Proposed",
+            ),
+        ),
+    ]
@@ -1,27 +1,52 @@
 """Models module for model reviews."""
 
-from typing import List, Optional
+from copy import deepcopy
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
-from django.contrib.postgres.fields import JSONField
-from django.core.serializers.json import DjangoJSONEncoder
-from django.db import models
-from django.utils.module_loading import import_string
+from django.db import models, transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from model_reviews.bulk import ReviewableManager, save_sandboxes
 from model_reviews.constants import (
     EMAIL_TEMPLATE,
     EMAIL_TEMPLATE_PATH,
+    REQUEST_FOR_REVIEW_FUNCTION,
     REVIEW_COMPLETE_EMAIL_SUBJ,
     REVIEW_COMPLETE_EMAIL_TXT,
     REVIEW_REQUEST_EMAIL_SUBJ,
     REVIEW_REQUEST_EMAIL_TXT,
-    SANDBOX_FIELD,
+)
+from model_reviews.diff import get_diff_plan
+from model_reviews.fields import CompactJSONEncoder, JSONField
+from model_reviews.hooks import get_hook
+from model_reviews.outbox import (  # noqa: F401  # pylint: disable=unused-import
+    OutboxEmail,
+)
+from model_reviews.sandbox import get_sandbox_backend
+from model_reviews.sandbox_models import (  # noqa: F401  # pylint: disable=unused-import
+    SandboxField,
+    SandboxRevision,
 )
 
 USER = settings.AUTH_USER_MODEL
+# the fields of ModelReview that count its reviewers
+REVIEWER_COUNT_FIELDS = (
+    "reviewer_count",
+    "reviewed_count",
+    "approved_count",
+    "rejected_count",
+    "min_level",
+    "max_level",
+    "top_level_reviewed_count",
+)
 
 
 class BaseReview(models.Model):
@@ -55,6 +80,11 @@ class BaseReview(models.Model):
         abstract = True
 
 
+def _in_update_fields(field: models.Field, update_fields: Iterable[str]) -> bool:
+    """Check if a field is in the update_fields passed to `save`."""
+    return field.name in update_fields or field.attname in update_fields
+
+
 class AbstractReview(BaseReview):
     """Model definition for AbstractReview."""
 
@@ -68,9 +98,7 @@ class AbstractReview(BaseReview):
     # path to function that will be used to determine the user for a review object
     set_user_function: Optional[str] = "model_reviews.side_effects.set_review_user"
     # path to function that will be used to send email to reviewers
-    request_for_review_function: Optional[
-        str
-    ] = "model_reviews.emails.send_single_request_for_review"
+    request_for_review_function: Optional[str] = REQUEST_FOR_REVIEW_FUNCTION
     # path to function that will be used to send email to user after review
     review_complete_notify_function: Optional[
         str
@@ -88,23 +116,128 @@ class AbstractReview(BaseReview):
     # model fields
     review_reason = models.TextField(_("Review Reason"), blank=True, default="")
 
+    objects = ReviewableManager()
+
+    # the saved values of the monitored fields keyed by attname, if known
+    _saved_monitored_values: Optional[Dict[str, Any]] = None
+
     class Meta:
         """Meta definition for AbstractReview."""
 
         abstract = True
 
-    def revert(self) -> bool:
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Create an instance from the database and remember its monitored values."""
+        instance = super().from_db(db, field_names, values)
+        instance.set_saved_monitored_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        """Reload fields from the database and remember the reloaded values."""
+        super().refresh_from_db(using=using, fields=fields)
+        self.set_saved_monitored_values(update_fields=fields)
+
+    def set_saved_monitored_values(  # pylint: disable=bad-continuation
+        self, update_fields: Optional[Iterable[str]] = None
+    ) -> None:
+        """
+        Remember the current values of the monitored fields as the saved values.
+
+        Args:
+            update_fields: only remember the values of these fields.  Values of
+                deferred fields are never remembered.
+        """
+        deferred = self.get_deferred_fields()
+        saved_values = dict(self._saved_monitored_values or {})
+        for field in get_diff_plan(self).db_fields:
+            if field.attname in deferred:
+                saved_values.pop(field.attname, None)
+            elif update_fields is None or _in_update_fields(field, update_fields):
+                saved_values[field.attname] = deepcopy(getattr(self, field.attname))
+        self._saved_monitored_values = saved_values
+
+    def get_saved_monitored_values(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the saved values of the monitored fields, keyed by attname.
+
+        Returns:
+            The saved values, or `None` if the saved values of any of the monitored
+            fields are not known.
+        """
+        saved_values = self._saved_monitored_values or {}
+        values = {}
+        for field in get_diff_plan(self).db_fields:
+            if field.attname not in saved_values:
+                return None
+            values[field.attname] = deepcopy(saved_values[field.attname])
+        return values
+
+    def get_dirty_monitored_fields(  # pylint: disable=bad-continuation
+        self, update_fields: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Get the monitored fields that may have changed since they were saved.
+
+        This is answered in memory, without querying the database.  The saved
+        values are known for instances that were loaded from the database or
+        saved, fields whose saved values are not known are treated as changed.
+
+        Args:
+            update_fields: only check these fields, as passed to `save`.
+
+        Returns:
+            The attnames of the changed fields.
+        """
+        saved_values = self._saved_monitored_values or {}
+        dirty = []
+        for field in get_diff_plan(self).db_fields:
+            if update_fields is not None and not _in_update_fields(
+                field, update_fields
+            ):
+                continue
+            if (
+                field.attname not in saved_values
+                or saved_values[field.attname] != getattr(self, field.attname)
+            ):
+                dirty.append(field.attname)
+        return dirty
+
+    @classmethod
+    def get_monitored_db_fields(cls) -> List[models.Field]:
+        """Return the monitored fields that are stored in the database."""
+        return list(get_diff_plan(cls).db_fields)
+
+    def revert(
+        self, values: Optional[Dict[str, Any]] = None, fields: Optional[List[str]] = None
+    ) -> bool:
         """
         Revert the instance to its last saved state.
 
         This method deletes unsaved changes on source model instance.
 
+        Args:
+            values: the last saved values keyed by field attname.  When provided,
+                only these fields are restored and the database is not queried.
+            fields: the attnames of the fields to revert.  All fields are reverted
+                by default.  If these are monitored fields whose saved values are
+                known, they are restored without querying the database, otherwise
+                they are reloaded from the database.
+
         Returns:
             `True` if revert was possible, `False` otherwise.
         """
+        if values is None and fields is not None:
+            saved_values = self._saved_monitored_values or {}
+            if all(attname in saved_values for attname in fields):
+                values = {attname: deepcopy(saved_values[attname]) for attname in fields}
+        if values is not None:
+            for attname, value in values.items():
+                setattr(self, attname, value)
+            return True
         model = self._meta.model
         try:
-            self.refresh_from_db()
+            self.refresh_from_db(fields=fields)
             return True
         except model.DoesNotExist:
             return False
@@ -116,13 +249,162 @@ class AbstractReview(BaseReview):
         This method runs the side effect function defined on the approvable model.
         The side effect is run once after an approval/rejection.
         """
-        if self.side_effect_function:
-            side_effect = import_string(self.side_effect_function)
+        side_effect = get_hook(self, "side_effect_function")
+        if side_effect:
             side_effect(review_obj=review_obj)
 
 
+class ModelReviewQuerySet(models.QuerySet):
+    """QuerySet for ModelReview."""
+
+    def add_reviewer_counts(  # pylint: disable=bad-continuation,too-many-arguments
+        self,
+        level: int,
+        reviewers: int = 0,
+        reviewed: int = 0,
+        approved: int = 0,
+        rejected: int = 0,
+    ) -> int:
+        """
+        Add to the reviewer counters of the reviews in the QuerySet.
+
+        The counters are updated with F() expressions, in a single query.
+
+        Args:
+            level: the level of the reviewers that are counted
+            reviewers: the number of reviewers added
+            reviewed: the number of reviewers that have reviewed added
+            approved: the number of reviewers that have approved added
+            rejected: the number of reviewers that have rejected added
+
+        Returns:
+            The number of reviews updated.
+        """
+        top_level_reviewed_count = [
+            When(max_level=level, then=F("top_level_reviewed_count") + reviewed)
+        ]
+        values = {
+            "reviewed_count": F("reviewed_count") + reviewed,
+            "approved_count": F("approved_count") + approved,
+            "rejected_count": F("rejected_count") + rejected,
+        }
+        if reviewers:
+            new_max_level = Q(max_level__isnull=True) | Q(max_level__lt=level)
+            new_min_level = Q(min_level__isnull=True) | Q(min_level__gt=level)
+            # the reviewers were added at a new highest level
+            top_level_reviewed_count.insert(
+                0, When(new_max_level, then=Value(reviewed))
+            )
+            values.update(
+                reviewer_count=F("reviewer_count") + reviewers,
+                max_level=Case(
+                    When(new_max_level, then=Value(level)), default=F("max_level")
+                ),
+                min_level=Case(
+                    When(new_min_level, then=Value(level)), default=F("min_level")
+                ),
+            )
+        values["top_level_reviewed_count"] = Case(
+            *top_level_reviewed_count, default=F("top_level_reviewed_count")
+        )
+        return self.update(**values)
+
+    def filter_sandbox_field(self, name: str) -> "ModelReviewQuerySet":
+        """Filter reviews whose sandbox has a value for a monitored field."""
+        return get_sandbox_backend().filter_field(self, name)
+
+    def compact_revisions(self, keep: int) -> int:
+        """
+        Merge the old revisions of the reviews in the QuerySet.
+
+        The latest `keep` revisions of each review are left as they are, and the
+        revisions before them are merged into the latest of them, so that every
+        revision that is left can still be put together (see
+        `ModelReview.get_sandbox_version`).
+
+        Returns:
+            The number of revisions deleted.
+        """
+        old_revisions = (
+            SandboxRevision.objects.filter(
+                review__in=self, number__lte=F("review__revision") - keep
+            )
+            .order_by("review_id", "number", "pk")
+            .only("review_id", "changes")
+        )
+        merged = []
+        merged_pks: List[int] = []
+        for _review_id, group in groupby(
+            old_revisions.iterator(), key=attrgetter("review_id")
+        ):
+            revisions = list(group)
+            if len(revisions) < 2:
+                continue
+            last = revisions[-1]
+            changes: Dict[str, Any] = {}
+            for revision in revisions:
+                changes.update(revision.changes)
+            last.changes = changes
+            merged.append(last)
+            merged_pks.extend(revision.pk for revision in revisions[:-1])
+        with transaction.atomic(using=self.db):
+            SandboxRevision.objects.bulk_update(merged, ["changes"], batch_size=1000)
+            SandboxRevision.objects.filter(pk__in=merged_pks).delete()
+        return len(merged_pks)
+
+    def recount_reviewers(self) -> int:
+        """
+        Count the reviewers of the reviews in the QuerySet from scratch.
+
+        The reviewer counters are kept up to date when reviewers are saved or
+        deleted, this is needed after reviewers are changed in other ways (e.g.
+        using `QuerySet.update`).
+
+        Returns:
+            The number of reviews updated.
+        """
+        reviewers = Reviewer.objects.filter(review=OuterRef("pk")).order_by()
+        max_level = Subquery(
+            Reviewer.objects.filter(review=OuterRef(OuterRef("pk")))
+            .order_by("-level")
+            .values("level")[:1]
+        )
+
+        def count(queryset: models.QuerySet) -> Coalesce:
+            return Coalesce(
+                Subquery(
+                    queryset.values("review")
+                    .annotate(count=Count("pk"))
+                    .values("count")
+                ),
+                0,
+            )
+
+        return self.update(
+            reviewer_count=count(reviewers),
+            reviewed_count=count(reviewers.filter(reviewed=True)),
+            approved_count=count(
+                reviewers.filter(reviewed=True, review_status=BaseReview.APPROVED)
+            ),
+            rejected_count=count(
+                reviewers.filter(reviewed=True, review_status=BaseReview.REJECTED)
+            ),
+            min_level=Subquery(reviewers.order_by("level").values("level")[:1]),
+            max_level=Subquery(reviewers.order_by("-level").values("level")[:1]),
+            top_level_reviewed_count=count(
+                reviewers.filter(reviewed=True, level=max_level)
+            ),
+        )
+
+
 class ModelReview(BaseReview):
-    """Model definition for ModelReview."""
+    """
+    Model definition for ModelReview.
+
+    The reviewers of each review are counted in the fields listed in
+    `REVIEWER_COUNT_FIELDS`, so that the progress of a review can be checked
+    without going through its reviewers.
+    """
 
     user = models.ForeignKey(
         USER,
@@ -141,7 +423,7 @@ class ModelReview(BaseReview):
     content_object = GenericForeignKey("content_type", "object_id")
     created = models.DateTimeField(_("Created"), auto_now_add=True)
     modified = models.DateTimeField(_("Modified"), auto_now=True)
-    data = JSONField(_("Data"), encoder=DjangoJSONEncoder, default=dict, blank=False)
+    data = JSONField(_("Data"), encoder=CompactJSONEncoder, default=dict, blank=False)
     reviewers = models.ManyToManyField(
         USER,
         related_name="modelreview_reviewers",
@@ -149,6 +431,37 @@ class ModelReview(BaseReview):
         through="Reviewer",
         through_fields=("review", "user"),
     )
+    reviewer_count = models.IntegerField(_("Reviewers"), default=0, blank=True)
+    reviewed_count = models.IntegerField(_("Reviewed"), default=0, blank=True)
+    approved_count = models.IntegerField(_("Approved"), default=0, blank=True)
+    rejected_count = models.IntegerField(_("Rejected"), default=0, blank=True)
+    min_level = models.IntegerField(
+        _("Lowest Level"), default=None, null=True, blank=True
+    )
+    max_level = models.IntegerField(
+        _("Highest Level"), default=None, null=True, blank=True
+    )
+    top_level_reviewed_count = models.IntegerField(
+        _("Reviewed At Highest Level"),
+        default=0,
+        blank=True,
+        help_text=_("The number of reviewers at the highest level who have reviewed"),
+    )
+    revision = models.PositiveIntegerField(
+        _("Revision"),
+        default=0,
+        blank=True,
+        help_text=_("The number of times that the sandbox was changed"),
+    )
+
+    objects = ModelReviewQuerySet.as_manager()
+
+    # the sandbox rows of the review and the names of the unsaved ones, used by
+    # model_reviews.sandbox.FieldSandboxBackend
+    _sandbox_rows: Optional[Dict[str, "SandboxField"]] = None
+    _sandbox_dirty: Optional[Set[str]] = None
+    # the revisions of the sandbox that are not saved yet
+    _unsaved_revisions: Optional[List["SandboxRevision"]] = None
 
     class Meta:
         """Meta definition for ModelReview."""
@@ -157,12 +470,58 @@ class ModelReview(BaseReview):
         app_label = "model_reviews"
         verbose_name = _("Model Review")
         verbose_name_plural = _("Model Reviews")
-        indexes = [models.Index(fields=["content_type", "object_id"])]
+        indexes = [
+            models.Index(fields=["content_type", "object_id"]),
+            # pages of pending reviews, see model_reviews.pagination
+            models.Index(
+                fields=["created", "id"],
+                name="modelreview_pending_idx",
+                condition=Q(review_status=BaseReview.PENDING),
+            ),
+        ]
 
     def __str__(self):
         """Unicode representation of ModelReview."""
         return f"{self.content_object} review"
 
+    def save(self, *args, **kwargs):  # pylint: disable=signature-differs
+        """Save the review, and the unsaved changes to its sandbox."""
+        super().save(*args, **kwargs)
+        save_sandboxes([self])
+
+    @staticmethod
+    def get_sandbox_update_fields() -> List[str]:
+        """Get the fields of ModelReview that change when its sandbox changes."""
+        return [*get_sandbox_backend().review_fields, "revision", "modified"]
+
+    def get_sandbox(self) -> Dict[str, Any]:
+        """
+        Get the values in the sandbox, keyed by field name.
+
+        Where the sandbox is stored depends on the MODELREVIEW_SANDBOX_BACKEND
+        setting, see `model_reviews.sandbox`.
+        """
+        return get_sandbox_backend().get_sandbox(self)
+
+    def get_proposed_fields(self) -> Set[str]:
+        """
+        Get the names of the fields in the sandbox that are changes.
+
+        The other fields in the sandbox still have the values they had when they
+        were put in the sandbox, so approving the review does not write them.
+        """
+        return get_sandbox_backend().get_proposed_fields(self)
+
+    def clear_proposed_fields(self) -> None:
+        """
+        Mark the changes in the sandbox as saved, and write the sandbox.
+
+        This is done once the changes have been saved to the reviewed object, so
+        that they are not saved to it again, see `model_reviews.utils.apply_review`.
+        """
+        get_sandbox_backend().clear_proposed_fields(self)
+        self.save_sandbox()
+
     def get_diff(self, source: models.Model = None) -> Optional[List[str]]:
         """
         Return the difference between the source data and the data in review model.
@@ -172,44 +531,162 @@ class ModelReview(BaseReview):
 
         """
         source = source or self.content_object
-        data = self.data.get(SANDBOX_FIELD, dict())
-
-        source_data = {
-            field: getattr(source, field) for field in self._get_monitored_fields()
-        }
-
-        return [key for key in data.keys() if data[key] != source_data[key]] or None
-
-    def _get_monitored_fields(self, source: models.Model = None) -> List[str]:
-        """Return the list of monitored field names."""
-        source = source or self.content_object
-        return source.monitored_fields
+        data = self.get_sandbox()
+        return get_diff_plan(source).get_diff(source=source, data=data) or None
 
     def needs_review(self) -> bool:
         """Check if review is needed."""
         return self.review_status == ModelReview.PENDING
 
-    def update_sandbox(self, source: models.Model = None, do_save: bool = True) -> None:
-        """Update fields of the sandbox to reflect the state of the source."""
+    def update_sandbox(  # pylint: disable=bad-continuation
+        self,
+        source: models.Model = None,
+        do_save: bool = True,
+        saved_values: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Update fields of the sandbox to reflect the state of the source.
+
+        Only the fields that are missing from the sandbox or different in the
+        source are updated.  When saving a review that already exists, only the
+        sandbox is written, see `save_sandbox`.
+
+        Args:
+            source: the approvable object, `content_object` by default
+            do_save: whether to save the sandbox
+            saved_values: the saved monitored values of the source keyed by
+                attname, if known.  These are kept with the new values by sandbox
+                backends that store the values that changes replace.
+        """
         source = source or self.content_object
-        fields = self._get_monitored_fields(source=source)
-        values = {key: getattr(source, key) for key in fields if hasattr(source, key)}
-        if self.data.get(SANDBOX_FIELD):
-            self.data[SANDBOX_FIELD].update(values)
-        else:
-            self.data[SANDBOX_FIELD] = values
+        plan = get_diff_plan(source)
+        sandbox = self.get_sandbox()
+        changed = set(plan.get_diff(source=source, data=sandbox))
+        values = {
+            name: value
+            for name, value in plan.get_values(source).items()
+            if name in changed or name not in sandbox
+        }
+        if saved_values is not None:
+            saved_values = {
+                item.name: saved_values[item.field.attname]
+                for item in plan.fields
+                if item.field is not None and item.field.attname in saved_values
+            }
+        self.add_to_sandbox(values, saved_values=saved_values)
         if do_save:
-            self.save()
+            if self.pk is None:
+                self.save()
+            else:
+                self.save_sandbox()
+
+    def add_to_sandbox(  # pylint: disable=bad-continuation
+        self, values: Dict[str, Any], saved_values: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Put values in the sandbox, without saving them.
+
+        The revision of the review goes up, and if the MODELREVIEW_SANDBOX_REVISIONS
+        setting is on, a revision holding the values is added to the revision log.
+
+        Args:
+            values: the new values keyed by field name
+            saved_values: the values that the new values replace, keyed by field
+                name, if known
+        """
+        if not values:
+            return
+        get_sandbox_backend().update_sandbox(self, values, saved_values=saved_values)
+        self.revision += 1
+        if settings.MODELREVIEW_SANDBOX_REVISIONS:
+            if self._unsaved_revisions is None:
+                self._unsaved_revisions = []
+            self._unsaved_revisions.append(
+                SandboxRevision(number=self.revision, changes=dict(values))
+            )
+
+    def get_sandbox_version(self, number: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the values that were in the sandbox at a revision, keyed by field name.
+
+        The values are put together from the changes in the revision log, with a
+        single query.  Revisions that were merged by `compact_revisions` are no
+        longer in the log, and give the values of the revision they were merged
+        into, which is the first revision after them.
+
+        Args:
+            number: the number of the revision, the latest revision by default
+        """
+        revisions = self.revisions.order_by("number", "pk")
+        if number is not None:
+            # a revision that was merged is missing, and its changes are in the
+            # first revision after it
+            merged_into = Subquery(
+                self.revisions.filter(number__gte=number)
+                .order_by("number")
+                .values("number")[:1]
+            )
+            revisions = revisions.filter(
+                Q(number__lte=number) | Q(number__lte=merged_into)
+            )
+        values: Dict[str, Any] = {}
+        for changes in revisions.values_list("changes", flat=True):
+            values.update(changes)
+        return values
+
+    def get_sandbox_values(self, source: models.Model = None) -> Dict[str, Any]:
+        """
+        Get the values of the monitored fields that are in the sandbox.
+
+        The values have the types of their fields, see `DiffPlan.load_values`.
+        """
+        source = source or self.content_object
+        return get_diff_plan(source).load_values(self.get_sandbox())
+
+    def save_sandbox(self, update_fields: Iterable[str] = ()) -> None:
+        """
+        Write the sandbox of the review to the database.
+
+        Only the modified column, the sandbox and `update_fields` are written, and
+        unlike `save` this does not send the signals that run the review hooks
+        (e.g. set_user_function and set_reviewers_function).
+        """
+        self.modified = timezone.now()
+        fields = [*self.get_sandbox_update_fields(), *update_fields]
+        ModelReview.objects.filter(pk=self.pk).update(
+            **{name: getattr(self, name) for name in fields}
+        )
+        save_sandboxes([self])
 
     def send_review_complete_notification(self):
         """Send notification that review is complete."""
         if self.user and not self.needs_review():
-            source = self.content_object
-            if source.review_complete_notify_function:
-                notify_func = import_string(source.review_complete_notify_function)
+            notify_func = get_hook(self.content_object, "review_complete_notify_function")
+            if notify_func:
                 notify_func(review_obj=self)
 
 
+class ReviewerCountState(NamedTuple):
+    """The fields of a reviewer that are counted in the counters of its review."""
+
+    review_id: int
+    level: int
+    reviewed: bool
+    review_status: str
+
+    def get_counts(self) -> Dict[str, int]:
+        """Get how much the reviewer adds to the counters of its review."""
+        return {
+            "reviewed": int(self.reviewed),
+            "approved": int(
+                self.reviewed and self.review_status == BaseReview.APPROVED
+            ),
+            "rejected": int(
+                self.reviewed and self.review_status == BaseReview.REJECTED
+            ),
+        }
+
+
 class Reviewer(BaseReview):
     """Model definition for Reviewer."""
 
@@ -241,16 +718,134 @@ class Reviewer(BaseReview):
         verbose_name = _("Reviewer")
         verbose_name_plural = _("Reviewers")
         unique_together = [["user", "review"]]
+        indexes = [
+            # the decisions of the reviewers of a review, see model_reviews.utils
+            models.Index(
+                fields=["review", "level", "-review_date"],
+                name="reviewer_decision_idx",
+                condition=Q(reviewed=True),
+            ),
+        ]
+
+    # the state of the reviewer when it was last loaded or saved
+    _count_state: Optional[ReviewerCountState] = None
 
     def __str__(self):
         """Unicode representation of Reviewer."""
         return f"{self.user} review for {self.review}"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Create a Reviewer from the database and remember its counted state."""
+        instance = super().from_db(db, field_names, values)
+        instance.set_count_state()
+        return instance
+
+    def set_count_state(self) -> None:
+        """Remember the current state of the fields counted in the review."""
+        self._count_state = self.get_count_state()
+
+    def get_count_state(self) -> Optional[ReviewerCountState]:
+        """
+        Get the fields of the reviewer that are counted in its review.
+
+        Returns:
+            The counted fields, or `None` if any of them is deferred.
+        """
+        if self.get_deferred_fields().intersection(ReviewerCountState._fields):
+            return None
+        return ReviewerCountState(
+            review_id=self.review_id,
+            level=self.level,
+            reviewed=self.reviewed,
+            review_status=self.review_status,
+        )
+
+    @staticmethod
+    def get_count_differences(  # pylint: disable=bad-continuation
+        reviewers: Iterable["Reviewer"], created: bool = False
+    ) -> Tuple[Dict[Tuple[int, int], List[int]], Set[int]]:
+        """
+        Get how the reviewer counters change after reviewers are saved.
+
+        The counted state of each reviewer is compared with the state it had when
+        it was loaded, and is then remembered as its new counted state.
+
+        Args:
+            reviewers: the reviewers that were saved
+            created: whether the reviewers were created
+
+        Returns:
+            The differences keyed by review id and level, in the order of the
+            arguments of `ModelReviewQuerySet.add_reviewer_counts`, and the ids of
+            the reviews that need to be counted from scratch.
+        """
+        differences: Dict[Tuple[int, int], List[int]] = {}
+        recount: Set[int] = set()
+        for reviewer in reviewers:
+            old_state = reviewer._count_state  # pylint: disable=protected-access
+            reviewer.set_count_state()
+            state = reviewer._count_state  # pylint: disable=protected-access
+            if state is None:
+                recount.add(reviewer.review_id)
+                continue
+            counts = state.get_counts()
+            if not created:
+                if old_state is None or old_state[:2] != state[:2]:
+                    recount.add(state.review_id)
+                    if old_state is not None:
+                        recount.add(old_state.review_id)
+                    continue
+                old_counts = old_state.get_counts()
+                counts = {key: counts[key] - old_counts[key] for key in counts}
+            difference = differences.setdefault(
+                (state.review_id, state.level), [0, 0, 0, 0]
+            )
+            difference[0] += int(created)
+            difference[1] += counts["reviewed"]
+            difference[2] += counts["approved"]
+            difference[3] += counts["rejected"]
+        return differences, recount
+
+    @classmethod
+    def update_review_counts(  # pylint: disable=bad-continuation
+        cls, reviewers: Iterable["Reviewer"], created: bool = False
+    ) -> None:
+        """
+        Update the reviewer counters of the reviews after reviewers are saved.
+
+        The counters are updated using the difference between the state of each
+        reviewer when it was loaded and its current state, with one query for
+        each distinct difference, see `get_count_differences`.  Reviews of
+        reviewers whose level or review changed are counted from scratch instead.
+
+        Args:
+            reviewers: the reviewers that were saved
+            created: whether the reviewers were created
+        """
+        differences, recount = cls.get_count_differences(reviewers, created=created)
+
+        # reviews with the same differences are updated together
+        changes: Dict[Tuple[int, ...], Set[int]] = {}
+        for (review_id, level), difference in differences.items():
+            if any(difference):
+                changes.setdefault((level, *difference), set()).add(review_id)
+        for (level, added, reviewed, approved, rejected), review_ids in changes.items():
+            ModelReview.objects.filter(pk__in=review_ids).add_reviewer_counts(
+                level=level,
+                reviewers=added,
+                reviewed=reviewed,
+                approved=approved,
+                rejected=rejected,
+            )
+        if recount:
+            ModelReview.objects.filter(pk__in=recount).recount_reviewers()
+
     def send_request_for_review(self):
         """Send a notification for request to perform review."""
         if self.review.content_object:
-            if self.review.content_object.request_for_review_function:
-                notify_func = import_string(
-                    self.review.content_object.request_for_review_function
-                )
+            notify_func = get_hook(
+                self.review.content_object, "request_for_review_function"
+            )
+            if notify_func:
                 notify_func(self)
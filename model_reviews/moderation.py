@@ -0,0 +1,152 @@
+"""moderation module for model_reviews."""
+import threading
+from contextlib import ContextDecorator, contextmanager
+from typing import Any, FrozenSet, Iterator, Optional, Tuple, Type
+
+from django.db import models
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    # Python 3.6
+    ContextVar = None  # type: ignore
+
+# the models whose moderation is skipped, an empty tuple means all of them
+SkippedModels = Optional[Tuple[Type[models.Model], ...]]
+# the concrete models and primary keys of the objects whose moderation is skipped
+SkippedObjects = Optional[FrozenSet[Tuple[Type[models.Model], Any]]]
+
+
+class _ThreadLocalVar(threading.local):
+    """A stand-in for `ContextVar` that is local to each thread, for Python 3.6."""
+
+    value: Any = None
+
+    def get(self) -> Any:
+        """Get the value."""
+        return self.value
+
+    def set(self, value: Any) -> Any:
+        """Set the value, and return the old value to reset it with."""
+        token = self.value
+        self.value = value
+        return token
+
+    def reset(self, token: Any) -> None:
+        """Reset the value to what it was before it was set."""
+        self.value = token
+
+
+if ContextVar is not None:
+    _SKIPPED: Any = ContextVar("model_reviews_skipped_moderation", default=None)
+    _SKIPPED_OBJECTS: Any = ContextVar(
+        "model_reviews_skipped_object_moderation", default=None
+    )
+else:  # pragma: no cover
+    _SKIPPED = _ThreadLocalVar()
+    _SKIPPED_OBJECTS = _ThreadLocalVar()
+
+
+def is_moderation_skipped(  # pylint: disable=bad-continuation
+    model: Type[models.Model], obj: Optional[models.Model] = None
+) -> bool:
+    """
+    Check if the moderation of an approvable model, or one of its objects, is skipped.
+
+    Args:
+        model: the approvable model
+        obj: the object of the model that is being saved, if any
+    """
+    skipped_objects: SkippedObjects = _SKIPPED_OBJECTS.get()
+    if skipped_objects and obj is not None and obj.pk is not None:
+        if (obj._meta.concrete_model, obj.pk) in skipped_objects:
+            return True
+    skipped = _SKIPPED.get()
+    if skipped is None:
+        return False
+    return not skipped or issubclass(model, skipped)
+
+
+class SkipModeration(ContextDecorator):
+    """Context manager and decorator that skips moderation, see `skip_moderation`."""
+
+    def __init__(self, *models_to_skip: Type[models.Model]):
+        """Initialize the context manager."""
+        self.models = models_to_skip
+        self.token: Any = None
+
+    def _recreate_cm(self):
+        # each call of a decorated function gets its own token
+        return type(self)(*self.models)
+
+    def __enter__(self):
+        """Start skipping moderation."""
+        skipped = _SKIPPED.get()
+        if skipped is None:
+            skipped = self.models
+        elif skipped and self.models:
+            skipped = skipped + self.models
+        else:
+            skipped = ()
+        self.token = _SKIPPED.set(skipped)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stop skipping moderation."""
+        _SKIPPED.reset(self.token)
+        self.token = None
+
+
+def skip_moderation(*models_to_skip: Type[models.Model]) -> SkipModeration:
+    """
+    Skip the moderation of approvable models.
+
+    While moderation is skipped, changes to monitored fields are saved to the
+    objects directly instead of being put under review, and new objects are
+    created without a review.  Moderation is only skipped in the current
+    context (e.g. thread or asyncio task), so other requests are not affected.
+
+    Every save of the skipped models in the current context is affected,
+    including saves made by signal receivers.  Use `skip_object_moderation` to
+    only skip the moderation of some objects.
+
+    This can be used as a context manager or a decorator:
+
+        with skip_moderation(ResearchPaper):
+            paper.save()
+
+        @skip_moderation()
+        def import_papers():
+            ...
+
+    Args:
+        models_to_skip: the approvable models whose moderation is skipped.
+            Moderation of all approvable models is skipped by default.
+    """
+    return SkipModeration(*models_to_skip)
+
+
+@contextmanager
+def skip_object_moderation(*objs: models.Model) -> Iterator[None]:
+    """
+    Skip the moderation of some saved objects.
+
+    Changes to the monitored fields of the objects are saved directly instead of
+    being put under review, see `skip_moderation`.  Unlike skipping the moderation
+    of their models, other objects of the same models (including new ones) are
+    still moderated, e.g. when they are saved by signal receivers.
+
+        with skip_object_moderation(paper):
+            paper.save()
+
+    Args:
+        objs: the objects whose moderation is skipped, they must have been saved
+    """
+    skipped: SkippedObjects = _SKIPPED_OBJECTS.get()
+    token = _SKIPPED_OBJECTS.set(
+        (skipped or frozenset()) | {(obj._meta.concrete_model, obj.pk) for obj in objs}
+    )
+    try:
+        yield
+    finally:
+        _SKIPPED_OBJECTS.reset(token)
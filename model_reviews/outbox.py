@@ -0,0 +1,70 @@
+"""Models module for the outbox of model reviews."""
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from model_reviews.fields import JSONField
+
+
+class OutboxEmail(models.Model):
+    """
+    Model definition for OutboxEmail.
+
+    Emails that are waiting to be sent by the `send_review_emails` command.
+    """
+
+    created = models.DateTimeField(_("Created"), auto_now_add=True)
+    sent = models.DateTimeField(
+        _("Sent"), blank=True, default=None, null=True, db_index=True
+    )
+    attempts = models.PositiveSmallIntegerField(_("Attempts"), default=0)
+    last_error = models.TextField(_("Last Error"), blank=True, default="")
+    subject = models.TextField(_("Subject"))
+    body = models.TextField(_("Body"))
+    html_body = models.TextField(_("HTML Body"), blank=True, default="")
+    from_email = models.CharField(_("From Email"), max_length=255)
+    to = JSONField(_("To"), default=list, blank=True)
+    cc = JSONField(_("CC"), default=list, blank=True)
+    bcc = JSONField(_("BCC"), default=list, blank=True)
+
+    class Meta:
+        """Meta definition for OutboxEmail."""
+
+        app_label = "model_reviews"
+        verbose_name = _("Outbox Email")
+        verbose_name_plural = _("Outbox Emails")
+
+    def __str__(self):
+        """Unicode representation of OutboxEmail."""
+        return self.subject
+
+    @classmethod
+    def from_message(cls, message: EmailMessage) -> "OutboxEmail":
+        """Get an (unsaved) outbox email from an email message."""
+        html_body = ""
+        for content, mimetype in getattr(message, "alternatives", []):
+            if mimetype == "text/html":
+                html_body = content
+        return cls(
+            subject=message.subject,
+            body=message.body,
+            html_body=html_body,
+            from_email=message.from_email,
+            to=list(message.to),
+            cc=list(message.cc),
+            bcc=list(message.bcc),
+        )
+
+    def get_message(self) -> EmailMultiAlternatives:
+        """Get the email message to send."""
+        message = EmailMultiAlternatives(
+            self.subject,
+            self.body,
+            self.from_email,
+            self.to,
+            cc=self.cc,
+            bcc=self.bcc,
+        )
+        if self.html_body:
+            message.attach_alternative(self.html_body, "text/html")
+        return message
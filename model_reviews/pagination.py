@@ -0,0 +1,85 @@
+"""pagination module for model_reviews."""
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Tuple
+
+from django.db.models import Q, QuerySet
+from django.utils.dateparse import parse_datetime
+
+from model_reviews.models import ModelReview
+
+# the stable ordering that pages of reviews follow
+PAGE_ORDERING = ("created", "pk")
+
+
+class ReviewPage(NamedTuple):
+    """A page of reviews."""
+
+    object_list: List[ModelReview]
+    next_cursor: Optional[str]
+
+    @property
+    def has_next(self) -> bool:
+        """Check if there is a page after this one."""
+        return self.next_cursor is not None
+
+
+def encode_cursor(review: ModelReview) -> str:
+    """Get the cursor that points to the position after a review."""
+    value = f"{review.created.isoformat()}|{review.pk}"
+    return urlsafe_b64encode(value.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[Tuple[datetime, int]]:
+    """
+    Get the position that a cursor points to.
+
+    Returns:
+        A tuple of the created timestamp and the primary key of the last review
+        before the position, or `None` if the cursor is not valid.
+    """
+    if not cursor:
+        return None
+    try:
+        created, pk = (
+            urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").split("|")
+        )
+        created_dt = parse_datetime(created)
+        pk_int = int(pk)
+    except (TypeError, ValueError, UnicodeError):
+        return None
+    if created_dt is None:
+        return None
+    return created_dt, pk_int
+
+
+def paginate_reviews(  # pylint: disable=bad-continuation
+    queryset: QuerySet, cursor: Optional[str] = None, page_size: int = 100
+) -> ReviewPage:
+    """
+    Get a page of reviews using keyset pagination.
+
+    The reviews are ordered by their created timestamp and primary key, and the
+    page starts right after the position that the cursor points to.  Unlike
+    offset pagination, the cost of getting a page does not grow with the
+    position, and reviews that leave the queryset (e.g. because they were
+    reviewed) do not shift the following pages.
+
+    :param queryset: the reviews to paginate
+    :param cursor: the cursor of the page, the first page is returned if empty
+    :param page_size: the number of reviews in each page
+    """
+    queryset = queryset.order_by(*PAGE_ORDERING)
+    position = decode_cursor(cursor)
+    if position is not None:
+        created, pk = position
+        queryset = queryset.filter(
+            Q(created__gt=created) | Q(created=created, pk__gt=pk)
+        )
+    # get one more review than needed to find out if there is a next page
+    reviews = list(queryset[: page_size + 1])
+    next_cursor = None
+    if len(reviews) > page_size:
+        reviews = reviews[:page_size]
+        next_cursor = encode_cursor(reviews[-1])
+    return ReviewPage(object_list=reviews, next_cursor=next_cursor)
@@ -0,0 +1,269 @@
+"""Sandbox module for model_reviews."""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import models
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from model_reviews.constants import SANDBOX_FIELD, SANDBOX_PROPOSED_FIELD
+from model_reviews.diff import to_json_value
+
+
+class BaseSandboxBackend:
+    """
+    Base class for sandbox backends.
+
+    Sandbox backends decide where the changes to the monitored fields of an
+    approvable object are stored while they are waiting to be reviewed.
+    """
+
+    # the fields of ModelReview that hold the sandbox, these are saved together
+    # with the review
+    review_fields: Tuple[str, ...] = ()
+
+    def load_sandboxes(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Make a QuerySet of reviews load their sandboxes together with them."""
+        return queryset
+
+    def get_sandbox(self, review: models.Model) -> Dict[str, Any]:
+        """Get the values in the sandbox of a review, keyed by field name."""
+        raise NotImplementedError
+
+    def get_proposed_fields(self, review: models.Model) -> Set[str]:
+        """
+        Get the names of the fields in the sandbox of a review that are changes.
+
+        The other values in the sandbox are the values that the fields had when
+        they were put in the sandbox, and approving the review does not write
+        them.  All the fields in the sandbox are changes by default.
+        """
+        return set(self.get_sandbox(review))
+
+    def clear_proposed_fields(self, review: models.Model) -> None:
+        """Mark the changes in the sandbox of a review as saved, without saving."""
+        raise NotImplementedError
+
+    @staticmethod
+    def is_proposed(  # pylint: disable=bad-continuation
+        name: str, value: Any, saved_values: Optional[Dict[str, Any]]
+    ) -> bool:
+        """Check if a value put in a sandbox is a change to the saved value."""
+        if saved_values is None or name not in saved_values:
+            return True
+        return to_json_value(value) != to_json_value(saved_values[name])
+
+    def update_sandbox(  # pylint: disable=bad-continuation
+        self,
+        review: models.Model,
+        values: Dict[str, Any],
+        saved_values: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Put values in the sandbox of a review, without saving them.
+
+        Values that are the same as their saved values are not changes, see
+        `get_proposed_fields`.
+
+        Args:
+            review: the review
+            values: the new values keyed by field name
+            saved_values: the values that the new values replace, keyed by field
+                name, if known
+        """
+        raise NotImplementedError
+
+    def save_sandboxes(self, reviews: Iterable[models.Model]) -> None:
+        """
+        Save the changes to the sandboxes of reviews that are already saved.
+
+        The fields in `review_fields` are saved together with the reviews, and
+        are not saved here.
+        """
+        raise NotImplementedError
+
+    def filter_field(self, queryset: models.QuerySet, name: str) -> models.QuerySet:
+        """Filter reviews whose sandbox has a value for a field."""
+        raise NotImplementedError
+
+
+class JSONSandboxBackend(BaseSandboxBackend):
+    """Store the sandbox of a review in its JSON `data` field."""
+
+    review_fields = ("data",)
+
+    def get_sandbox(self, review: models.Model) -> Dict[str, Any]:
+        """Get the values in the sandbox of a review, keyed by field name."""
+        return review.data.get(SANDBOX_FIELD, {})
+
+    def get_proposed_fields(self, review: models.Model) -> Set[str]:
+        """Get the names of the fields in the sandbox of a review that are changes."""
+        proposed = review.data.get(SANDBOX_PROPOSED_FIELD)
+        if proposed is None:
+            # the sandbox was made before the changes were told apart
+            return set(self.get_sandbox(review))
+        return set(proposed)
+
+    def clear_proposed_fields(self, review: models.Model) -> None:
+        """Mark the changes in the sandbox of a review as saved, without saving."""
+        review.data[SANDBOX_PROPOSED_FIELD] = []
+
+    def update_sandbox(  # pylint: disable=bad-continuation
+        self,
+        review: models.Model,
+        values: Dict[str, Any],
+        saved_values: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Put values in the sandbox of a review, without saving them."""
+        proposed = self.get_proposed_fields(review)
+        for name, value in values.items():
+            if self.is_proposed(name, value, saved_values):
+                proposed.add(name)
+            else:
+                proposed.discard(name)
+        if review.data.get(SANDBOX_FIELD):
+            review.data[SANDBOX_FIELD].update(values)
+        else:
+            review.data[SANDBOX_FIELD] = dict(values)
+        review.data[SANDBOX_PROPOSED_FIELD] = sorted(proposed)
+
+    def save_sandboxes(self, reviews: Iterable[models.Model]) -> None:
+        """Save the changes to the sandboxes of reviews, nothing to do here."""
+
+    def filter_field(self, queryset: models.QuerySet, name: str) -> models.QuerySet:
+        """Filter reviews whose sandbox has a value for a field."""
+        return queryset.filter(**{f"data__{SANDBOX_FIELD}__has_key": name})
+
+
+class FieldSandboxBackend(BaseSandboxBackend):
+    """
+    Store the sandbox of a review as a `SandboxField` row for each field.
+
+    Only the rows of the fields that changed are written when a sandbox is
+    updated, and reviews can be filtered by the fields that they change using an
+    index.  The rows are loaded once for each review, see `load_sandboxes` to load
+    them for many reviews at once.
+    """
+
+    @staticmethod
+    def get_rows(review: models.Model) -> Dict[str, models.Model]:
+        """Get the sandbox rows of a review, keyed by field name."""
+        # pylint: disable=protected-access
+        if review._sandbox_rows is None:
+            if review.pk is None:
+                review._sandbox_rows = {}
+            else:
+                review._sandbox_rows = {
+                    row.field_name: row for row in review.sandbox_fields.all()
+                }
+        return review._sandbox_rows
+
+    def load_sandboxes(self, queryset: models.QuerySet) -> models.QuerySet:
+        """Make a QuerySet of reviews load their sandboxes together with them."""
+        return queryset.prefetch_related("sandbox_fields")
+
+    def get_sandbox(self, review: models.Model) -> Dict[str, Any]:
+        """Get the values in the sandbox of a review, keyed by field name."""
+        return {name: row.new_value for name, row in self.get_rows(review).items()}
+
+    def get_proposed_fields(self, review: models.Model) -> Set[str]:
+        """Get the names of the fields in the sandbox of a review that are changes."""
+        return {name for name, row in self.get_rows(review).items() if row.proposed}
+
+    def clear_proposed_fields(self, review: models.Model) -> None:
+        """Mark the changes in the sandbox of a review as saved, without saving."""
+        # pylint: disable=protected-access
+        if review._sandbox_dirty is None:
+            review._sandbox_dirty = set()
+        for name, row in self.get_rows(review).items():
+            if row.proposed:
+                row.old_value = row.new_value
+                row.proposed = False
+                review._sandbox_dirty.add(name)
+
+    def update_sandbox(  # pylint: disable=bad-continuation
+        self,
+        review: models.Model,
+        values: Dict[str, Any],
+        saved_values: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Put values in the sandbox of a review, without saving them."""
+        # pylint: disable=import-outside-toplevel
+        from model_reviews.sandbox_models import SandboxField
+
+        rows = self.get_rows(review)
+        saved_values = saved_values or {}
+        if review._sandbox_dirty is None:  # pylint: disable=protected-access
+            review._sandbox_dirty = set()  # pylint: disable=protected-access
+        for name, value in values.items():
+            row = rows.get(name)
+            if row is None:
+                row = rows[name] = SandboxField(field_name=name)
+            if name in saved_values:
+                row.old_value = saved_values[name]
+            row.new_value = value
+            row.proposed = self.is_proposed(name, value, saved_values)
+            review._sandbox_dirty.add(name)  # pylint: disable=protected-access
+
+    def save_sandboxes(self, reviews: Iterable[models.Model]) -> None:
+        """
+        Save the changes to the sandboxes of reviews.
+
+        The new rows of all the reviews are created with one query, and the
+        changed rows are updated with another.  Django 3.1 has no bulk upsert, so
+        the rows that exist are known from the loaded sandboxes.
+        """
+        # pylint: disable=import-outside-toplevel,protected-access
+        from model_reviews.sandbox_models import SandboxField
+
+        new_rows = []
+        changed_rows = []
+        created_reviews = []
+        for review in reviews:
+            dirty = review._sandbox_dirty
+            if not dirty:
+                continue
+            rows = self.get_rows(review)
+            for name in dirty:
+                row = rows[name]
+                if row.pk is None:
+                    # the review may have been saved after the row was made
+                    row.review = review
+                    new_rows.append(row)
+                    if not created_reviews or created_reviews[-1] is not review:
+                        created_reviews.append(review)
+                else:
+                    changed_rows.append(row)
+            dirty.clear()
+        if new_rows:
+            SandboxField.objects.bulk_create(new_rows)
+            if new_rows[0].pk is None:
+                # the database did not return the primary keys of the new rows,
+                # so they are loaded again when they are needed
+                for review in created_reviews:
+                    review._sandbox_rows = None
+        if changed_rows:
+            SandboxField.objects.bulk_update(
+                changed_rows, ["old_value", "new_value", "proposed"]
+            )
+
+    def filter_field(self, queryset: models.QuerySet, name: str) -> models.QuerySet:
+        """Filter reviews whose sandbox has a value for a field."""
+        return queryset.filter(sandbox_fields__field_name=name)
+
+
+@lru_cache(maxsize=None)
+def get_sandbox_backend() -> BaseSandboxBackend:
+    """Get the configured sandbox backend."""
+    return import_string(settings.MODELREVIEW_SANDBOX_BACKEND)()
+
+
+@receiver(setting_changed)
+def reset_sandbox_backend(  # pylint: disable=bad-continuation
+    sender, setting, **kwargs
+):  # pylint: disable=unused-argument
+    """Reset the cached sandbox backend when its setting changes."""
+    if setting == "MODELREVIEW_SANDBOX_BACKEND":
+        get_sandbox_backend.cache_clear()
@@ -0,0 +1,85 @@
+"""Models module for the sandboxes of model reviews."""
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from model_reviews.fields import CompactJSONEncoder, JSONField
+
+
+class SandboxField(models.Model):
+    """
+    Model definition for SandboxField.
+
+    A change to a monitored field that is waiting to be reviewed.  These are only
+    used by `model_reviews.sandbox.FieldSandboxBackend`.
+    """
+
+    review = models.ForeignKey(
+        "ModelReview",
+        verbose_name=_("Model Review"),
+        on_delete=models.CASCADE,
+        related_name="sandbox_fields",
+    )
+    field_name = models.CharField(_("Field Name"), max_length=255)
+    old_value = JSONField(
+        _("Old Value"), encoder=CompactJSONEncoder, default=None, null=True, blank=True
+    )
+    new_value = JSONField(
+        _("New Value"), encoder=CompactJSONEncoder, default=None, null=True, blank=True
+    )
+    proposed = models.BooleanField(
+        _("Proposed"),
+        default=True,
+        help_text=_("Whether the new value is a change to the old value"),
+    )
+
+    class Meta:
+        """Meta definition for SandboxField."""
+
+        app_label = "model_reviews"
+        verbose_name = _("Sandbox Field")
+        verbose_name_plural = _("Sandbox Fields")
+        unique_together = [["review", "field_name"]]
+        indexes = [
+            # reviews that change a field, see ModelReviewQuerySet.filter_sandbox_field
+            models.Index(fields=["field_name", "review"], name="sandboxfield_field_idx")
+        ]
+
+    def __str__(self):
+        """Unicode representation of SandboxField."""
+        return self.field_name
+
+
+class SandboxRevision(models.Model):
+    """
+    Model definition for SandboxRevision.
+
+    The values that were put in the sandbox of a review at once.  Only the values
+    that changed are stored, see `ModelReview.get_sandbox_version`.  Revisions are
+    only added when the MODELREVIEW_SANDBOX_REVISIONS setting is on.
+    """
+
+    review = models.ForeignKey(
+        "ModelReview",
+        verbose_name=_("Model Review"),
+        on_delete=models.CASCADE,
+        related_name="revisions",
+    )
+    number = models.PositiveIntegerField(_("Number"))
+    created = models.DateTimeField(_("Created"), auto_now_add=True)
+    changes = JSONField(
+        _("Changes"), encoder=CompactJSONEncoder, default=dict, blank=True
+    )
+
+    class Meta:
+        """Meta definition for SandboxRevision."""
+
+        app_label = "model_reviews"
+        verbose_name = _("Sandbox Revision")
+        verbose_name_plural = _("Sandbox Revisions")
+        indexes = [
+            models.Index(fields=["review", "number"], name="sandboxrevision_number_idx")
+        ]
+
+    def __str__(self):
+        """Unicode representation of SandboxRevision."""
+        return f"{self.review_id} revision {self.number}"
@@ -6,3 +6,11 @@ MODELREVIEW_PROCESS_REVIEW_FUNCTION = "model_reviews.utils.process_review"
 MODELREVIEW_PROCESS_AFTER_SAVE_FUNCTION = (
     "model_reviews.signals.modelreview_after_save_func"
 )
+MODELREVIEW_EMAIL_DELIVERY_BACKEND = "model_reviews.delivery.OutboxBackend"
+MODELREVIEW_EMAIL_THREAD_POOL_SIZE = 2
+MODELREVIEW_EMAIL_BATCH_SIZE = 100
+MODELREVIEW_EMAIL_MAX_ATTEMPTS = 3
+MODELREVIEW_BULK_PAGE_SIZE = 100
+MODELREVIEW_SANDBOX_BACKEND = "model_reviews.sandbox.JSONSandboxBackend"
+MODELREVIEW_SANDBOX_REVISIONS = False
+MODELREVIEW_SANDBOX_REVISIONS_KEEP = 10
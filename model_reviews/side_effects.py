@@ -11,6 +11,6 @@ def set_review_user(review_obj: models.Model):
     This is the default strategy of auto-setting the user for a review object.
     It simply sets the user using a field on the model object that is under review.
     """
-    if not review_obj.user:
+    if review_obj.user_id is None:
         object_under_review = review_obj.content_object
         review_obj.user = getattr(object_under_review, USER, None)
@@ -1,15 +1,74 @@
 """Signals module for model_reviews."""
-from django.conf import settings
+from typing import Any, Dict, Optional, Set, Tuple, Type
+
+from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.core.exceptions import ObjectDoesNotExist
-from django.db.models.signals import post_save, pre_save
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import OuterRef, Subquery
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch.dispatcher import receiver
-from django.utils.module_loading import import_string
 
+from model_reviews.hooks import get_hook, get_setting_hook, validate_model_hooks
 from model_reviews.models import AbstractReview, ModelReview, Reviewer
+from model_reviews.moderation import is_moderation_skipped
+
+# prefix of the annotations used to load the saved values of monitored fields
+SAVED_VALUE_PREFIX = "saved_value_"
+# the approvable models whose saves are connected to the moderation receivers
+_APPROVABLE_MODELS: Set[Type[AbstractReview]] = set()
+
+
+def _get_review_for_update(  # pylint: disable=bad-continuation
+    sender, instance, saved_values: Optional[Dict[str, Any]] = None
+) -> Tuple[Optional[ModelReview], Optional[Dict[str, Any]]]:
+    """
+    Get the ModelReview object of an approvable instance that is being updated.
+
+    The review is fetched together with the saved values of the monitored fields
+    of the source in one query, unless the saved values are already known.
+
+    Args:
+        saved_values: the saved monitored values of the source keyed by attname,
+            if known.
+
+    Returns:
+        A tuple of the review and the saved monitored values keyed by attname.
+        The review is `None` if the source has not been saved yet, and the values
+        are `None` if they are not known and could not be loaded with the review.
+    """
+    obj_type = ContentType.objects.get_for_model(instance)
+    source_qs = sender._meta.base_manager.filter(pk=OuterRef("object_id"))
+    attnames = [field.attname for field in sender.get_monitored_db_fields()]
+    annotations = {}
+    if saved_values is None:
+        annotations = {
+            f"{SAVED_VALUE_PREFIX}{attname}": Subquery(source_qs.values(attname)[:1])
+            for attname in attnames
+        }
+    review = (
+        ModelReview.objects.filter(content_type=obj_type, object_id=instance.pk)
+        .annotate(source_pk=Subquery(source_qs.values("pk")[:1]), **annotations)
+        .first()
+    )
+    if review is None:
+        # this can happen for objects that were saved before they were approvable
+        if not sender._meta.base_manager.filter(pk=instance.pk).exists():
+            return None, None
+        review, _ = ModelReview.objects.get_or_create(
+            content_type=obj_type, object_id=instance.pk
+        )
+    elif review.source_pk is None:
+        return None, None
+    elif saved_values is None:
+        saved_values = {
+            attname: getattr(review, f"{SAVED_VALUE_PREFIX}{attname}")
+            for attname in attnames
+        }
+    # reuse the in-memory source instead of fetching it again
+    review.content_object = instance
+    return review, saved_values
 
 
-@receiver(pre_save)
 def approvable_before_save(  # pylint: disable=bad-continuation
     sender, instance, **kwargs
 ):  # pylint: disable=unused-argument
@@ -18,47 +77,132 @@ def approvable_before_save(  # pylint: disable=bad-continuation
 
     For already created objects:
         1. Get the corresponding ModelReview object
-        2. Update the ModelReview object is created sandbox
+        2. Update the ModelReview object is created sandbox, and write it without
+           the ModelReview save signals, see `ModelReview.save_sandbox`
         3. Revert the changes in the approvable object before saving
+
+    Nothing is done, and the database is not queried, if none of the monitored
+    fields being saved has changed since the instance was loaded or saved, see
+    `AbstractReview.get_dirty_monitored_fields`, or if moderation is skipped, see
+    `model_reviews.moderation.skip_moderation`.
+
+    This receiver is only connected to approvable models, see `register_approvable`.
     """
-    if isinstance(instance, AbstractReview) and not isinstance(instance, ModelReview):
-        if instance.pk is not None:  # deal with updated instances only
-            obj_type = ContentType.objects.get_for_model(instance)
-            try:
-                obj_type.get_object_for_this_type(pk=instance.pk)
-            except ObjectDoesNotExist:
-                pass
-            else:
-                review, _ = ModelReview.objects.get_or_create(
-                    content_type=obj_type, object_id=instance.pk
+    if instance.pk is None:  # deal with updated instances only
+        return
+    if is_moderation_skipped(sender, instance):
+        return
+    if not instance.get_dirty_monitored_fields(
+        update_fields=kwargs.get("update_fields")
+    ):
+        return
+    review, saved_values = _get_review_for_update(
+        sender, instance, saved_values=instance.get_saved_monitored_values()
+    )
+    if review is not None and review.needs_review():
+        # only update the sandbox if review is needed and there is a diff
+        if review.get_diff(source=instance):
+            review.update_sandbox(
+                source=instance, do_save=False, saved_values=saved_values
+            )
+            # the review is still pending, so of its hooks only set_user_function
+            # needs to run, see modelreview_before_save
+            set_user_function = get_hook(instance, "set_user_function")
+            if set_user_function:
+                set_user_function(review_obj=review)
+            review.save_sandbox(update_fields=["user"])
+            # only revert the instance if there is a diff
+            if saved_values is None:
+                instance.revert(
+                    fields=[f.attname for f in sender.get_monitored_db_fields()]
                 )
-                diff = review.get_diff(source=instance)
-
-                if review.needs_review():
-                    if diff:
-                        # only update the sandbox if review is needed and there is a diff
-                        review.update_sandbox(source=instance)
-                        # only revert the instance if there is a diff
-                        instance.revert()
+            else:
+                instance.revert(values=saved_values)
 
 
-@receiver(post_save)
 def approvable_after_save(  # pylint: disable=bad-continuation
     sender, instance, raw, created, **kwargs
 ):  # pylint: disable=unused-argument
     """
     Perform actions after the approvable item has been saved.
 
-    This is only relevant for new objects, where:
+    For new objects:
         1. A ModelReview object is created
         2. The sandbox on ModelReview is populated
+
+    No review is created if moderation is skipped, see
+    `model_reviews.moderation.skip_moderation`.
+
+    This receiver is only connected to approvable models, see `register_approvable`.
     """
-    if isinstance(instance, AbstractReview) and not isinstance(instance, ModelReview):
-        if created:
-            obj_type = ContentType.objects.get_for_model(instance)
-            review = ModelReview(content_type=obj_type, object_id=instance.pk)
-            review.update_sandbox(source=instance, do_save=False)
-            review.save()
+    # the monitored values of the instance are now the saved ones
+    instance.set_saved_monitored_values(update_fields=kwargs.get("update_fields"))
+    if created and not is_moderation_skipped(sender, instance):
+        obj_type = ContentType.objects.get_for_model(instance)
+        review = ModelReview(content_type=obj_type, object_id=instance.pk)
+        # the values in the sandbox are the saved ones, so they are not changes
+        review.update_sandbox(
+            source=instance,
+            do_save=False,
+            saved_values=instance.get_saved_monitored_values(),
+        )
+        review.save()
+
+
+def _get_dispatch_uid(signal_name: str, model: Type[AbstractReview]) -> str:
+    """Get the dispatch_uid used to connect a moderation receiver to a model."""
+    return f"model_reviews.{signal_name}.{model._meta.label_lower}"
+
+
+def register_approvable(model: Type[AbstractReview]) -> None:
+    """
+    Connect the moderation receivers to an approvable model.
+
+    The receivers are connected with the model as the sender so that saving
+    models that are not under review does not pay for any moderation work.
+    Models discovered by `register_approvable_models` are registered when the
+    app is ready, so this is only needed for models that are created later.
+    Registering the same model more than once has no effect.
+    """
+    if not (isinstance(model, type) and issubclass(model, AbstractReview)):
+        raise ImproperlyConfigured(f"{model} is not a subclass of AbstractReview.")
+    if model._meta.abstract:
+        raise ImproperlyConfigured(f"{model} is an abstract model.")
+    validate_model_hooks(model)
+    pre_save.connect(
+        approvable_before_save,
+        sender=model,
+        dispatch_uid=_get_dispatch_uid("approvable_before_save", model),
+    )
+    post_save.connect(
+        approvable_after_save,
+        sender=model,
+        dispatch_uid=_get_dispatch_uid("approvable_after_save", model),
+    )
+    _APPROVABLE_MODELS.add(model)
+
+
+def unregister_approvable(model: Type[AbstractReview]) -> None:
+    """Disconnect the moderation receivers from an approvable model."""
+    pre_save.disconnect(
+        sender=model, dispatch_uid=_get_dispatch_uid("approvable_before_save", model),
+    )
+    post_save.disconnect(
+        sender=model, dispatch_uid=_get_dispatch_uid("approvable_after_save", model),
+    )
+    _APPROVABLE_MODELS.discard(model)
+
+
+def register_approvable_models() -> None:
+    """Register every concrete AbstractReview subclass in the app registry."""
+    for model in apps.get_models():
+        if issubclass(model, AbstractReview):
+            register_approvable(model)
+
+
+def get_approvable_models() -> Tuple[Type[AbstractReview], ...]:
+    """Return the models that are currently registered for moderation."""
+    return tuple(_APPROVABLE_MODELS)
 
 
 @receiver(pre_save, sender=ModelReview)
@@ -68,8 +212,8 @@ def modelreview_before_save(  # pylint: disable=bad-continuation
     """Perform actions before the ModelReview object has been saved."""
     # run set_user_function
     if instance.content_object:
-        if instance.content_object.set_user_function:
-            set_user_function = import_string(instance.content_object.set_user_function)
+        set_user_function = get_hook(instance.content_object, "set_user_function")
+        if set_user_function:
             set_user_function(review_obj=instance)
 
 
@@ -78,15 +222,15 @@ def modelreview_after_save_func(  # pylint: disable=bad-continuation
 ):  # pylint: disable=unused-argument
     """Perform actions after the ModelReview object has been saved."""
     if not instance.needs_review():
-        process_review_function = import_string(
-            settings.MODELREVIEW_PROCESS_REVIEW_FUNCTION
+        process_review_function = get_setting_hook(
+            "MODELREVIEW_PROCESS_REVIEW_FUNCTION"
         )
         process_review_function(instance)
     if instance.content_object:
-        if instance.content_object.set_reviewers_function:
-            set_reviewers_function = import_string(
-                instance.content_object.set_reviewers_function
-            )
+        set_reviewers_function = get_hook(
+            instance.content_object, "set_reviewers_function"
+        )
+        if set_reviewers_function:
             set_reviewers_function(review_obj=instance)
 
 
@@ -95,7 +239,7 @@ def modelreview_after_save(  # pylint: disable=bad-continuation
     sender, instance, raw, created, **kwargs
 ):  # pylint: disable=unused-argument
     """Perform actions after the ModelReview object has been saved."""
-    signal_function = import_string(settings.MODELREVIEW_PROCESS_AFTER_SAVE_FUNCTION)
+    signal_function = get_setting_hook("MODELREVIEW_PROCESS_AFTER_SAVE_FUNCTION")
     signal_function(sender, instance, raw, created, **kwargs)
 
 
@@ -106,3 +250,20 @@ def reviewer_after_save(  # pylint: disable=bad-continuation
     """Perform actions after the Reviewer object has been saved."""
     if created:
         instance.send_request_for_review()
+
+
+@receiver(post_save, sender=Reviewer)
+def reviewer_update_counts(  # pylint: disable=bad-continuation
+    sender, instance, raw, created, **kwargs
+):  # pylint: disable=unused-argument
+    """Update the reviewer counters of the review after a Reviewer is saved."""
+    if not raw:
+        Reviewer.update_review_counts([instance], created=created)
+
+
+@receiver(post_delete, sender=Reviewer)
+def reviewer_after_delete(  # pylint: disable=bad-continuation
+    sender, instance, **kwargs
+):  # pylint: disable=unused-argument
+    """Update the reviewer counters of the review after a Reviewer is deleted."""
+    ModelReview.objects.filter(pk=instance.review_id).recount_reviewers()
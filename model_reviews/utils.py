@@ -1,54 +1,325 @@
 """utils module."""
-from django.db.models import Max
-from django.utils.module_loading import import_string
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from model_reviews.models import ModelReview, Reviewer
+from django.db import router, transaction
+from django.db.models import (
+    Exists,
+    Model,
+    OuterRef,
+    QuerySet,
+    Subquery,
+    prefetch_related_objects,
+)
+from django.db.models.signals import post_save, pre_save
+from django.utils import timezone
+
+from model_reviews.diff import get_diff_plan
+from model_reviews.hooks import get_hook
+from model_reviews.models import REVIEWER_COUNT_FIELDS, ModelReview, Reviewer
+from model_reviews.moderation import skip_object_moderation
+
+
+def apply_review(review: ModelReview, source: Optional[Model] = None) -> List[str]:
+    """
+    Save the outcome of a review to the reviewed object.
+
+    The review status and date are always saved.  If the review is approved, the
+    changes in the sandbox of the monitored fields are saved too, see
+    `ModelReview.get_proposed_fields`.  Values in the sandbox that are not changes
+    are not written, so that changes saved to the object directly since then
+    (e.g. with moderation skipped) are kept.  Only these fields are written, with
+    a single UPDATE, and the moderation of the object is skipped because the
+    values have been reviewed (see `model_reviews.moderation.skip_object_moderation`).
+    The changes are then marked as saved in the sandbox, so that saving the review
+    again does not write them again.
+
+    Args:
+        review: the review
+        source: the reviewed object, `review.content_object` by default
+
+    Returns:
+        The names of the fields that were saved.
+    """
+    source = source or review.content_object
+    values: Dict[str, Any] = {}
+    proposed: Set[str] = set()
+    if review.review_status == ModelReview.APPROVED:
+        sandbox = review.get_sandbox_values(source=source)
+        proposed = review.get_proposed_fields()
+        for field in get_diff_plan(source).db_fields:
+            if field.name in proposed and not field.primary_key:
+                values[field.name] = sandbox[field.name]
+    values["review_status"] = review.review_status
+    values["review_date"] = review.review_date
+    for name, value in values.items():
+        setattr(source, name, value)
+    with skip_object_moderation(source):
+        source.save(update_fields=list(values))
+    if proposed:
+        review.clear_proposed_fields()
+    return list(values)
 
 
 def process_review(instance: ModelReview):
     """Process a review."""
     reviewed_obj = instance.content_object
-    reviewed_obj.review_status = instance.review_status
-    reviewed_obj.review_date = instance.review_date
-    reviewed_obj.save()
+    apply_review(instance, source=reviewed_obj)
     # side effects
     reviewed_obj.run_side_effect(review_obj=instance)
     # send notification
     instance.send_review_complete_notification()
 
 
-def perform_review(review: ModelReview):
-    """Perform a review."""
-    # check if all the reviewers are the same level
-    reviewers = Reviewer.objects.filter(review=review)
-    relevant_reviewer = None
-    if len(list(set(reviewers.values_list("level", flat=True)))) == 1:
-        # get the most recent reviewer
-        relevant_reviewer = (
-            reviewers.filter(reviewed=True).order_by("-review_date").first()
+def _apply_review_decision(  # pylint: disable=bad-continuation,too-many-arguments
+    review: ModelReview,
+    decision_min_level: Optional[int],
+    decision_max_level: Optional[int],
+    decision_status: Optional[str],
+    decision_date: Optional[datetime],
+) -> bool:
+    """
+    Apply the decision of the reviewers to a review, without saving it.
+
+    The arguments are the annotations added by `annotate_review_decisions`.
+
+    Returns:
+        True if the review is complete, otherwise False.
+    """
+    if decision_status is not None:
+        review.review_date = decision_date
+        review.review_status = decision_status
+        return True
+    # if none of the highest level people has done a review then we could
+    # be in a situation where there are tiered reviews i.e. reviews start with
+    # low level people and progress up the hierarchy after they do the reviews
+    # so we check if a get_next_reviewers_function exists and then call it
+    if (
+        decision_max_level is None or decision_min_level != decision_max_level
+    ) and review.content_object:
+        get_next_reviewers_function = get_hook(
+            review.content_object, "get_next_reviewers_function"
         )
-    else:
-        # check if at least one of the highest level people has done the review
-        max_level = reviewers.aggregate(max_lvl=Max("level"))["max_lvl"]
-        relevant_reviewer = (
-            reviewers.filter(reviewed=True, level=max_level)
-            .order_by("-review_date", "-level")
+        if get_next_reviewers_function:
+            get_next_reviewers_function(review_obj=review)
+    return False
+
+
+def _get_counted_decision(  # pylint: disable=bad-continuation
+    review: ModelReview, reviewer: Reviewer, levels: Dict[str, Any]
+) -> Optional[Dict[str, Any]]:
+    """
+    Get the decision of the reviewers of a review from its reviewer counters.
+
+    The counters are only used if they agree with the levels of the reviewers,
+    because they are not updated when reviewers are changed without sending
+    signals (e.g. with `QuerySet.bulk_create` or `QuerySet.update`).
+
+    :param review: the review, with up to date reviewer counters
+    :param reviewer: the reviewer who has just reviewed
+    :param levels: the levels of the reviewers, see `_get_reviewer_levels`
+
+    Returns:
+        The decision in the same form as `annotate_review_decisions`, or `None`
+        if it can not be worked out from the counters.
+    """
+    if (
+        review.min_level != levels["decision_min_level"]
+        or review.max_level != levels["decision_max_level"]
+        or bool(review.top_level_reviewed_count) != levels["decision_reviewed"]
+    ):
+        return None
+    decision = {
+        "decision_min_level": review.min_level,
+        "decision_max_level": review.max_level,
+        "decision_status": None,
+        "decision_date": None,
+    }
+    if reviewer.reviewed and reviewer.level == review.max_level:
+        # the reviewer who has just reviewed is the most recent one
+        decision["decision_status"] = reviewer.review_status
+        decision["decision_date"] = reviewer.review_date
+        return decision
+    if review.max_level is not None and review.top_level_reviewed_count == 0:
+        return decision
+    return None
+
+
+def _get_reviewer_levels(review: ModelReview) -> Optional[Dict[str, Any]]:
+    """
+    Reload the reviewer counters of a review and get the levels of its reviewers.
+
+    This is done in a single query.  The levels are returned in the form of
+    `annotate_review_decisions`, with `decision_reviewed` telling whether any of
+    the reviewers at the highest level has done the review.
+
+    Returns:
+        The levels, or `None` if the review does not exist anymore.
+    """
+    reviewers = Reviewer.objects.filter(review=OuterRef("pk"))
+    values = (
+        _annotate_review_levels(ModelReview.objects.filter(pk=review.pk))
+        .annotate(
+            decision_reviewed=Exists(
+                reviewers.filter(reviewed=True, level=OuterRef("decision_max_level"))
+            )
+        )
+        .values(
+            *REVIEWER_COUNT_FIELDS,
+            "decision_min_level",
+            "decision_max_level",
+            "decision_reviewed",
+        )
+        .first()
+    )
+    if values is None:
+        return None
+    for field in REVIEWER_COUNT_FIELDS:
+        setattr(review, field, values.pop(field))
+    return values
+
+
+def perform_review(review: ModelReview, reviewer: Optional[Reviewer] = None):
+    """
+    Perform a review.
+
+    When the reviewer who has just reviewed is known, the decision is worked
+    out from the reviewer counters of the review, which are checked against the
+    levels of the reviewers in the same query.  Otherwise, or if the counters
+    are out of date, it is worked out from the reviewers in a single query, see
+    `annotate_review_decisions`.
+
+    :param review: the review object
+    :param reviewer: the reviewer who has just reviewed
+    """
+    decision = None
+    if reviewer is not None:
+        levels = _get_reviewer_levels(review)
+        if levels is not None:
+            decision = _get_counted_decision(review, reviewer, levels)
+    if decision is None:
+        decision = (
+            annotate_review_decisions(ModelReview.objects.filter(pk=review.pk))
+            .values(
+                "decision_min_level",
+                "decision_max_level",
+                "decision_status",
+                "decision_date",
+            )
             .first()
         )
-        # if none of the highest level people has done a review then we could
-        # be in a situation where there are tiered reviews i.e. reviews start with
-        # low level people and progress up the hierarchy after they do the reviews
-        # so we check if a get_next_reviewers_function exists and then call it
-        if not relevant_reviewer:
-            if review.content_object:
-                if review.content_object.get_next_reviewers_function:
-                    get_next_reviewers_function = import_string(
-                        review.content_object.get_next_reviewers_function
-                    )
-                    get_next_reviewers_function(review_obj=review)
-
-    if relevant_reviewer:
+    if decision and _apply_review_decision(review, **decision):
         # save review as done
-        review.review_date = relevant_reviewer.review_date
-        review.review_status = relevant_reviewer.review_status
         review.save()
+
+
+def _annotate_review_levels(queryset: QuerySet) -> QuerySet:
+    """Annotate reviews with the lowest and highest levels of their reviewers."""
+    reviewers = Reviewer.objects.filter(review=OuterRef("pk"))
+    return queryset.annotate(
+        decision_min_level=Subquery(reviewers.order_by("level").values("level")[:1]),
+        decision_max_level=Subquery(reviewers.order_by("-level").values("level")[:1]),
+    )
+
+
+def annotate_review_decisions(queryset: QuerySet) -> QuerySet:
+    """
+    Annotate reviews with the outcome of their reviewers' decisions.
+
+    The decision of a review is the most recent decision of a reviewer at the
+    highest level.  The levels are worked out from the reviewers rather than the
+    reviewer counters, so that the decision is right even if the counters are
+    out of date.  The following annotations are added:
+
+    - decision_min_level and decision_max_level: the lowest and highest levels of
+      the reviewers
+    - decision_status and decision_date: the status and date of the decision, or
+      `None` if none of the reviewers at the highest level has done the review
+    """
+    decisions = Reviewer.objects.filter(
+        review=OuterRef("pk"), reviewed=True, level=OuterRef("decision_max_level")
+    ).order_by("-review_date")
+    return _annotate_review_levels(queryset).annotate(
+        decision_status=Subquery(decisions.values("review_status")[:1]),
+        decision_date=Subquery(decisions.values("review_date")[:1]),
+    )
+
+
+def perform_bulk_review(  # pylint: disable=bad-continuation
+    decisions: Iterable[Tuple[Reviewer, str]],
+) -> List[ModelReview]:
+    """
+    Perform many reviews at once.
+
+    This does the same thing as saving a `PerformReview` form for each decision,
+    but the reviewers and the reviews are written with one query each, and the
+    outcome of all the reviews is worked out in a single query.  Everything is
+    done in one transaction.
+
+    The pre_save and post_save signals of the reviews that are completed are
+    still sent, so that their side effects and notifications are processed.
+
+    :param decisions: tuples of the reviewer and the review status they chose
+
+    Returns:
+        The reviews that were completed.
+    """
+    now = timezone.now()
+    reviewers: List[Reviewer] = []
+    for reviewer, review_status in decisions:
+        reviewer.reviewed = True
+        reviewer.review_date = now
+        reviewer.review_status = review_status
+        reviewer.modified = now
+        reviewers.append(reviewer)
+    if not reviewers:
+        return []
+
+    using = router.db_for_write(ModelReview)
+    with transaction.atomic(using=using):
+        Reviewer.objects.bulk_update(
+            reviewers, ["reviewed", "review_date", "review_status", "modified"]
+        )
+        Reviewer.update_review_counts(reviewers)
+        reviews: List[ModelReview] = list(
+            annotate_review_decisions(
+                ModelReview.objects.filter(
+                    pk__in={reviewer.review_id for reviewer in reviewers}
+                )
+            ).order_by("pk")
+        )
+        prefetch_related_objects(reviews, "content_object")
+
+        completed: List[ModelReview] = []
+        for review in reviews:
+            if _apply_review_decision(
+                review,
+                decision_min_level=review.decision_min_level,
+                decision_max_level=review.decision_max_level,
+                decision_status=review.decision_status,
+                decision_date=review.decision_date,
+            ):
+                review.modified = now
+                completed.append(review)
+
+        for review in completed:
+            pre_save.send(
+                sender=ModelReview,
+                instance=review,
+                raw=False,
+                using=using,
+                update_fields=None,
+            )
+        ModelReview.objects.bulk_update(
+            completed, ["review_status", "review_date", "modified", "user"]
+        )
+        for review in completed:
+            post_save.send(
+                sender=ModelReview,
+                instance=review,
+                created=False,
+                update_fields=None,
+                raw=False,
+                using=using,
+            )
+    return completed
@@ -1,6 +1,7 @@
 """Views module for model reviews."""
 from typing import List, Optional
 
+from django.conf import settings
 from django.http import HttpResponseRedirect
 from django.utils.translation import gettext_lazy as _
 from django.views import View
@@ -17,8 +18,10 @@ from model_reviews.constants import (
     REVIEW_FORMSET_SUCCESS_MSG,
 )
 from model_reviews.forms import get_review_form
-from model_reviews.formset import get_review_formset
+from model_reviews.formset import get_pending_reviews, get_review_formset
 from model_reviews.models import ModelReview
+from model_reviews.pagination import ReviewPage, paginate_reviews
+from model_reviews.utils import perform_bulk_review
 
 
 class ReviewFormMixin:  # pylint: disable=too-few-public-methods
@@ -95,11 +98,20 @@ class ReviewView(View):
 
 
 class BulkReviewsView(MessageMixin, TemplateView):
-    """View used to handle bulk reviews."""
+    """
+    View used to handle bulk reviews.
+
+    The pending reviews are split into pages, and the formset is built and
+    validated one page at a time.  The page is selected using a cursor in the
+    query string, see `model_reviews.pagination`.
+    """
 
     initial: List[dict] = []
     success_url: Optional[str] = None
     prefix: Optional[str] = None
+    paginate_by: Optional[int] = None
+    cursor_kwarg = "cursor"
+    page: Optional[ReviewPage] = None
     template_name = "model_reviews/bulk.html"
     formset_invalid_message = _(REVIEW_FORMSET_FAIL_MSG)
     formset_valid_message = _(REVIEW_FORMSET_SUCCESS_MSG)
@@ -112,9 +124,29 @@ class BulkReviewsView(MessageMixin, TemplateView):
         """Return the prefix to use for forms."""
         return self.prefix
 
+    def get_paginate_by(self) -> int:
+        """Get the number of reviews in each page."""
+        return self.paginate_by or settings.MODELREVIEW_BULK_PAGE_SIZE
+
+    def get_queryset(self):
+        """Get the reviews to show."""
+        return get_pending_reviews(user=self.request.user)
+
+    def get_page(self) -> ReviewPage:
+        """Get the current page of reviews."""
+        if self.page is None:
+            self.page = paginate_reviews(
+                self.get_queryset(),
+                cursor=self.request.GET.get(self.cursor_kwarg),
+                page_size=self.get_paginate_by(),
+            )
+        return self.page
+
     def get_formset_class(self):
         """Get formset."""
-        return get_review_formset(user=self.request.user)
+        return get_review_formset(
+            user=self.request.user, queryset=self.get_page().object_list
+        )
 
     def get_formset(self, formset_class=None):
         """Return an instance of the formset to be used in this view."""
@@ -148,13 +180,26 @@ class BulkReviewsView(MessageMixin, TemplateView):
         """Insert the formset into the context dict."""
         if "formset" not in kwargs:
             kwargs["formset"] = self.get_formset()
+        page = self.get_page()
+        kwargs["page"] = page
+        if page.has_next:
+            query = self.request.GET.copy()
+            query[self.cursor_kwarg] = page.next_cursor
+            kwargs["next_page_url"] = f"{self.request.path}?{query.urlencode()}"
         return super().get_context_data(**kwargs)
 
     def formset_valid(self, formset):  # pylint: disable=unused-argument
-        """If the form is valid, redirect to the supplied URL."""
-        for form in formset:
-            if form.has_changed():
-                form.save()
+        """
+        If the form is valid, redirect to the supplied URL.
+
+        All the reviews in the formset are performed at once, see
+        `model_reviews.utils.perform_bulk_review`.
+        """
+        perform_bulk_review(
+            (form.cleaned_data["reviewer"], form.cleaned_data["review_status"])
+            for form in formset
+            if form.has_changed()
+        )
         self.messages.success(self.formset_valid_message, fail_silently=True)
         return HttpResponseRedirect(self.get_success_url())
 
@@ -29,6 +29,11 @@ DATABASES = {
         "HOST": "127.0.0.1",
     }
 }
+# run the tests on an in-memory SQLite database with `TEST_DATABASE=sqlite`
+if os.environ.get("TEST_DATABASE") == "sqlite":
+    DATABASES = {
+        "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+    }
 
 TEMPLATES = [
     {
@@ -81,6 +86,9 @@ MEDIA_ROOT = "/tmp/"
 
 SITE_ID = 1
 
+# send emails right away so that tests can inspect django.core.mail.outbox
+MODELREVIEW_EMAIL_DELIVERY_BACKEND = "model_reviews.delivery.InlineBackend"
+
 # snapshot testing
 TEST_RUNNER = "snapshottest.django.TestRunner"
 
@@ -0,0 +1,110 @@
+"""Test email delivery."""
+from io import StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from model_reviews.delivery import (
+    InlineBackend,
+    OutboxBackend,
+    ThreadPoolBackend,
+    get_delivery_backend,
+)
+from model_reviews.emails import send_email
+from model_reviews.models import OutboxEmail
+
+EMAIL_DATA = {
+    "name": "Bob Munro",
+    "email": "bob@example.com",
+    "subject": "I love oov",
+    "message": "The quick brown fox.",
+    "cc_list": ["admin@example.com"],
+}
+
+
+class TestDelivery(TestCase):
+    """Test class for email delivery."""
+
+    def test_get_delivery_backend(self):
+        """Test that the delivery backend follows the settings."""
+        self.assertIsInstance(get_delivery_backend(), InlineBackend)
+        with override_settings(
+            MODELREVIEW_EMAIL_DELIVERY_BACKEND="model_reviews.delivery.OutboxBackend"
+        ):
+            self.assertIsInstance(get_delivery_backend(), OutboxBackend)
+        self.assertIsInstance(get_delivery_backend(), InlineBackend)
+
+    @override_settings(
+        MODELREVIEW_EMAIL_DELIVERY_BACKEND="model_reviews.delivery.OutboxBackend"
+    )
+    def test_outbox_backend(self):
+        """Test that the outbox backend stores emails for the worker."""
+        self.assertEqual(1, send_email(**EMAIL_DATA))
+        self.assertEqual(1, send_email(**EMAIL_DATA))
+        self.assertEqual(0, len(mail.outbox))
+
+        email = OutboxEmail.objects.first()
+        self.assertEqual("I love oov", email.subject)
+        self.assertEqual(["Bob Munro <bob@example.com>"], email.to)
+        self.assertEqual(["admin@example.com"], email.cc)
+        self.assertIn("The quick brown fox.", email.body)
+        self.assertIn("<p>The quick brown fox.</p>", email.html_body)
+
+        out = StringIO()
+        with patch(
+            "model_reviews.management.commands.send_review_emails.get_connection",
+            wraps=mail.get_connection,
+        ) as connection_mock:
+            call_command("send_review_emails", stdout=out)
+        # one connection is used for the whole batch
+        self.assertEqual(1, connection_mock.call_count)
+        self.assertEqual("Sent 2 email(s), 0 failed.\n", out.getvalue())
+
+        self.assertEqual(2, len(mail.outbox))
+        self.assertEqual("I love oov", mail.outbox[0].subject)
+        self.assertEqual(["Bob Munro <bob@example.com>"], mail.outbox[0].to)
+        self.assertEqual(["admin@example.com"], mail.outbox[0].cc)
+        self.assertEqual("text/html", mail.outbox[0].alternatives[0][1])
+        self.assertFalse(OutboxEmail.objects.filter(sent=None).exists())
+
+        # sent emails are not sent again
+        call_command("send_review_emails", stdout=StringIO())
+        self.assertEqual(2, len(mail.outbox))
+
+    @override_settings(
+        MODELREVIEW_EMAIL_DELIVERY_BACKEND="model_reviews.delivery.OutboxBackend"
+    )
+    def test_outbox_failures(self):
+        """Test that failed emails are retried up to a limit."""
+        send_email(**EMAIL_DATA)
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=OSError("Nope"),
+        ):
+            for _ in range(3):
+                call_command("send_review_emails", stdout=StringIO())
+            out = StringIO()
+            call_command("send_review_emails", stdout=out)
+
+        self.assertEqual("Sent 0 email(s), 0 failed.\n", out.getvalue())
+        email = OutboxEmail.objects.get()
+        self.assertEqual(None, email.sent)
+        self.assertEqual(3, email.attempts)
+        self.assertEqual("Nope", email.last_error)
+
+    def test_thread_pool_backend(self):
+        """Test that the thread pool backend sends emails after commit."""
+        backend = ThreadPoolBackend(max_workers=1)
+        with patch("model_reviews.delivery.get_delivery_backend") as backend_mock:
+            backend_mock.return_value = backend
+            with patch("model_reviews.delivery.transaction.on_commit") as commit_mock:
+                self.assertEqual(1, send_email(**EMAIL_DATA))
+                # nothing is sent before the transaction is committed
+                self.assertEqual(0, len(mail.outbox))
+                commit_mock.call_args[0][0]()
+        backend.executor.shutdown(wait=True)
+
+        self.assertEqual(1, len(mail.outbox))
+        self.assertEqual("I love oov", mail.outbox[0].subject)
@@ -0,0 +1,91 @@
+"""Test diff."""
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from uuid import UUID
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+import pytz
+from model_mommy import mommy
+
+from model_reviews.constants import SANDBOX_FIELD
+from model_reviews.diff import get_diff_plan, to_json_value
+from model_reviews.models import ModelReview
+
+from .test_app.models import TestModel
+
+
+class TestDiff(TestCase):
+    """Test class for diff."""
+
+    def test_to_json_value(self):
+        """Test to_json_value."""
+        mocked_now = datetime(2010, 1, 1, 10, 30, 15, 123456, tzinfo=pytz.utc)
+        self.assertEqual("2010-01-01T10:30:15.123Z", to_json_value(mocked_now))
+        self.assertEqual("2010-01-01", to_json_value(date(2010, 1, 1)))
+        self.assertEqual("1.50", to_json_value(Decimal("1.50")))
+        self.assertEqual("P0DT01H00M00S", to_json_value(timedelta(hours=1)))
+        uuid = UUID("12345678123456781234567812345678")
+        self.assertEqual("12345678-1234-5678-1234-567812345678", to_json_value(uuid))
+        for value in ("text", 1, 1.5, True, None, [1], {"a": 1}):
+            self.assertEqual(value, to_json_value(value))
+        value = object()
+        self.assertIs(value, to_json_value(value))
+
+    def test_get_diff_plan(self):
+        """Test get_diff_plan."""
+        plan = get_diff_plan(TestModel)
+        self.assertIs(plan, get_diff_plan(TestModel(name="Test")))
+        self.assertEqual(
+            ["review_status", "review_date"], [item.name for item in plan.fields]
+        )
+        self.assertEqual(
+            ["review_status", "review_date"], [field.name for field in plan.db_fields]
+        )
+        # only values that are changed by JSON need to be normalized
+        self.assertIsNot(to_json_value, plan.fields[0].normalize)
+        self.assertIs(to_json_value, plan.fields[1].normalize)
+
+    def test_get_diff_serialized_values(self):
+        """Test that values loaded from the sandbox are not different."""
+        mocked_now = datetime(
+            2010, 1, 1, 10, 30, 15, 123000, tzinfo=pytz.timezone(settings.TIME_ZONE)
+        )
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        test_model.review_date = mocked_now
+        test_model.save()
+
+        # the sandbox now holds the date as a string
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(test_model),
+            object_id=test_model.pk,
+        )
+        self.assertIsInstance(review.data[SANDBOX_FIELD]["review_date"], str)
+        test_model.review_date = mocked_now
+        self.assertIsNone(review.get_diff(source=test_model))
+
+        test_model.review_date = mocked_now + timedelta(days=1)
+        self.assertEqual(["review_date"], review.get_diff(source=test_model))
+        test_model.review_date = mocked_now
+        test_model.review_status = ModelReview.APPROVED
+        self.assertEqual(["review_status"], review.get_diff(source=test_model))
+
+    def test_get_sandbox_values(self):
+        """Test that values loaded from the sandbox have the types of their fields."""
+        mocked_now = datetime(2010, 1, 1, 10, 30, 15, 123000, tzinfo=pytz.utc)
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        test_model.review_date = mocked_now
+        test_model.save()
+
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(test_model),
+            object_id=test_model.pk,
+        )
+        self.assertEqual(
+            {"review_status": ModelReview.PENDING, "review_date": mocked_now},
+            review.get_sandbox_values(source=test_model),
+        )
+        # only the values in the sandbox are returned
+        self.assertEqual({}, get_diff_plan(TestModel).load_values({"name": "Test"}))
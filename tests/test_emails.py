@@ -2,13 +2,22 @@
 from unittest.mock import call, patch
 
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
 from django.core import mail
+from django.template import engines
+from django.template.backends.django import Template
 from django.test import TestCase
 from django.utils import timezone
 
 from model_mommy import mommy
 
-from model_reviews.emails import get_display_name, send_email
+from model_reviews.emails import (
+    EmailRenderer,
+    EmailTemplates,
+    get_display_name,
+    send_email,
+    send_request_for_review,
+)
 from model_reviews.models import ModelReview
 
 
@@ -147,10 +156,10 @@ class TestEmails(TestCase):
         )
 
     @patch("model_reviews.emails.Site.objects.get_current")
-    @patch("model_reviews.emails.render_to_string")
+    @patch("model_reviews.emails.get_template")
     def test_send_email_templates(self, mock, site_mock):  # pylint: disable=no-self-use
         """Test the templates used with send_email."""
-        mock.return_value = "Some random text"
+        mock.return_value.render.return_value = "Some random text"
         site_mock.return_value = 42  # ensure that this is predictable
 
         # test generic
@@ -169,10 +178,107 @@ class TestEmails(TestCase):
         context["SITE"] = 42
 
         expected_calls = [
-            call("model_reviews/email/generic_email_subject.txt", context),
-            call("model_reviews/email/generic_email_body.txt", context),
-            call("model_reviews/email/generic_email_body.html", context),
+            call("model_reviews/email/generic_email_subject.txt"),
+            call("model_reviews/email/generic_email_body.txt"),
+            call("model_reviews/email/generic_email_body.html"),
         ]
 
         mock.assert_has_calls(expected_calls)
+        mock.return_value.render.assert_has_calls([call(context)] * 3)
         mock.reset_mock()
+
+    def test_email_renderer(self):
+        """Test that EmailRenderer caches the site and the templates."""
+        data = {
+            "name": "Bob Munro",
+            "email": "bob@example.com",
+            "subject": "I love oov",
+            "message": "The quick brown fox.",
+        }
+        renderer = EmailRenderer()
+        message = renderer.get_message(**data)
+        self.assertEqual("I love oov", message.subject)
+        self.assertEqual(["Bob Munro <bob@example.com>"], message.to)
+
+        with patch("model_reviews.emails.get_template") as mock:
+            with self.assertNumQueries(0):
+                message = renderer.get_message(**data)
+        mock.assert_not_called()
+        self.assertEqual(
+            "Hello Bob Munro,\n\nThe quick brown fox.\n\nThank you,\n\n"
+            "example.com\n------\nhttp://example.com\n",
+            message.body,
+        )
+
+        # other renderers look the templates up again
+        with patch("model_reviews.emails.get_template") as mock:
+            EmailRenderer().get_templates("model_reviews/email", "generic")
+        self.assertEqual(3, mock.call_count)
+
+    def test_send_request_for_review(self):
+        """Test sending requests for review to all the reviewers at once."""
+        test_model = mommy.make("test_app.TestModel")
+        obj_type = ContentType.objects.get_for_model(test_model)
+        review = ModelReview.objects.get(content_type=obj_type, object_id=test_model.id)
+        names = ["Jane Doe", "John O'Brien", "Mary <Jane>", "Bob", "Alice"]
+        for idx, name in enumerate(names):
+            mommy.make(
+                "model_reviews.Reviewer",
+                user=mommy.make(
+                    "auth.User",
+                    username=f"r{idx}",
+                    email=f"r{idx}@example.com",
+                    first_name=name,
+                ),
+                review=review,
+            )
+        mommy.make("model_reviews.Reviewer", review=review, reviewed=True)
+        mommy.make("model_reviews.Reviewer", review=review, user__email="")
+        expected = [
+            EmailRenderer().get_message(
+                name=name,
+                email=f"r{idx}@example.com",
+                subject="New Request For Approval",
+                message="There has been a new request that needs your attention.",
+                obj=review,
+            )
+            for idx, name in enumerate(names)
+        ]
+        mail.outbox = []
+
+        with patch(
+            "django.template.backends.django.Template.render",
+            autospec=True,
+            side_effect=Template.render,
+        ) as render_mock:
+            self.assertEqual(5, send_request_for_review(review))
+
+        # rendered once with a placeholder and once to check the placeholder
+        self.assertEqual(6, render_mock.call_count)
+        self.assertEqual(5, len(mail.outbox))
+        for message, expected_message in zip(mail.outbox, expected):
+            self.assertEqual(expected_message.to, message.to)
+            self.assertEqual(expected_message.subject, message.subject)
+            self.assertEqual(expected_message.body, message.body)
+            self.assertEqual(expected_message.alternatives, message.alternatives)
+        self.assertIn("Hello John O&#x27;Brien,", mail.outbox[1].body)
+        self.assertIn("Hello Mary &lt;Jane&gt;,", mail.outbox[2].alternatives[0][0])
+
+    @patch("model_reviews.emails.get_email_templates")
+    def test_get_messages_fallback(self, mock):
+        """Test that messages are rendered one by one if the name is transformed."""
+        mock.return_value = EmailTemplates(
+            subject=engines["django"].from_string("{{ subject }}"),
+            text_body=engines["django"].from_string("Hello {{ name|upper }}"),
+            html_body=engines["django"].from_string("Hello {{ name }}"),
+        )
+        messages = EmailRenderer(site=Site(domain="example.com")).get_messages(
+            recipients=[("Bob", "bob@example.com"), ("Jane", "jane@example.com")],
+            subject="Hi",
+            message="Hi",
+        )
+        self.assertEqual(["Hello BOB", "Hello JANE"], [msg.body for msg in messages])
+        self.assertEqual(
+            ["Hello Bob", "Hello Jane"],
+            [msg.alternatives[0][0] for msg in messages],
+        )
@@ -9,7 +9,7 @@ from django.test import RequestFactory, TestCase
 import pytz
 from model_mommy import mommy
 
-from model_reviews.forms import PerformReview
+from model_reviews.forms import PerformReview, PerformReviewForm, get_review_form
 from model_reviews.models import ModelReview
 
 
@@ -193,3 +193,44 @@ class TestForms(TestCase):
         self.assertEqual(True, reviewer2.reviewed)
         self.assertEqual(mocked_now, reviewer2.review_date)
         self.assertEqual(ModelReview.APPROVED, reviewer2.review_status)
+
+    def test_get_review_form(self):
+        """Test get_review_form."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        test_model2 = mommy.make("test_app.TestModel", name="Test 2")
+        obj_type = ContentType.objects.get_for_model(test_model)
+        review = ModelReview.objects.get(content_type=obj_type, object_id=test_model.id)
+        review2 = ModelReview.objects.get(
+            content_type=obj_type, object_id=test_model2.id
+        )
+        reviewer = mommy.make("model_reviews.Reviewer", user=user2, review=review)
+        mommy.make("model_reviews.Reviewer", user=user1, review=review)
+        reviewer2 = mommy.make("model_reviews.Reviewer", user=user2, review=review2)
+
+        # the same form class is used for all reviews
+        form = get_review_form(review=review, user=user2)()
+        form2 = get_review_form(review=review2, user=user2, reviewer=reviewer2)()
+        self.assertIs(PerformReviewForm, type(form))
+        self.assertIs(PerformReviewForm, type(form2))
+
+        self.assertEqual(review.pk, form["review"].initial)
+        self.assertEqual(reviewer.pk, form["reviewer"].initial)
+        self.assertEqual([review], list(form.fields["review"].queryset))
+        self.assertEqual([reviewer], list(form.fields["reviewer"].queryset))
+        self.assertEqual(review2.pk, form2["review"].initial)
+        self.assertEqual(reviewer2.pk, form2["reviewer"].initial)
+        self.assertEqual([reviewer2], list(form2.fields["reviewer"].queryset))
+
+        # the review and reviewer are limited to the ones the form was made for
+        form = get_review_form(review=review, user=user2)(
+            data={
+                "review": review2.pk,
+                "reviewer": reviewer2.pk,
+                "review_status": ModelReview.APPROVED,
+            }
+        )
+        self.assertFalse(form.is_valid())
+        self.assertEqual({"review", "reviewer"}, set(form.errors))
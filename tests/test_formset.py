@@ -3,14 +3,17 @@ from datetime import datetime
 from unittest.mock import patch
 
 from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
 
 import pytz
 from model_mommy import mommy
 from snapshottest.django import TestCase
 
-from model_reviews.formset import get_review_formset
+from model_reviews.formset import get_pending_reviews, get_review_formset
 from model_reviews.models import ModelReview, Reviewer
 
 
@@ -88,3 +91,59 @@ class TestForms(TestCase):
             self.assertEqual(True, reviewer.reviewed)
             self.assertEqual(mocked_now, reviewer.review_date)
             self.assertEqual(ModelReview.APPROVED, reviewer.review_status)
+
+    def test_model_review_formset_queries(self):
+        """Test that the number of queries does not grow with the reviews."""
+        user = mommy.make("auth.User", username="jane")
+
+        def add_reviews(count):
+            for _ in range(count):
+                test_model = mommy.make("test_app.TestModel", name="Test")
+                review = ModelReview.objects.get(
+                    content_type=ContentType.objects.get_for_model(test_model),
+                    object_id=test_model.id,
+                )
+                mommy.make("model_reviews.Reviewer", user=user, review=review)
+
+        add_reviews(2)
+        with CaptureQueriesContext(connection) as context:
+            formset = get_review_formset(user=user)()
+            formset.as_table()
+        self.assertEqual(2, formset.total_form_count())
+
+        add_reviews(10)
+        # 1. the reviews 2. the reviewers 3. the objects under review
+        with self.assertNumQueries(len(context.captured_queries)):
+            formset = get_review_formset(user=user)()
+            formset.as_table()
+        self.assertEqual(3, len(context.captured_queries))
+        self.assertEqual(12, formset.total_form_count())
+
+    def test_get_pending_reviews(self):
+        """Test get_pending_reviews."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        reviews = []
+        for _ in range(3):
+            test_model = mommy.make("test_app.TestModel", name="Test")
+            review = ModelReview.objects.get(
+                content_type=ContentType.objects.get_for_model(test_model),
+                object_id=test_model.id,
+            )
+            mommy.make("model_reviews.Reviewer", user=user1, review=review)
+            mommy.make("model_reviews.Reviewer", user=user2, review=review)
+            reviews.append(review)
+        reviews[0].review_status = ModelReview.APPROVED
+        reviews[0].save()
+
+        queryset = get_pending_reviews(user=user1)
+        # the reviewers are checked using a semi-join
+        self.assertIn("EXISTS", str(queryset.query))
+        self.assertNotIn("JOIN", str(queryset.query))
+        self.assertEqual(
+            [review.pk for review in reviews[1:]],
+            list(queryset.order_by("pk").values_list("pk", flat=True)),
+        )
+        self.assertEqual(2, queryset.count())
+
+        self.assertEqual([], list(get_pending_reviews(user=AnonymousUser())))
@@ -0,0 +1,79 @@
+"""Test hooks."""
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase, override_settings
+
+from model_reviews.hooks import (
+    clear_hooks_cache,
+    get_hook,
+    get_setting_hook,
+    resolve_hook,
+    validate_model_hooks,
+    validate_setting_hooks,
+)
+from model_reviews.side_effects import set_review_user
+
+from .test_app.models import TestModel, TestModel2
+
+
+class TestHooks(TestCase):
+    """Test class for hooks."""
+
+    def test_resolve_hook(self):
+        """Test resolving hook functions."""
+        hook = resolve_hook("model_reviews.side_effects.set_review_user")
+        self.assertEqual("model_reviews.side_effects.set_review_user", hook.path)
+        # hooks are only resolved once
+        self.assertIs(hook, resolve_hook("model_reviews.side_effects.set_review_user"))
+        with patch("model_reviews.side_effects.set_review_user") as mock:
+            hook(review_obj=None)
+        mock.assert_called_once_with(review_obj=None)
+
+        clear_hooks_cache()
+        self.assertIsNot(
+            hook, resolve_hook("model_reviews.side_effects.set_review_user")
+        )
+
+    def test_resolve_hook_errors(self):
+        """Test that bad hook paths raise clear errors."""
+        for path in ("nope", "model_reviews.nope.nope", "model_reviews.side_effects.n"):
+            with self.assertRaises(ImproperlyConfigured):
+                resolve_hook(path)
+        with self.assertRaises(ImproperlyConfigured):
+            # not callable
+            resolve_hook("model_reviews.side_effects.USER")
+
+    def test_get_hook(self):
+        """Test getting the hook functions of approvable models."""
+        self.assertEqual(
+            "model_reviews.side_effects.set_review_user",
+            get_hook(TestModel, "set_user_function").path,
+        )
+        self.assertEqual(
+            "tests.test_app.models.set_reviewers",
+            get_hook(TestModel2(), "set_reviewers_function").path,
+        )
+        self.assertIsNone(get_hook(TestModel, "set_reviewers_function"))
+        with patch.object(TestModel, "side_effect_function", "tests.nope"):
+            with self.assertRaises(ImproperlyConfigured) as context:
+                validate_model_hooks(TestModel)
+        self.assertIn("test_app.TestModel.side_effect_function", str(context.exception))
+
+    def test_get_setting_hook(self):
+        """Test getting the hook functions set in settings."""
+        self.assertEqual(
+            "model_reviews.utils.process_review",
+            get_setting_hook("MODELREVIEW_PROCESS_REVIEW_FUNCTION").path,
+        )
+        with override_settings(
+            MODELREVIEW_PROCESS_REVIEW_FUNCTION=(
+                "model_reviews.side_effects.set_review_user"
+            )
+        ):
+            hook = get_setting_hook("MODELREVIEW_PROCESS_REVIEW_FUNCTION")
+            self.assertIs(set_review_user, getattr(hook.module, hook.name))
+        with override_settings(MODELREVIEW_PROCESS_REVIEW_FUNCTION="tests.nope"):
+            with self.assertRaises(ImproperlyConfigured):
+                validate_setting_hooks()
+        validate_setting_hooks()
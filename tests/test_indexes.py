@@ -0,0 +1,66 @@
+"""
+Test that the queries of model_reviews use the indexes made for them.
+
+The query plans are checked using EXPLAIN on PostgreSQL.  The test tables are
+tiny, so sequential scans are disabled to make the planner pick indexes the way
+it would on tables with many rows.  To check the plan of a new query, add a test
+that creates enough rows for the query and asserts that the name of the index
+appears in `get_plan(queryset)`.
+"""
+from unittest import skipUnless
+
+from django.db import connection
+from django.db.models import Q, QuerySet
+from django.test import TestCase
+
+from model_mommy import mommy
+
+from model_reviews.formset import get_pending_reviews
+from model_reviews.models import ModelReview, Reviewer
+from model_reviews.pagination import PAGE_ORDERING
+from model_reviews.utils import annotate_review_decisions
+
+from .test_app.models import TestModel
+
+
+@skipUnless(connection.vendor == "postgresql", "Query plans are checked on PostgreSQL")
+class TestIndexes(TestCase):
+    """Test class for indexes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.users = [mommy.make("auth.User", username=f"user{i}") for i in range(3)]
+        TestModel.objects.bulk_create_with_reviews(
+            [TestModel(name=f"Test {i}") for i in range(0, 300)], reviewers=cls.users
+        )
+        Reviewer.objects.filter(user=cls.users[0]).update(reviewed=True)
+        ModelReview.objects.filter(
+            pk__in=ModelReview.objects.order_by("pk").values("pk")[:30]
+        ).update(review_status=ModelReview.APPROVED)
+
+    def get_plan(self, queryset: QuerySet) -> str:
+        """Get the query plan of a queryset."""
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+            # only for the current transaction, which is rolled back after the test
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def test_pending_reviews(self):
+        """Test that pages of pending reviews use modelreview_pending_idx."""
+        queryset = get_pending_reviews(user=self.users[1]).order_by(*PAGE_ORDERING)
+        self.assertIn("modelreview_pending_idx", self.get_plan(queryset[:6]))
+
+        review = queryset[5]
+        # the next page, see model_reviews.pagination.paginate_reviews
+        queryset = queryset.filter(
+            Q(created__gt=review.created) | Q(created=review.created, pk__gt=review.pk)
+        )
+        self.assertIn("modelreview_pending_idx", self.get_plan(queryset[:6]))
+
+    def test_review_decisions(self):
+        """Test that the decisions of reviewers use reviewer_decision_idx."""
+        review = ModelReview.objects.order_by("pk").last()
+        queryset = annotate_review_decisions(ModelReview.objects.filter(pk=review.pk))
+        self.assertIn("reviewer_decision_idx", self.get_plan(queryset))
@@ -4,15 +4,23 @@ from unittest.mock import patch
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.contrib.sites.models import Site
+from django.db import connection
+from django.db.models import F
+from django.test import TestCase, override_settings
 
 import pytz
 from model_mommy import mommy
 
 from model_reviews.constants import SANDBOX_FIELD
-from model_reviews.models import ModelReview, Reviewer
+from model_reviews.models import (
+    REVIEWER_COUNT_FIELDS,
+    ModelReview,
+    OutboxEmail,
+    Reviewer,
+)
 
-from .test_app.models import TestModel
+from .test_app.models import TestModel, TestModel2
 
 
 class TestModels(TestCase):
@@ -192,3 +200,412 @@ class TestModels(TestCase):
             mommy.make("test_app.TestModel", name="Test 3", id=1337)
         except AttributeError:
             self.fail("approvable_before_save AttributeError!")
+
+    def test_revert(self):
+        """Test reverting changes on an approvable object."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        test_model.name = "Test 2"
+        test_model.review_status = TestModel.APPROVED
+
+        # saved values of monitored fields are restored without a query
+        with self.assertNumQueries(0):
+            self.assertTrue(test_model.revert(fields=["review_status"]))
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+        self.assertEqual("Test 2", test_model.name)
+
+        # other fields are reloaded
+        test_model.review_status = TestModel.APPROVED
+        with self.assertNumQueries(1):
+            self.assertTrue(test_model.revert(fields=["review_status", "name"]))
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+        self.assertEqual("Test 1", test_model.name)
+        test_model.name = "Test 2"
+
+        # the given values are restored without a query
+        test_model.review_status = TestModel.APPROVED
+        with self.assertNumQueries(0):
+            self.assertTrue(test_model.revert(values={"review_status": "3"}))
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+        self.assertEqual("Test 2", test_model.name)
+
+        # everything is reloaded by default
+        self.assertTrue(test_model.revert())
+        self.assertEqual("Test 1", test_model.name)
+
+        TestModel.objects.filter(pk=test_model.pk).delete()
+        self.assertFalse(test_model.revert())
+
+    def test_dirty_monitored_fields(self):
+        """Test finding the monitored fields that changed."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        self.assertEqual([], test_model.get_dirty_monitored_fields())
+        self.assertEqual(
+            {"review_status": TestModel.PENDING, "review_date": None},
+            test_model.get_saved_monitored_values(),
+        )
+
+        test_model.name = "Test 2"
+        test_model.review_status = TestModel.APPROVED
+        self.assertEqual(["review_status"], test_model.get_dirty_monitored_fields())
+        self.assertEqual(
+            [], test_model.get_dirty_monitored_fields(update_fields=["name"])
+        )
+
+        # the saved values are known for instances loaded from the database
+        test_model = TestModel.objects.get(pk=test_model.pk)
+        self.assertEqual([], test_model.get_dirty_monitored_fields())
+        test_model.review_date = datetime(2017, 6, 5, tzinfo=pytz.utc)
+        self.assertEqual(["review_date"], test_model.get_dirty_monitored_fields())
+
+        # but not for deferred fields or new instances
+        test_model = TestModel.objects.only("name").get(pk=test_model.pk)
+        self.assertEqual(
+            ["review_status", "review_date"], test_model.get_dirty_monitored_fields()
+        )
+        self.assertIsNone(test_model.get_saved_monitored_values())
+        test_model = TestModel(pk=test_model.pk, name="Test 1")
+        self.assertEqual(
+            ["review_status", "review_date"], test_model.get_dirty_monitored_fields()
+        )
+
+    def test_refresh_saved_monitored_values(self):
+        """Test that reloading the monitored fields updates their saved values."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        TestModel.objects.filter(pk=test_model.pk).update(
+            review_status=TestModel.APPROVED
+        )
+        test_model.refresh_from_db()
+        self.assertEqual([], test_model.get_dirty_monitored_fields())
+
+        # changes are reverted to the values that are in the database
+        test_model.review_status = TestModel.REJECTED
+        test_model.save()
+        test_model.refresh_from_db()
+        self.assertEqual(TestModel.APPROVED, test_model.review_status)
+
+        # deferred fields are remembered when they are loaded
+        test_model = TestModel.objects.only("name").get(pk=test_model.pk)
+        self.assertEqual(TestModel.APPROVED, test_model.review_status)
+        self.assertEqual(["review_date"], test_model.get_dirty_monitored_fields())
+        test_model.refresh_from_db(fields=["review_date"])
+        self.assertEqual([], test_model.get_dirty_monitored_fields())
+
+    def test_update_sandbox(self):
+        """Test that updating the sandbox does not run the review hooks."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(test_model),
+            object_id=test_model.pk,
+        )
+        modified = review.modified
+        test_model.review_status = TestModel.APPROVED
+
+        with patch("model_reviews.side_effects.set_review_user") as user_mock:
+            with patch(
+                "model_reviews.signals.modelreview_after_save_func"
+            ) as after_save_mock:
+                with self.assertNumQueries(1):
+                    review.update_sandbox(source=test_model)
+        user_mock.assert_not_called()
+        after_save_mock.assert_not_called()
+
+        review.refresh_from_db()
+        self.assertEqual(
+            TestModel.APPROVED, review.data[SANDBOX_FIELD]["review_status"]
+        )
+        self.assertGreater(review.modified, modified)
+
+    def test_reviewed_obj_update_other_fields(self):
+        """Test that only monitored fields are reverted when updating an object."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        test_model.name = "Test 2"
+        test_model.review_status = TestModel.APPROVED
+        test_model.save()
+
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+        self.assertEqual("Test 2", test_model.name)
+        test_model.refresh_from_db()
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+        self.assertEqual("Test 2", test_model.name)
+
+    @patch("model_reviews.emails.deliver")
+    def test_bulk_create_with_reviews(self, mock):
+        """Test creating approvable objects in bulk."""
+        reviewer1 = mommy.make("auth.User", username="r1", email="r1@example.com")
+        reviewer2 = mommy.make("auth.User", username="r2", email="r2@example.com")
+        obj_type = ContentType.objects.get_for_model(TestModel)
+
+        # 1. create the objects 2. create the reviews 3. create the reviewers
+        num_queries = 3
+        if not connection.features.can_return_rows_from_bulk_insert:
+            # each object is inserted on its own, and the primary keys of the
+            # reviews and reviewers are read back
+            num_queries = 5 + 2 + 2
+        with self.assertNumQueries(num_queries):
+            objs = TestModel.objects.bulk_create_with_reviews(
+                [TestModel(name=f"Test {i}") for i in range(5)],
+                reviewers=[reviewer1, reviewer2],
+            )
+
+        self.assertEqual(5, TestModel.objects.count())
+        # the requests for review are delivered together
+        mock.assert_called_once()
+        self.assertEqual(10, len(mock.call_args[0][0]))
+        for obj in objs:
+            review = ModelReview.objects.get(content_type=obj_type, object_id=obj.pk)
+            self.assertEqual(ModelReview.PENDING, review.review_status)
+            self.assertEqual(
+                {"review_status": ModelReview.PENDING, "review_date": None},
+                review.data[SANDBOX_FIELD],
+            )
+            self.assertEqual(
+                {reviewer1, reviewer2}, {item.user for item in review.reviewer_set.all()}
+            )
+
+        # when no reviewers are provided then set_reviewers_function is used
+        user = mommy.make("auth.User", username="Test1")
+        finalboss = mommy.make("auth.User", username="finalboss")
+        objs = TestModel2.objects.bulk_create_with_reviews(
+            [TestModel2(name="Test", user=user)]
+        )
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(TestModel2),
+            object_id=objs[0].pk,
+        )
+        self.assertEqual(user, review.user)
+        self.assertTrue(
+            Reviewer.objects.filter(user=finalboss, review=review).exists()
+        )
+
+    @patch("model_reviews.emails.deliver")
+    def test_bulk_create_with_reviews_no_returned_pks(self, mock):
+        """Test creating in bulk on databases that do not return primary keys."""
+        reviewer = mommy.make("auth.User", username="r1", email="r1@example.com")
+        obj_type = ContentType.objects.get_for_model(TestModel)
+
+        with patch.object(
+            connection.features, "can_return_rows_from_bulk_insert", False
+        ):
+            # 1-2. create the objects one by one 3-4. create the reviews and
+            # read their primary keys 5-6. the same for the reviewers
+            with self.assertNumQueries(6):
+                objs = TestModel.objects.bulk_create_with_reviews(
+                    [TestModel(name="Test 1"), TestModel(name="Test 2")],
+                    reviewers=[reviewer],
+                )
+
+        self.assertEqual(2, len(mock.call_args[0][0]))
+        for obj in objs:
+            self.assertIsNotNone(obj.pk)
+            self.assertFalse(obj._state.adding)  # pylint: disable=protected-access
+            review = ModelReview.objects.get(content_type=obj_type, object_id=obj.pk)
+            self.assertEqual(
+                [reviewer], [item.user for item in review.reviewer_set.all()]
+            )
+
+    @override_settings(
+        MODELREVIEW_EMAIL_DELIVERY_BACKEND="model_reviews.delivery.OutboxBackend"
+    )
+    def test_bulk_create_with_reviews_outbox(self):
+        """Test that the requests for review are stored in the outbox together."""
+        reviewers = [
+            mommy.make("auth.User", username=f"r{i}", email=f"r{i}@example.com")
+            for i in range(2)
+        ]
+        Site.objects.get_current()
+
+        # 1. create the objects 2. create the reviews 3. create the reviewers
+        # 4. store the emails
+        num_queries = 4
+        if not connection.features.can_return_rows_from_bulk_insert:
+            num_queries = 5 + 2 + 2 + 1
+        with self.assertNumQueries(num_queries):
+            TestModel.objects.bulk_create_with_reviews(
+                [TestModel(name=f"Test {i}") for i in range(5)], reviewers=reviewers
+            )
+        self.assertEqual(10, OutboxEmail.objects.count())
+        self.assertEqual(
+            {"r0 <r0@example.com>", "r1 <r1@example.com>"},
+            {email.to[0] for email in OutboxEmail.objects.all()},
+        )
+
+    @patch("tests.test_app.models.TestModel.request_for_review_function", None)
+    def test_bulk_create_with_reviews_no_request(self):
+        """Test creating in bulk when no request for review is sent."""
+        reviewer = mommy.make("auth.User", username="r1", email="r1@example.com")
+        with patch("model_reviews.emails.deliver") as mock:
+            TestModel.objects.bulk_create_with_reviews(
+                [TestModel(name="Test")], reviewers=[reviewer]
+            )
+        mock.assert_not_called()
+
+    def test_update_with_reviews(self):
+        """Test updating approvable objects in bulk."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        test_model2 = mommy.make("test_app.TestModel", name="Test 2")
+        obj_type = ContentType.objects.get_for_model(TestModel)
+        review2 = ModelReview.objects.get(
+            content_type=obj_type, object_id=test_model2.pk
+        )
+        review2.review_status = ModelReview.APPROVED
+        review2.save()
+
+        # fields that are not monitored are updated directly
+        self.assertEqual(2, TestModel.objects.update_with_reviews(name="Updated"))
+        self.assertEqual(2, TestModel.objects.filter(name="Updated").count())
+
+        # monitored fields of objects pending review go to the sandbox
+        count = TestModel.objects.update_with_reviews(
+            name="Updated again", review_status=ModelReview.REJECTED
+        )
+        self.assertEqual(2, count)
+
+        test_model.refresh_from_db()
+        self.assertEqual("Updated again", test_model.name)
+        self.assertEqual(ModelReview.PENDING, test_model.review_status)
+        review = ModelReview.objects.get(content_type=obj_type, object_id=test_model.pk)
+        self.assertEqual(
+            ModelReview.REJECTED, review.data[SANDBOX_FIELD]["review_status"]
+        )
+
+        # objects that are not pending review are updated directly
+        test_model2.refresh_from_db()
+        self.assertEqual("Updated again", test_model2.name)
+        self.assertEqual(ModelReview.REJECTED, test_model2.review_status)
+
+        with self.assertRaises(ValueError):
+            TestModel.objects.update_with_reviews(review_status=F("review_reason"))
+
+    def _get_reviewer_counts(self, review: ModelReview) -> dict:
+        """Get the reviewer counters of a review."""
+        return ModelReview.objects.filter(pk=review.pk).values(
+            *REVIEWER_COUNT_FIELDS
+        )[0]
+
+    def test_reviewer_counts(self):  # pylint: disable=too-many-statements
+        """Test the reviewer counters of ModelReview."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        user3 = mommy.make("auth.User", username="jenny")
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(test_model),
+            object_id=test_model.pk,
+        )
+        expected = {
+            "reviewer_count": 0,
+            "reviewed_count": 0,
+            "approved_count": 0,
+            "rejected_count": 0,
+            "min_level": None,
+            "max_level": None,
+            "top_level_reviewed_count": 0,
+        }
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        reviewer1 = mommy.make(
+            "model_reviews.Reviewer", user=user1, review=review, level=1
+        )
+        expected.update(reviewer_count=1, min_level=1, max_level=1)
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        # review at the highest level
+        reviewer1.reviewed = True
+        reviewer1.review_status = ModelReview.APPROVED
+        with self.assertNumQueries(2):
+            reviewer1.save()
+        expected.update(reviewed_count=1, approved_count=1, top_level_reviewed_count=1)
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        # saving without changes does not touch the counters
+        with self.assertNumQueries(1):
+            reviewer1.save()
+
+        # a new highest level
+        reviewer2 = mommy.make(
+            "model_reviews.Reviewer", user=user2, review=review, level=2
+        )
+        expected.update(reviewer_count=2, max_level=2, top_level_reviewed_count=0)
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        # a new lowest level, already reviewed
+        reviewer3 = mommy.make(
+            "model_reviews.Reviewer",
+            user=user3,
+            review=review,
+            level=0,
+            reviewed=True,
+            review_status=ModelReview.REJECTED,
+        )
+        expected.update(
+            reviewer_count=3, reviewed_count=2, rejected_count=1, min_level=0
+        )
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        # change a decision
+        reviewer2 = Reviewer.objects.get(pk=reviewer2.pk)
+        reviewer2.reviewed = True
+        reviewer2.review_status = ModelReview.REJECTED
+        reviewer2.save()
+        reviewer2.review_status = ModelReview.APPROVED
+        reviewer2.save()
+        expected.update(reviewed_count=3, approved_count=2, top_level_reviewed_count=1)
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        # changing the level counts the reviewers again
+        reviewer3.level = 2
+        reviewer3.save()
+        expected.update(min_level=1, top_level_reviewed_count=2)
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        reviewer2.delete()
+        expected.update(reviewer_count=2, reviewed_count=2, approved_count=1)
+        expected.update(top_level_reviewed_count=1)
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+        # counting from scratch gives the same result
+        ModelReview.objects.filter(pk=review.pk).update(
+            reviewer_count=0, reviewed_count=0, min_level=None, max_level=None
+        )
+        self.assertEqual(
+            1, ModelReview.objects.filter(pk=review.pk).recount_reviewers()
+        )
+        self.assertEqual(expected, self._get_reviewer_counts(review))
+
+    def test_update_review_counts(self):
+        """Test updating the reviewer counters of many reviews at once."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        objs = TestModel.objects.bulk_create_with_reviews(
+            [TestModel(name=f"Test {i}") for i in range(0, 3)], reviewers=[user1, user2]
+        )
+        reviews = list(
+            ModelReview.objects.filter(object_id__in=[obj.pk for obj in objs])
+        )
+        for review in reviews:
+            self.assertEqual(2, review.reviewer_count)
+            self.assertEqual(0, review.max_level)
+
+        reviewers = list(Reviewer.objects.filter(review__in=reviews))
+        for reviewer in reviewers:
+            reviewer.reviewed = True
+            reviewer.review_status = (
+                ModelReview.APPROVED if reviewer.user == user1 else ModelReview.REJECTED
+            )
+        Reviewer.objects.bulk_update(reviewers, ["reviewed", "review_status"])
+        # all the reviews have the same difference
+        with self.assertNumQueries(1):
+            Reviewer.update_review_counts(reviewers)
+        for review in reviews:
+            self.assertEqual(
+                {
+                    "reviewer_count": 2,
+                    "reviewed_count": 2,
+                    "approved_count": 1,
+                    "rejected_count": 1,
+                    "min_level": 0,
+                    "max_level": 0,
+                    "top_level_reviewed_count": 2,
+                },
+                self._get_reviewer_counts(review),
+            )
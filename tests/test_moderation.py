@@ -0,0 +1,159 @@
+"""Test moderation."""
+from threading import Thread
+
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from model_mommy import mommy
+
+from model_reviews.constants import SANDBOX_FIELD
+from model_reviews.models import ModelReview
+from model_reviews.moderation import (
+    _ThreadLocalVar,
+    is_moderation_skipped,
+    skip_moderation,
+    skip_object_moderation,
+)
+
+from .test_app.models import TestModel, TestModel2
+
+
+class TestModeration(TestCase):
+    """Test class for moderation."""
+
+    def test_skip_moderation(self):
+        """Test that changes are saved directly while moderation is skipped."""
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        obj_type = ContentType.objects.get_for_model(test_model)
+
+        test_model.review_status = ModelReview.APPROVED
+        with skip_moderation():
+            # only the object is written
+            with self.assertNumQueries(1):
+                test_model.save()
+        test_model.refresh_from_db()
+        self.assertEqual(ModelReview.APPROVED, test_model.review_status)
+        review = ModelReview.objects.get(content_type=obj_type, object_id=test_model.pk)
+        sandbox = review.data[SANDBOX_FIELD]
+        self.assertEqual(ModelReview.PENDING, sandbox["review_status"])
+
+        # moderation is back afterwards
+        test_model.review_status = ModelReview.REJECTED
+        test_model.save()
+        test_model.refresh_from_db()
+        self.assertEqual(ModelReview.APPROVED, test_model.review_status)
+        review.refresh_from_db()
+        sandbox = review.data[SANDBOX_FIELD]
+        self.assertEqual(ModelReview.REJECTED, sandbox["review_status"])
+
+        # new objects are created without a review
+        with skip_moderation(TestModel):
+            test_model = mommy.make("test_app.TestModel", name="Test 2")
+        self.assertFalse(
+            ModelReview.objects.filter(
+                content_type=obj_type, object_id=test_model.pk
+            ).exists()
+        )
+
+    def test_skip_moderation_models(self):
+        """Test skipping the moderation of some models."""
+        self.assertFalse(is_moderation_skipped(TestModel))
+        with skip_moderation(TestModel):
+            self.assertTrue(is_moderation_skipped(TestModel))
+            self.assertFalse(is_moderation_skipped(TestModel2))
+            with skip_moderation(TestModel2):
+                self.assertTrue(is_moderation_skipped(TestModel))
+                self.assertTrue(is_moderation_skipped(TestModel2))
+            self.assertFalse(is_moderation_skipped(TestModel2))
+            with skip_moderation():
+                self.assertTrue(is_moderation_skipped(TestModel2))
+            # skipping a model inside skipping all models skips all of them
+            with skip_moderation(), skip_moderation(TestModel):
+                self.assertTrue(is_moderation_skipped(TestModel2))
+        self.assertFalse(is_moderation_skipped(TestModel))
+
+    def test_skip_object_moderation(self):
+        """Test skipping the moderation of some objects."""
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        other = mommy.make("test_app.TestModel", name="Other")
+        obj_type = ContentType.objects.get_for_model(test_model)
+
+        with skip_object_moderation(test_model):
+            self.assertTrue(is_moderation_skipped(TestModel, test_model))
+            self.assertFalse(is_moderation_skipped(TestModel, other))
+            self.assertFalse(is_moderation_skipped(TestModel))
+            with skip_object_moderation(other):
+                self.assertTrue(is_moderation_skipped(TestModel, test_model))
+                self.assertTrue(is_moderation_skipped(TestModel, other))
+            self.assertFalse(is_moderation_skipped(TestModel, other))
+
+            test_model.review_status = ModelReview.APPROVED
+            test_model.save()
+            other.review_status = ModelReview.APPROVED
+            other.save()
+            # new objects are still moderated
+            new = mommy.make("test_app.TestModel", name="New")
+        self.assertFalse(is_moderation_skipped(TestModel, test_model))
+
+        test_model.refresh_from_db()
+        self.assertEqual(ModelReview.APPROVED, test_model.review_status)
+        other.refresh_from_db()
+        self.assertEqual(ModelReview.PENDING, other.review_status)
+        self.assertTrue(
+            ModelReview.objects.filter(content_type=obj_type, object_id=new.pk).exists()
+        )
+
+    def test_skip_moderation_decorator(self):
+        """Test using skip_moderation as a decorator."""
+
+        @skip_moderation(TestModel)
+        def func(depth: int):
+            self.assertTrue(is_moderation_skipped(TestModel))
+            if depth:
+                func(depth - 1)
+            self.assertTrue(is_moderation_skipped(TestModel))
+
+        func(2)
+        self.assertFalse(is_moderation_skipped(TestModel))
+
+        # moderation is not skipped after an exception
+        @skip_moderation()
+        def fail():
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            fail()
+        self.assertFalse(is_moderation_skipped(TestModel))
+
+    def test_skip_moderation_context(self):
+        """Test that moderation is only skipped in the current context."""
+        results = []
+
+        def check():
+            results.append(is_moderation_skipped(TestModel))
+
+        with skip_moderation():
+            thread = Thread(target=check)
+            thread.start()
+            thread.join()
+        self.assertEqual([False], results)
+
+    def test_thread_local_var(self):
+        """Test the stand-in for ContextVar used on Python 3.6."""
+        var = _ThreadLocalVar()
+        self.assertIsNone(var.get())
+        token = var.set((TestModel,))
+        self.assertEqual((TestModel,), var.get())
+        inner_token = var.set(())
+        self.assertEqual((), var.get())
+        var.reset(inner_token)
+        self.assertEqual((TestModel,), var.get())
+        var.reset(token)
+        self.assertIsNone(var.get())
+
+        results = []
+        var.set(())
+        thread = Thread(target=lambda: results.append(var.get()))
+        thread.start()
+        thread.join()
+        self.assertEqual([None], results)
@@ -0,0 +1,52 @@
+"""Test pagination."""
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from model_mommy import mommy
+
+from model_reviews.models import ModelReview
+from model_reviews.pagination import decode_cursor, encode_cursor, paginate_reviews
+
+
+class TestPagination(TestCase):
+    """Test class for pagination."""
+
+    def test_cursor(self):
+        """Test encoding and decoding cursors."""
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(test_model),
+            object_id=test_model.id,
+        )
+        self.assertEqual(
+            (review.created, review.pk), decode_cursor(encode_cursor(review))
+        )
+        for cursor in (None, "", "nope", "bm9wZXxub3Bl", "MjAyMHwx"):
+            self.assertIsNone(decode_cursor(cursor))
+
+    def test_paginate_reviews(self):
+        """Test paginating reviews."""
+        for _ in range(0, 5):
+            mommy.make("test_app.TestModel", name="Test")
+        reviews = list(ModelReview.objects.order_by("created", "pk"))
+
+        # an invalid cursor gives the first page
+        for cursor in (None, "nope"):
+            page = paginate_reviews(
+                ModelReview.objects.all(), cursor=cursor, page_size=2
+            )
+            self.assertEqual(reviews[:2], page.object_list)
+            self.assertTrue(page.has_next)
+
+        with self.assertNumQueries(1):
+            page = paginate_reviews(
+                ModelReview.objects.all(), cursor=page.next_cursor, page_size=2
+            )
+        self.assertEqual(reviews[2:4], page.object_list)
+
+        page = paginate_reviews(
+            ModelReview.objects.all(), cursor=page.next_cursor, page_size=2
+        )
+        self.assertEqual(reviews[4:], page.object_list)
+        self.assertFalse(page.has_next)
+        self.assertIsNone(page.next_cursor)
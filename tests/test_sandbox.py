@@ -0,0 +1,213 @@
+"""Test sandbox."""
+from datetime import datetime
+from io import StringIO
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+
+import pytz
+from model_mommy import mommy
+
+from model_reviews.constants import SANDBOX_FIELD, SANDBOX_PROPOSED_FIELD
+from model_reviews.models import ModelReview, SandboxField, SandboxRevision
+from model_reviews.sandbox import (
+    FieldSandboxBackend,
+    JSONSandboxBackend,
+    get_sandbox_backend,
+)
+
+from .test_app.models import TestModel
+
+FIELD_BACKEND = "model_reviews.sandbox.FieldSandboxBackend"
+
+
+def _get_review(obj) -> ModelReview:
+    """Get the review of an approvable object."""
+    return ModelReview.objects.get(
+        content_type=ContentType.objects.get_for_model(obj), object_id=obj.pk
+    )
+
+
+class TestSandbox(TestCase):
+    """Test class for sandbox."""
+
+    def test_get_sandbox_backend(self):
+        """Test get_sandbox_backend."""
+        self.assertIsInstance(get_sandbox_backend(), JSONSandboxBackend)
+        with override_settings(MODELREVIEW_SANDBOX_BACKEND=FIELD_BACKEND):
+            self.assertIsInstance(get_sandbox_backend(), FieldSandboxBackend)
+        self.assertIsInstance(get_sandbox_backend(), JSONSandboxBackend)
+
+    def test_filter_sandbox_field(self):
+        """Test filtering reviews by the fields in their sandbox."""
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        review = _get_review(test_model)
+        self.assertEqual(
+            [review], list(ModelReview.objects.filter_sandbox_field("review_status"))
+        )
+        self.assertEqual([], list(ModelReview.objects.filter_sandbox_field("name")))
+
+    @override_settings(MODELREVIEW_SANDBOX_BACKEND=FIELD_BACKEND)
+    def test_field_backend(self):
+        """Test storing sandboxes as a row for each field."""
+        mocked_now = datetime(2010, 1, 1, 10, 30, 15, 123000, tzinfo=pytz.utc)
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        review = _get_review(test_model)
+        self.assertEqual({}, review.data)
+        self.assertEqual(
+            {
+                "review_status": (ModelReview.PENDING, ModelReview.PENDING, False),
+                "review_date": (None, None, False),
+            },
+            {
+                row.field_name: (row.old_value, row.new_value, row.proposed)
+                for row in review.sandbox_fields.all()
+            },
+        )
+        self.assertEqual(
+            [review], list(ModelReview.objects.filter_sandbox_field("review_status"))
+        )
+        self.assertEqual([], list(ModelReview.objects.filter_sandbox_field("name")))
+
+        # 1. load the review 2. load the sandbox 3. update the review
+        # 4. update the changed row 5. save the object
+        test_model.review_date = mocked_now
+        with self.assertNumQueries(5):
+            test_model.save()
+        # the change went to the sandbox
+        test_model.refresh_from_db()
+        self.assertIsNone(test_model.review_date)
+        review = _get_review(test_model)
+        self.assertEqual(
+            {"review_status": ModelReview.PENDING, "review_date": mocked_now},
+            review.get_sandbox_values(source=test_model),
+        )
+        row = SandboxField.objects.get(review=review, field_name="review_date")
+        self.assertIsNone(row.old_value)
+        self.assertEqual({"review_date"}, review.get_proposed_fields())
+        self.assertEqual(mocked_now, review.get_sandbox_values()["review_date"])
+        self.assertEqual(["review_date"], review.get_diff(source=test_model))
+
+        # only the changed rows are written
+        test_model.review_status = ModelReview.REJECTED
+        test_model.save()
+        review = _get_review(test_model)
+        self.assertEqual(ModelReview.REJECTED, review.get_sandbox()["review_status"])
+        row = SandboxField.objects.get(review=review, field_name="review_status")
+        self.assertEqual(
+            (ModelReview.PENDING, ModelReview.REJECTED), (row.old_value, row.new_value)
+        )
+        self.assertEqual(2, SandboxField.objects.filter(review=review).count())
+
+    @override_settings(MODELREVIEW_SANDBOX_BACKEND=FIELD_BACKEND)
+    def test_field_backend_bulk(self):
+        """Test storing sandboxes as rows when reviews are changed in bulk."""
+        # 1. create the objects 2. create the reviews 3. create the sandbox rows
+        num_queries = 3
+        if not connection.features.can_return_rows_from_bulk_insert:
+            # each object is inserted on its own, and the primary keys of the
+            # reviews are read back
+            num_queries = 3 + 2 + 1
+        with self.assertNumQueries(num_queries):
+            objs = TestModel.objects.bulk_create_with_reviews(
+                [TestModel(name=f"Test {i}") for i in range(3)], reviewers=[]
+            )
+        self.assertEqual(6, SandboxField.objects.count())
+
+        TestModel.objects.update_with_reviews(review_status=ModelReview.APPROVED)
+        for obj in objs:
+            review = _get_review(obj)
+            self.assertEqual({}, review.data)
+            self.assertEqual(
+                {"review_status": ModelReview.APPROVED, "review_date": None},
+                review.get_sandbox(),
+            )
+            self.assertEqual({"review_status"}, review.get_proposed_fields())
+        self.assertEqual(6, SandboxField.objects.count())
+
+    def test_json_backend(self):
+        """Test that the JSON backend keeps the sandbox in the data field."""
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        test_model.review_status = ModelReview.REJECTED
+        test_model.save()
+        review = _get_review(test_model)
+        self.assertEqual(
+            {"review_status": ModelReview.REJECTED, "review_date": None},
+            review.data[SANDBOX_FIELD],
+        )
+        self.assertEqual(review.data[SANDBOX_FIELD], review.get_sandbox())
+        self.assertEqual(["review_status"], review.data[SANDBOX_PROPOSED_FIELD])
+        self.assertFalse(SandboxField.objects.exists())
+
+    @override_settings(MODELREVIEW_SANDBOX_REVISIONS=True)
+    def test_revisions(self):
+        """Test the revision log of sandboxes."""
+        mocked_now = datetime(2010, 1, 1, 10, 30, 15, 123000, tzinfo=pytz.utc)
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        test_model.review_date = mocked_now
+        test_model.save()
+        # the instance was reverted, so the date is submitted again
+        test_model.review_date = mocked_now
+        test_model.review_status = ModelReview.REJECTED
+        test_model.save()
+        # nothing changed, so there is no new revision
+        test_model.save()
+
+        review = _get_review(test_model)
+        self.assertEqual(3, review.revision)
+        # only the values that changed are stored
+        self.assertEqual(
+            [
+                (1, {"review_status": ModelReview.PENDING, "review_date": None}),
+                (2, {"review_date": "2010-01-01T10:30:15.123Z"}),
+                (3, {"review_status": ModelReview.REJECTED}),
+            ],
+            [
+                (revision.number, revision.changes)
+                for revision in review.revisions.order_by("number")
+            ],
+        )
+        versions = {
+            1: {"review_status": ModelReview.PENDING, "review_date": None},
+            2: {
+                "review_status": ModelReview.PENDING,
+                "review_date": "2010-01-01T10:30:15.123Z",
+            },
+            3: {
+                "review_status": ModelReview.REJECTED,
+                "review_date": "2010-01-01T10:30:15.123Z",
+            },
+        }
+        with self.assertNumQueries(1):
+            self.assertEqual(versions[1], review.get_sandbox_version(1))
+        self.assertEqual(versions[2], review.get_sandbox_version(2))
+        self.assertEqual(versions[3], review.get_sandbox_version())
+        self.assertEqual(review.get_sandbox(), review.get_sandbox_version())
+
+        # merge all but the latest revision
+        out = StringIO()
+        call_command("compact_review_revisions", keep=1, stdout=out)
+        self.assertEqual("Merged 1 revision(s).", out.getvalue().strip())
+        numbers = review.revisions.order_by("number").values_list("number", flat=True)
+        self.assertEqual([2, 3], list(numbers))
+        # the merged revision gives the values of the revision it was merged into
+        with self.assertNumQueries(1):
+            self.assertEqual(versions[2], review.get_sandbox_version(1))
+        self.assertEqual(versions[2], review.get_sandbox_version(2))
+        self.assertEqual(versions[3], review.get_sandbox_version(3))
+        # there is nothing left to merge
+        self.assertEqual(0, ModelReview.objects.compact_revisions(keep=1))
+        self.assertEqual(1, ModelReview.objects.compact_revisions(keep=0))
+        self.assertEqual(versions[3], review.get_sandbox_version())
+        self.assertEqual(versions[3], review.get_sandbox_version(1))
+        self.assertEqual(versions[3], review.get_sandbox_version(4))
+
+    def test_revisions_off(self):
+        """Test that revisions are only added when they are turned on."""
+        test_model = mommy.make("test_app.TestModel", name="Test")
+        test_model.review_status = ModelReview.REJECTED
+        test_model.save()
+        self.assertEqual(2, _get_review(test_model).revision)
+        self.assertFalse(SandboxRevision.objects.exists())
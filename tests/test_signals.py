@@ -0,0 +1,192 @@
+"""Test signals."""
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+from django.db.models.signals import post_save, pre_save
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from model_mommy import mommy
+
+from model_reviews.constants import SANDBOX_FIELD
+from model_reviews.models import ModelReview
+from model_reviews.signals import (
+    SAVED_VALUE_PREFIX,
+    approvable_after_save,
+    approvable_before_save,
+    get_approvable_models,
+    register_approvable,
+    unregister_approvable,
+)
+
+from .test_app.models import TestModel, TestModel2
+
+
+def _get_receivers(signal, sender):
+    """Get the live receivers of a signal for a sender."""
+    return signal._live_receivers(sender)  # pylint: disable=protected-access
+
+
+class TestSignals(TestCase):
+    """Test class for signals."""
+
+    def test_approvable_models_discovered(self):
+        """Test that approvable models are registered when the app is ready."""
+        self.assertIn(TestModel, get_approvable_models())
+        self.assertIn(TestModel2, get_approvable_models())
+        self.assertNotIn(ModelReview, get_approvable_models())
+        self.assertIn(approvable_before_save, _get_receivers(pre_save, TestModel))
+        self.assertIn(approvable_after_save, _get_receivers(post_save, TestModel))
+
+    def test_other_models_not_connected(self):
+        """Test that models that are not under review have no moderation receivers."""
+        self.assertNotIn(approvable_before_save, _get_receivers(pre_save, User))
+        self.assertNotIn(approvable_after_save, _get_receivers(post_save, User))
+
+    def test_register_approvable(self):
+        """Test registering and unregistering approvable models."""
+        obj_type = ContentType.objects.get_for_model(TestModel)
+        unregister_approvable(TestModel)
+        try:
+            self.assertNotIn(TestModel, get_approvable_models())
+            test_model = mommy.make("test_app.TestModel", name="Test 1")
+            self.assertFalse(
+                ModelReview.objects.filter(
+                    content_type=obj_type, object_id=test_model.id
+                ).exists()
+            )
+        finally:
+            register_approvable(TestModel)
+            # registering more than once is harmless
+            register_approvable(TestModel)
+
+        self.assertEqual(
+            1, _get_receivers(pre_save, TestModel).count(approvable_before_save)
+        )
+        test_model = mommy.make("test_app.TestModel", name="Test 2")
+        self.assertTrue(
+            ModelReview.objects.filter(
+                content_type=obj_type, object_id=test_model.id
+            ).exists()
+        )
+
+    def test_register_approvable_invalid(self):
+        """Test that only approvable models can be registered."""
+        with self.assertRaises(ImproperlyConfigured):
+            register_approvable(User)
+        with self.assertRaises(ImproperlyConfigured):
+            register_approvable(ModelReview)
+
+    def test_approvable_before_save_queries(self):
+        """Test the number of queries used to update an approvable object."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        test_model = TestModel.objects.get(pk=test_model.pk)
+        test_model.review_status = TestModel.APPROVED
+        # 1. get the review 2. update the sandbox 3. save the source
+        with CaptureQueriesContext(connection) as context:
+            test_model.save()
+        self.assertEqual(3, len(context.captured_queries))
+        # the saved values of the source are known, so they are not loaded
+        self.assertNotIn(SAVED_VALUE_PREFIX, context.captured_queries[0]["sql"])
+
+        # otherwise they are loaded together with the review
+        test_model = TestModel.objects.defer("review_status").get(pk=test_model.pk)
+        test_model.review_status = TestModel.REJECTED
+        with CaptureQueriesContext(connection) as context:
+            test_model.save()
+        self.assertEqual(3, len(context.captured_queries))
+        self.assertIn(SAVED_VALUE_PREFIX, context.captured_queries[0]["sql"])
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(TestModel),
+            object_id=test_model.pk,
+        )
+        self.assertEqual(TestModel.REJECTED, review.data[SANDBOX_FIELD]["review_status"])
+        test_model.refresh_from_db()
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+
+    def test_approvable_before_save_hooks(self):
+        """Test that updating an approvable object only runs set_user_function."""
+        user = mommy.make("auth.User", username="joe")
+        # set_reviewers would add this user as a reviewer
+        boss = mommy.make("auth.User", username="finalboss")
+        test_model = mommy.make("test_app.TestModel2", name="Test 1")
+        review = ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(TestModel2),
+            object_id=test_model.pk,
+        )
+        self.assertIsNone(review.user)
+        review.reviewer_set.all().delete()
+
+        test_model.review_status = TestModel2.APPROVED
+        test_model.user = user
+        # 1. get the review 2. update the sandbox 3. save the source
+        with self.assertNumQueries(3):
+            test_model.save()
+        review.refresh_from_db()
+        self.assertEqual(user, review.user)
+        self.assertEqual(
+            TestModel2.APPROVED, review.data[SANDBOX_FIELD]["review_status"]
+        )
+        self.assertFalse(review.reviewer_set.filter(user=boss).exists())
+
+    def test_approvable_before_save_unchanged(self):
+        """Test that saves without monitored changes do not query reviews."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        test_model.review_status = TestModel.APPROVED
+        test_model.save()
+        obj_type = ContentType.objects.get_for_model(TestModel)
+        review = ModelReview.objects.get(content_type=obj_type, object_id=test_model.pk)
+        self.assertEqual(TestModel.APPROVED, review.data[SANDBOX_FIELD]["review_status"])
+
+        # only the source is saved, and the pending change is kept
+        test_model = TestModel.objects.get(pk=test_model.pk)
+        test_model.name = "Test 2"
+        with self.assertNumQueries(1):
+            test_model.save()
+        review.refresh_from_db()
+        self.assertEqual(TestModel.APPROVED, review.data[SANDBOX_FIELD]["review_status"])
+
+        # monitored fields that are not being saved are not checked
+        test_model.review_status = TestModel.REJECTED
+        with self.assertNumQueries(1):
+            test_model.save(update_fields=["name"])
+        review.refresh_from_db()
+        self.assertEqual(TestModel.APPROVED, review.data[SANDBOX_FIELD]["review_status"])
+
+        # the saved values are not known for new instances
+        test_model = TestModel(pk=test_model.pk, name="Test 3")
+        with self.assertNumQueries(3):
+            test_model.save()
+        self.assertEqual(TestModel.PENDING, test_model.review_status)
+        with self.assertNumQueries(1):
+            test_model.save()
+
+    def test_approvable_before_save_missing_review(self):
+        """Test updating an approvable object that does not have a review."""
+        test_model = mommy.make("test_app.TestModel", name="Test 1")
+        obj_type = ContentType.objects.get_for_model(TestModel)
+        ModelReview.objects.filter(
+            content_type=obj_type, object_id=test_model.pk
+        ).delete()
+
+        # saving unmonitored fields does not need the review
+        test_model.name = "Test 2"
+        with self.assertNumQueries(1):
+            test_model.save()
+        self.assertFalse(
+            ModelReview.objects.filter(
+                content_type=obj_type, object_id=test_model.pk
+            ).exists()
+        )
+
+        test_model.review_status = TestModel.APPROVED
+        test_model.save()
+
+        self.assertTrue(
+            ModelReview.objects.filter(
+                content_type=obj_type, object_id=test_model.pk
+            ).exists()
+        )
@@ -0,0 +1,483 @@
+"""Test utils."""
+from datetime import datetime
+from unittest.mock import patch
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+
+import pytz
+from model_mommy import mommy
+
+from model_reviews.models import ModelReview, Reviewer
+from model_reviews.moderation import is_moderation_skipped, skip_moderation
+from model_reviews.utils import (
+    annotate_review_decisions,
+    apply_review,
+    perform_bulk_review,
+    perform_review,
+)
+
+from .test_app.models import TestModel
+
+# monitor a field that is not changed by reviews
+NAME_MONITORED_FIELDS = ["review_status", "review_date", "name"]
+SANDBOX_BACKENDS = [
+    "model_reviews.sandbox.JSONSandboxBackend",
+    "model_reviews.sandbox.FieldSandboxBackend",
+]
+
+
+class TestUtils(TestCase):
+    """Test class for utils."""
+
+    def _make_review(self, name: str = "Test") -> ModelReview:
+        """Make an object to be reviewed and return its review."""
+        test_model = mommy.make("test_app.TestModel", name=name)
+        return ModelReview.objects.get(
+            content_type=ContentType.objects.get_for_model(test_model),
+            object_id=test_model.id,
+        )
+
+    def test_annotate_review_decisions(self):
+        """Test annotate_review_decisions."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        date1 = datetime(2010, 1, 1, tzinfo=pytz.timezone(settings.TIME_ZONE))
+        date2 = datetime(2010, 1, 2, tzinfo=pytz.timezone(settings.TIME_ZONE))
+
+        # no reviewers
+        review1 = self._make_review()
+        # same level, the most recent decision counts
+        review2 = self._make_review()
+        mommy.make(
+            "model_reviews.Reviewer",
+            user=user1,
+            review=review2,
+            reviewed=True,
+            review_date=date1,
+            review_status=ModelReview.REJECTED,
+        )
+        mommy.make(
+            "model_reviews.Reviewer",
+            user=user2,
+            review=review2,
+            reviewed=True,
+            review_date=date2,
+            review_status=ModelReview.APPROVED,
+        )
+        # different levels, only the highest level has not reviewed
+        review3 = self._make_review()
+        mommy.make(
+            "model_reviews.Reviewer",
+            user=user1,
+            review=review3,
+            level=1,
+            reviewed=True,
+            review_date=date1,
+            review_status=ModelReview.APPROVED,
+        )
+        mommy.make("model_reviews.Reviewer", user=user2, review=review3, level=2)
+
+        with self.assertNumQueries(1):
+            reviews = {
+                review.pk: review
+                for review in annotate_review_decisions(ModelReview.objects.all())
+            }
+        self.assertEqual(
+            (None, None, None, None),
+            (
+                reviews[review1.pk].decision_min_level,
+                reviews[review1.pk].decision_max_level,
+                reviews[review1.pk].decision_status,
+                reviews[review1.pk].decision_date,
+            ),
+        )
+        self.assertEqual(
+            (0, 0, ModelReview.APPROVED, date2),
+            (
+                reviews[review2.pk].decision_min_level,
+                reviews[review2.pk].decision_max_level,
+                reviews[review2.pk].decision_status,
+                reviews[review2.pk].decision_date,
+            ),
+        )
+        self.assertEqual(
+            (1, 2, None, None),
+            (
+                reviews[review3.pk].decision_min_level,
+                reviews[review3.pk].decision_max_level,
+                reviews[review3.pk].decision_status,
+                reviews[review3.pk].decision_date,
+            ),
+        )
+
+    def test_perform_review_same_level(self):
+        """Test perform_review when all the reviewers are the same level."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        date1 = datetime(2010, 1, 1, tzinfo=pytz.timezone(settings.TIME_ZONE))
+        date2 = datetime(2010, 1, 2, tzinfo=pytz.timezone(settings.TIME_ZONE))
+        review = self._make_review()
+        reviewer1 = mommy.make("model_reviews.Reviewer", user=user1, review=review)
+        reviewer2 = mommy.make("model_reviews.Reviewer", user=user2, review=review)
+
+        # nobody has reviewed
+        with patch.object(review, "save") as save_mock:
+            with self.assertNumQueries(1):
+                perform_review(review)
+        save_mock.assert_not_called()
+        self.assertEqual(ModelReview.PENDING, review.review_status)
+
+        # the most recent decision counts
+        Reviewer.objects.filter(pk=reviewer1.pk).update(
+            reviewed=True, review_date=date2, review_status=ModelReview.REJECTED
+        )
+        Reviewer.objects.filter(pk=reviewer2.pk).update(
+            reviewed=True, review_date=date1, review_status=ModelReview.APPROVED
+        )
+        with patch.object(review, "save") as save_mock:
+            with self.assertNumQueries(1):
+                perform_review(review)
+        save_mock.assert_called_once_with()
+        self.assertEqual(ModelReview.REJECTED, review.review_status)
+        self.assertEqual(date2, review.review_date)
+
+    @patch("tests.test_app.models.get_next_reviewers")
+    def test_perform_review_tiered(self, next_mock):
+        """Test perform_review when the reviewers are of different levels."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        user3 = mommy.make("auth.User", username="jenny")
+        date1 = datetime(2010, 1, 1, tzinfo=pytz.timezone(settings.TIME_ZONE))
+        date2 = datetime(2010, 1, 2, tzinfo=pytz.timezone(settings.TIME_ZONE))
+        review = self._make_review()
+        self.assertIsNotNone(review.content_object)
+        mommy.make(
+            "model_reviews.Reviewer",
+            user=user1,
+            review=review,
+            level=1,
+            reviewed=True,
+            review_date=date2,
+            review_status=ModelReview.APPROVED,
+        )
+        reviewer2 = mommy.make(
+            "model_reviews.Reviewer", user=user2, review=review, level=2
+        )
+        reviewer3 = mommy.make(
+            "model_reviews.Reviewer", user=user3, review=review, level=2
+        )
+
+        # only a lower level reviewer has reviewed
+        with patch.object(review, "save") as save_mock:
+            with self.assertNumQueries(1):
+                perform_review(review)
+        save_mock.assert_not_called()
+        next_mock.assert_called_once_with(review_obj=review)
+        self.assertEqual(ModelReview.PENDING, review.review_status)
+
+        # the most recent decision at the highest level counts
+        Reviewer.objects.filter(pk=reviewer2.pk).update(
+            reviewed=True, review_date=date1, review_status=ModelReview.REJECTED
+        )
+        Reviewer.objects.filter(pk=reviewer3.pk).update(
+            reviewed=False, review_date=date2, review_status=ModelReview.APPROVED
+        )
+        next_mock.reset_mock()
+        with patch.object(review, "save") as save_mock:
+            with self.assertNumQueries(1):
+                perform_review(review)
+        save_mock.assert_called_once_with()
+        next_mock.assert_not_called()
+        self.assertEqual(ModelReview.REJECTED, review.review_status)
+        self.assertEqual(date1, review.review_date)
+
+    @patch("tests.test_app.models.get_next_reviewers")
+    def test_perform_review_counted(self, next_mock):
+        """Test perform_review with the reviewer who has just reviewed."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        review = self._make_review()
+        self.assertIsNotNone(review.content_object)
+        reviewer1 = mommy.make(
+            "model_reviews.Reviewer", user=user1, review=review, level=1
+        )
+        reviewer2 = mommy.make(
+            "model_reviews.Reviewer", user=user2, review=review, level=2
+        )
+
+        # the decision is worked out without going through the reviewers
+        reviewer1.reviewed = True
+        reviewer1.review_status = ModelReview.APPROVED
+        reviewer1.save()
+        with patch.object(review, "save") as save_mock:
+            with self.assertNumQueries(1):
+                perform_review(review, reviewer=reviewer1)
+        save_mock.assert_not_called()
+        next_mock.assert_called_once_with(review_obj=review)
+
+        reviewer2.reviewed = True
+        reviewer2.review_status = ModelReview.REJECTED
+        reviewer2.review_date = datetime(
+            2010, 1, 1, tzinfo=pytz.timezone(settings.TIME_ZONE)
+        )
+        reviewer2.save()
+        with patch.object(review, "save") as save_mock:
+            with self.assertNumQueries(1):
+                perform_review(review, reviewer=reviewer2)
+        save_mock.assert_called_once_with()
+        self.assertEqual(ModelReview.REJECTED, review.review_status)
+        self.assertEqual(reviewer2.review_date, review.review_date)
+
+        # a lower level reviewer after the highest level has decided
+        reviewer1.review_status = ModelReview.REJECTED
+        reviewer1.save()
+        with patch.object(review, "save") as save_mock:
+            with self.assertNumQueries(2):
+                perform_review(review, reviewer=reviewer1)
+        save_mock.assert_called_once_with()
+        self.assertEqual(ModelReview.REJECTED, review.review_status)
+
+    def test_perform_review_uncounted(self):
+        """Test perform_review when the reviewers were not counted."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        reviews = [self._make_review(name=f"Test {i}") for i in range(0, 2)]
+        # bulk_create does not send the signals that count the reviewers
+        Reviewer.objects.bulk_create(
+            [
+                Reviewer(user=user1, review=reviews[0]),
+                Reviewer(user=user2, review=reviews[1]),
+            ]
+        )
+        reviewer = Reviewer.objects.get(review=reviews[0])
+        reviewer.reviewed = True
+        reviewer.review_status = ModelReview.APPROVED
+        reviewer.save()
+        perform_review(reviews[0], reviewer=reviewer)
+        reviews[0].refresh_from_db()
+        self.assertIsNone(reviews[0].max_level)
+        self.assertEqual(ModelReview.APPROVED, reviews[0].review_status)
+
+        other_reviewer = Reviewer.objects.get(review=reviews[1])
+        completed = perform_bulk_review([(other_reviewer, ModelReview.REJECTED)])
+        self.assertEqual([reviews[1].pk], [review.pk for review in completed])
+        reviews[1].refresh_from_db()
+        self.assertEqual(ModelReview.REJECTED, reviews[1].review_status)
+
+    @patch("tests.test_app.models.get_next_reviewers")
+    def test_perform_review_stale_counters(self, next_mock):
+        """Test perform_review when reviewers were added without counting them."""
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+        review = self._make_review()
+        reviewer1 = mommy.make(
+            "model_reviews.Reviewer", user=user1, review=review, level=0
+        )
+        # the counters still say that the highest level is 0
+        Reviewer.objects.bulk_create([Reviewer(user=user2, review=review, level=1)])
+
+        reviewer1.reviewed = True
+        reviewer1.review_status = ModelReview.APPROVED
+        reviewer1.save()
+        with self.assertNumQueries(2):
+            perform_review(review, reviewer=reviewer1)
+        next_mock.assert_called_once_with(review_obj=review)
+        review.refresh_from_db()
+        self.assertEqual(ModelReview.PENDING, review.review_status)
+
+    @patch("tests.test_app.models.get_next_reviewers")
+    def test_perform_review_no_reviewers(self, next_mock):
+        """Test perform_review when the review has no reviewers."""
+        review = self._make_review()
+        perform_review(review)
+        next_mock.assert_called_once_with(review_obj=review)
+        self.assertEqual(ModelReview.PENDING, review.review_status)
+
+    @patch("tests.test_app.models.get_next_reviewers")
+    @patch("django.utils.timezone.now")
+    def test_perform_bulk_review(self, mock, next_mock):
+        """Test perform_bulk_review."""
+        mocked_now = datetime(2010, 1, 1, tzinfo=pytz.timezone(settings.TIME_ZONE))
+        mock.return_value = mocked_now
+
+        user1 = mommy.make("auth.User", username="joe")
+        user2 = mommy.make("auth.User", username="jane")
+
+        reviews = [self._make_review(name=f"Test {i}") for i in range(0, 10)]
+        reviewers = [
+            mommy.make("model_reviews.Reviewer", user=user1, review=review)
+            for review in reviews
+        ]
+        # the last review needs a higher level review
+        tiered_review = self._make_review(name="Tiered")
+        tiered_reviewer = mommy.make(
+            "model_reviews.Reviewer", user=user1, review=tiered_review, level=1
+        )
+        mommy.make("model_reviews.Reviewer", user=user2, review=tiered_review, level=2)
+
+        decisions = [(reviewer, ModelReview.APPROVED) for reviewer in reviewers[:-1]]
+        decisions.append((reviewers[-1], ModelReview.REJECTED))
+        decisions.append((tiered_reviewer, ModelReview.APPROVED))
+
+        with patch("model_reviews.utils.process_review") as process_mock:
+            completed = perform_bulk_review(decisions)
+        self.assertEqual(10, process_mock.call_count)
+        next_mock.assert_called_once_with(review_obj=tiered_review)
+        self.assertEqual([review.pk for review in reviews], [r.pk for r in completed])
+
+        for reviewer in Reviewer.objects.filter(user=user1):
+            self.assertTrue(reviewer.reviewed)
+            self.assertEqual(mocked_now, reviewer.review_date)
+        for review in ModelReview.objects.filter(pk__in=[r.pk for r in reviews[:-1]]):
+            self.assertEqual(ModelReview.APPROVED, review.review_status)
+            self.assertEqual(mocked_now, review.review_date)
+        reviews[-1].refresh_from_db()
+        self.assertEqual(ModelReview.REJECTED, reviews[-1].review_status)
+        tiered_review.refresh_from_db()
+        self.assertEqual(ModelReview.PENDING, tiered_review.review_status)
+
+        self.assertEqual([], perform_bulk_review([]))
+
+    def test_perform_bulk_review_process(self):
+        """Test that perform_bulk_review processes the completed reviews."""
+        user = mommy.make("auth.User", username="joe")
+        reviews = [self._make_review(name=f"Test {i}") for i in range(0, 3)]
+        decisions = [
+            (
+                mommy.make("model_reviews.Reviewer", user=user, review=review),
+                ModelReview.APPROVED,
+            )
+            for review in reviews
+        ]
+        perform_bulk_review(decisions)
+        for test_model in TestModel.objects.all():
+            self.assertEqual(ModelReview.APPROVED, test_model.review_status)
+
+    @patch.object(TestModel, "monitored_fields", NAME_MONITORED_FIELDS)
+    def test_apply_review(self):
+        """Test saving the outcome of a review to the reviewed object."""
+        mocked_now = datetime(2010, 1, 1, 10, 30, 15, tzinfo=pytz.utc)
+        review = self._make_review(name="Test")
+        test_model = review.content_object
+        test_model.name = "Changed"
+        test_model.save()
+        test_model.refresh_from_db()
+        self.assertEqual("Test", test_model.name)
+
+        review.refresh_from_db()
+        review.review_status = ModelReview.APPROVED
+        review.review_date = mocked_now
+        # only the reviewed fields are written, and moderation is skipped
+        # 1. save the object 2. mark the changes in the sandbox as saved
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                ["name", "review_status", "review_date"],
+                apply_review(review, source=test_model),
+            )
+        test_model.refresh_from_db()
+        self.assertEqual("Changed", test_model.name)
+        self.assertEqual(ModelReview.APPROVED, test_model.review_status)
+        self.assertEqual(mocked_now, test_model.review_date)
+        self.assertEqual([], test_model.get_dirty_monitored_fields())
+        # moderation is not skipped afterwards
+        self.assertFalse(is_moderation_skipped(TestModel))
+
+    def test_apply_review_receivers(self):
+        """Test that objects saved by receivers of the reviewed object are moderated."""
+        created = []
+
+        def create_other(sender, instance, **kwargs):  # pylint: disable=unused-argument
+            if instance.name == "Test":
+                created.append(TestModel.objects.create(name="Other"))
+
+        review = self._make_review(name="Test")
+        review.review_status = ModelReview.APPROVED
+        post_save.connect(create_other, sender=TestModel)
+        try:
+            apply_review(review)
+        finally:
+            post_save.disconnect(create_other, sender=TestModel)
+        self.assertEqual(1, len(created))
+        self.assertTrue(
+            ModelReview.objects.filter(
+                content_type=review.content_type, object_id=created[0].pk
+            ).exists()
+        )
+
+    @patch.object(TestModel, "monitored_fields", NAME_MONITORED_FIELDS)
+    def test_apply_review_unchanged(self):
+        """Test that values in the sandbox that are not changes are not saved."""
+        review = self._make_review(name="A")
+        test_model = review.content_object
+        with skip_moderation(TestModel):
+            test_model.name = "B"
+            test_model.save()
+
+        review.refresh_from_db()
+        self.assertEqual("A", review.get_sandbox()["name"])
+        self.assertEqual(set(), review.get_proposed_fields())
+        review.review_status = ModelReview.APPROVED
+        review.review_date = datetime(2010, 1, 1, tzinfo=pytz.utc)
+        review.save()
+        test_model.refresh_from_db()
+        self.assertEqual("B", test_model.name)
+        self.assertEqual(ModelReview.APPROVED, test_model.review_status)
+
+        # a change that is put back to the saved value is not a change either
+        review = self._make_review(name="C")
+        test_model = review.content_object
+        test_model.name = "D"
+        test_model.save()
+        review.refresh_from_db()
+        self.assertEqual({"name"}, review.get_proposed_fields())
+        test_model.name = "C"
+        test_model.review_status = ModelReview.REJECTED
+        test_model.save()
+        review.refresh_from_db()
+        self.assertEqual({"review_status"}, review.get_proposed_fields())
+
+    @patch.object(TestModel, "monitored_fields", NAME_MONITORED_FIELDS)
+    def test_apply_review_once(self):
+        """Test that the changes are not saved again when the review is saved."""
+        for backend in SANDBOX_BACKENDS:
+            with self.subTest(backend=backend), override_settings(
+                MODELREVIEW_SANDBOX_BACKEND=backend
+            ):
+                review = self._make_review(name="A")
+                test_model = review.content_object
+                test_model.name = "B"
+                test_model.save()
+
+                review.refresh_from_db()
+                review.review_status = ModelReview.APPROVED
+                review.review_date = datetime(2010, 1, 1, tzinfo=pytz.utc)
+                review.save()
+                test_model.refresh_from_db()
+                self.assertEqual("B", test_model.name)
+                self.assertEqual(set(), review.get_proposed_fields())
+
+                TestModel.objects.filter(pk=test_model.pk).update(name="C")
+                review = ModelReview.objects.get(pk=review.pk)
+                self.assertEqual(set(), review.get_proposed_fields())
+                review.save()
+                test_model.refresh_from_db()
+                self.assertEqual("C", test_model.name)
+
+    @patch.object(TestModel, "monitored_fields", NAME_MONITORED_FIELDS)
+    def test_apply_review_rejected(self):
+        """Test that the sandbox is not saved to objects whose review is rejected."""
+        review = self._make_review(name="Test")
+        test_model = review.content_object
+        test_model.name = "Changed"
+        test_model.save()
+
+        review.refresh_from_db()
+        review.review_status = ModelReview.REJECTED
+        review.review_date = datetime(2010, 1, 1, tzinfo=pytz.utc)
+        review.save()
+        test_model.refresh_from_db()
+        self.assertEqual("Test", test_model.name)
+        self.assertEqual(ModelReview.REJECTED, test_model.review_status)
@@ -200,3 +200,71 @@ class TestViews(TestCase):
             self.assertEqual(review.review_status, review.content_object.review_status)
             self.assertEqual(True, reviewer.reviewed)
             self.assertEqual(review.review_status, reviewer.review_status)
+
+    @override_settings(MODELREVIEW_BULK_PAGE_SIZE=5)
+    def test_bulk_reviews_pagination(self):
+        """Test that BulkReviewsView splits the pending reviews into pages."""
+        for _ in range(0, 12):
+            test_model = mommy.make("test_app.TestModel", name="Test")
+            review = ModelReview.objects.get(
+                content_type=ContentType.objects.get_for_model(test_model),
+                object_id=test_model.id,
+            )
+            review.user = self.user
+            review.save()
+            mommy.make("model_reviews.Reviewer", user=self.reviewer, review=review)
+        reviews = list(ModelReview.objects.order_by("created", "pk"))
+
+        self.client.force_login(user=self.reviewer)
+        url = "/bulk"
+        pages = []
+        while url:
+            res = self.client.get(url)
+            self.assertEqual(res.status_code, 200)
+            self.assertEqual(
+                len(res.context["page"].object_list),
+                res.context["formset"].total_form_count(),
+            )
+            pages.append([review.pk for review in res.context["page"].object_list])
+            url = res.context.get("next_page_url")
+        self.assertEqual(
+            [
+                [review.pk for review in reviews[0:5]],
+                [review.pk for review in reviews[5:10]],
+                [review.pk for review in reviews[10:]],
+            ],
+            pages,
+        )
+
+        # review the second page
+        res = self.client.get("/bulk")
+        second_page_url = res.context["next_page_url"]
+        res = self.client.get(second_page_url)
+        page_reviews = res.context["page"].object_list
+        data = {
+            "form-TOTAL_FORMS": 5,
+            "form-INITIAL_FORMS": 0,
+            "form-MIN_NUM_FORMS": 0,
+            "form-MAX_NUM_FORMS": 5,
+        }
+        for idx, review in enumerate(page_reviews):
+            data[f"form-{idx}-review_status"] = ModelReview.APPROVED
+            data[f"form-{idx}-reviewer"] = Reviewer.objects.get(review=review).pk
+            data[f"form-{idx}-review"] = review.pk
+        res = self.client.post(second_page_url, data)
+        self.assertEqual(res.status_code, 302)
+        self.assertEqual(second_page_url, res.url)
+
+        for review in ModelReview.objects.all():
+            if review in page_reviews:
+                self.assertEqual(ModelReview.APPROVED, review.review_status)
+            else:
+                self.assertEqual(ModelReview.PENDING, review.review_status)
+
+        # the reviewed items have left the second page
+        res = self.client.get(second_page_url)
+        self.assertEqual(
+            [review.pk for review in reviews[10:]],
+            [review.pk for review in res.context["page"].object_list],
+        )
+        self.assertNotIn("next_page_url", res.context)